@@ -6,7 +6,10 @@ export async function POST(req: NextRequest) {
     try {
         const body = await req.json();
 
-        const response = await fetch(`${ML_API_URL}/api/predict/engagement`, {
+        // { profiles: [...] } scores a whole batch in one ML call
+        const endpoint = Array.isArray(body.profiles) ? '/api/predict/engagement/batch' : '/api/predict/engagement';
+
+        const response = await fetch(`${ML_API_URL}${endpoint}`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
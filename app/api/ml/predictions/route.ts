@@ -57,48 +57,25 @@ export async function POST(req: NextRequest) {
         // Call ML API for predictions (with graceful fallback)
         const predictions: Record<string, any> = {};
 
+        // One round trip: dropout, streak, recommendations and engine insights together
         try {
-            const dropoutRes = await fetch(`${ML_API_URL}/api/predict-dropout`, {
+            const insightsRes = await fetch(`${ML_API_URL}/api/insights`, {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify(mlProfile),
                 signal: AbortSignal.timeout(5000),
             });
-            if (dropoutRes.ok) {
-                predictions.dropout = await dropoutRes.json();
+            if (insightsRes.ok) {
+                const insights = await insightsRes.json();
+                predictions.dropout = insights.dropout;
+                predictions.streak = insights.streak;
+                predictions.recommendations = insights.recommendations;
+                predictions.insights = insights.insights;
             }
         } catch (e) {
-            console.log('Dropout prediction unavailable (ML service offline)');
+            console.log('Predictions unavailable (ML service offline)');
             predictions.dropout = null;
-        }
-
-        try {
-            const streakRes = await fetch(`${ML_API_URL}/api/predict-streak`, {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify(mlProfile),
-                signal: AbortSignal.timeout(5000),
-            });
-            if (streakRes.ok) {
-                predictions.streak = await streakRes.json();
-            }
-        } catch (e) {
-            console.log('Streak prediction unavailable (ML service offline)');
             predictions.streak = null;
-        }
-
-        try {
-            const recommendRes = await fetch(`${ML_API_URL}/api/recommend-challenge`, {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify(mlProfile),
-                signal: AbortSignal.timeout(5000),
-            });
-            if (recommendRes.ok) {
-                predictions.recommendations = await recommendRes.json();
-            }
-        } catch (e) {
-            console.log('Recommendations unavailable (ML service offline)');
             predictions.recommendations = null;
         }
 
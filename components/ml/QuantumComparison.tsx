@@ -5,11 +5,15 @@ import { useSession } from 'next-auth/react';
 import { Zap, TrendingUp } from 'lucide-react';
 
 interface QuantumPrediction {
-    dropout_probability: number;
-    quantum_component: number;
+    // When the cascade skipped the circuit (inference_path "classical_only") there is
+    // no probability or quantum_component, only the interval the blend lies in
+    dropout_probability?: number;
+    dropout_probability_range?: [number, number];
+    quantum_component?: number;
     classical_component: number;
+    inference_path?: 'hybrid' | 'classical_only';
     risk_level: string;
-    confidence: number;
+    confidence?: number;
     model_type: string;
     quantum_info?: {
         model_type: string;
@@ -28,6 +32,20 @@ interface ClassicalPrediction {
     accuracy: string;
 }
 
+// Low and high dropout probability in percent; equal unless the cascade skipped the circuit
+function probabilityRange(prediction: QuantumPrediction | ClassicalPrediction): [number, number] {
+    if (prediction.dropout_probability != null) {
+        return [prediction.dropout_probability * 100, prediction.dropout_probability * 100];
+    }
+    const [low, high] = (prediction as QuantumPrediction).dropout_probability_range ?? [0, 0];
+    return [low * 100, high * 100];
+}
+
+function formatProbability(prediction: QuantumPrediction | ClassicalPrediction): string {
+    const [low, high] = probabilityRange(prediction);
+    return low === high ? `${low.toFixed(1)}%` : `${low.toFixed(1)}–${high.toFixed(1)}%`;
+}
+
 interface ComparisonData {
     classical: ClassicalPrediction;
     quantum: QuantumPrediction;
@@ -133,7 +151,7 @@ export default function QuantumComparison({ userId }: { userId: string }) {
     }
 
     const activePrediction = useQuantum ? comparison.quantum : comparison.classical;
-    const activeProb = activePrediction.dropout_probability * 100;
+    const [activeLow, activeHigh] = probabilityRange(activePrediction);
 
     return (
         <div className="space-y-6">
@@ -186,7 +204,7 @@ export default function QuantumComparison({ userId }: { userId: string }) {
                         <div>
                             <div className="flex items-baseline gap-2 mb-1">
                                 <h3 className="text-4xl font-bold text-white">
-                                    {activeProb.toFixed(1)}%
+                                    {formatProbability(activePrediction)}
                                 </h3>
                                 <span className="text-lg text-slate-300">dropout risk</span>
                             </div>
@@ -215,14 +233,16 @@ export default function QuantumComparison({ userId }: { userId: string }) {
                                     ? 'bg-gradient-to-r from-amber-400 via-orange-500 to-yellow-500'
                                     : 'bg-gradient-to-r from-emerald-400 via-green-500 to-teal-500'
                             }`}
-                            style={{ width: `${activeProb}%` }}
+                            style={activeLow === activeHigh
+                                ? { width: `${activeHigh}%` }
+                                : { left: `${activeLow}%`, width: `${activeHigh - activeLow}%` }}
                         >
                             <div className="absolute inset-0 bg-gradient-to-r from-transparent via-white/40 to-transparent animate-pulse"></div>
                         </div>
                     </div>
 
                     {/* Quantum Components Breakdown */}
-                    {useQuantum && comparison.quantum.quantum_component !== undefined && (
+                    {useQuantum && comparison.quantum.classical_component != null && (
                         <div className="grid grid-cols-2 gap-4 pt-4 border-t border-slate-500/30">
                             <div className="bg-gradient-to-br from-cyan-500/20 to-blue-600/20 rounded-lg p-3 border border-cyan-400/40 shadow-lg shadow-cyan-500/20">
                                 <div className="flex items-center gap-2 mb-2">
@@ -230,7 +250,9 @@ export default function QuantumComparison({ userId }: { userId: string }) {
                                     <span className="text-xs font-semibold text-cyan-300 uppercase tracking-wide">Quantum</span>
                                 </div>
                                 <p className="text-2xl font-bold bg-gradient-to-r from-cyan-300 to-blue-300 bg-clip-text text-transparent">
-                                    {(comparison.quantum.quantum_component * 100).toFixed(1)}%
+                                    {comparison.quantum.quantum_component != null
+                                        ? `${(comparison.quantum.quantum_component * 100).toFixed(1)}%`
+                                        : 'Skipped'}
                                 </p>
                             </div>
                             <div className="bg-gradient-to-br from-indigo-500/20 to-purple-600/20 rounded-lg p-3 border border-indigo-400/40 shadow-lg shadow-indigo-500/20">
@@ -398,7 +420,7 @@ export default function QuantumComparison({ userId }: { userId: string }) {
                                     ? 'text-white drop-shadow-[0_0_15px_rgba(6,182,212,0.5)]' 
                                     : 'text-slate-400 group-hover:text-cyan-400'
                             }`}>
-                                {(comparison.quantum.dropout_probability * 100).toFixed(1)}%
+                                {formatProbability(comparison.quantum)}
                             </p>
                             <p className={`text-sm font-medium uppercase tracking-wide ${
                                 useQuantum ? 'text-cyan-300' : 'text-slate-500'
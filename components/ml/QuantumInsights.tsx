@@ -72,8 +72,12 @@ export default function QuantumInsights({ userProfile }: QuantumInsightsProps) {
     }
 
     const { classical, quantum, recommendation } = comparison;
-    const quantumConfidence = Math.abs(quantum.probability - 0.5) * 2;
-    const classicalConfidence = Math.abs(classical.probability - 0.5) * 2;
+    const classicalConfidence = Math.abs(classical.dropout_probability - 0.5) * 2;
+    // A cascade-skipped circuit leaves only the interval the hybrid probability lies in
+    const [quantumLow, quantumHigh] = quantum.dropout_probability != null
+        ? [quantum.dropout_probability, quantum.dropout_probability]
+        : quantum.dropout_probability_range;
+    const quantumSkipped = quantum.dropout_probability == null;
 
     return (
         <div className="bg-gradient-to-br from-purple-600 to-indigo-700 rounded-2xl p-6 text-white">
@@ -90,8 +94,17 @@ export default function QuantumInsights({ userProfile }: QuantumInsightsProps) {
                 <div className="grid grid-cols-2 gap-4">
                     <div>
                         <p className="text-purple-200 text-xs mb-1">Quantum Component</p>
-                        <p className="text-2xl font-bold">{(quantum.quantum_component * 100).toFixed(1)}%</p>
-                        <p className="text-xs text-purple-200 mt-1">4 qubits, 36 parameters</p>
+                        {quantum.quantum_component != null ? (
+                            <>
+                                <p className="text-2xl font-bold">{(quantum.quantum_component * 100).toFixed(1)}%</p>
+                                <p className="text-xs text-purple-200 mt-1">4 qubits, 36 parameters</p>
+                            </>
+                        ) : (
+                            <>
+                                <p className="text-2xl font-bold">Skipped</p>
+                                <p className="text-xs text-purple-200 mt-1">Classical score already fixes the risk level</p>
+                            </>
+                        )}
                     </div>
                     <div>
                         <p className="text-purple-200 text-xs mb-1">Classical Component</p>
@@ -106,12 +119,12 @@ export default function QuantumInsights({ userProfile }: QuantumInsightsProps) {
                 <div className="bg-white/10 backdrop-blur-sm rounded-lg p-3">
                     <div className="flex items-center justify-between mb-2">
                         <span className="text-sm font-medium">Classical Model</span>
-                        <span className="text-lg font-bold">{(classical.probability * 100).toFixed(1)}%</span>
+                        <span className="text-lg font-bold">{(classical.dropout_probability * 100).toFixed(1)}%</span>
                     </div>
                     <div className="w-full bg-white/20 rounded-full h-2">
                         <div
                             className="bg-white rounded-full h-2 transition-all"
-                            style={{ width: `${classical.probability * 100}%` }}
+                            style={{ width: `${classical.dropout_probability * 100}%` }}
                         ></div>
                     </div>
                     <p className="text-xs text-purple-200 mt-1">
@@ -125,23 +138,41 @@ export default function QuantumInsights({ userProfile }: QuantumInsightsProps) {
                             <Zap className="w-4 h-4" />
                             Quantum-Hybrid
                         </span>
-                        <span className="text-lg font-bold">{(quantum.probability * 100).toFixed(1)}%</span>
+                        <span className="text-lg font-bold">
+                            {quantumSkipped
+                                ? `${(quantumLow * 100).toFixed(1)}–${(quantumHigh * 100).toFixed(1)}%`
+                                : `${(quantumHigh * 100).toFixed(1)}%`}
+                        </span>
                     </div>
-                    <div className="w-full bg-white/20 rounded-full h-2">
+                    <div className="relative w-full bg-white/20 rounded-full h-2">
                         <div
-                            className="bg-gradient-to-r from-yellow-300 to-purple-300 rounded-full h-2 transition-all"
-                            style={{ width: `${quantum.probability * 100}%` }}
+                            className="absolute bg-gradient-to-r from-yellow-300 to-purple-300 rounded-full h-2 transition-all"
+                            style={quantumSkipped
+                                ? { left: `${quantumLow * 100}%`, width: `${(quantumHigh - quantumLow) * 100}%` }
+                                : { width: `${quantumHigh * 100}%` }}
                         ></div>
                     </div>
                     <p className="text-xs text-purple-200 mt-1">
-                        Hybrid • Confidence: {(quantumConfidence * 100).toFixed(0)}%
+                        {quantumSkipped
+                            ? `Risk: ${quantum.risk_level} • Quantum circuit skipped`
+                            : `Hybrid • Confidence: ${(Math.abs(quantumHigh - 0.5) * 2 * 100).toFixed(0)}%`}
                     </p>
                 </div>
             </div>
 
             {/* Recommendation */}
             <div className="mt-4 flex items-start gap-2 bg-white/10 backdrop-blur-sm rounded-lg p-3">
-                {recommendation === 'Use quantum' ? (
+                {recommendation === 'Quantum skipped' ? (
+                    <>
+                        <Activity className="w-5 h-5 text-blue-300 mt-0.5 flex-shrink-0" />
+                        <div>
+                            <p className="font-medium text-sm">Quantum Circuit Skipped</p>
+                            <p className="text-xs text-purple-200 mt-1">
+                                The classical score already fixes the risk level, so there is nothing to compare
+                            </p>
+                        </div>
+                    </>
+                ) : recommendation === 'Use quantum' ? (
                     <>
                         <CheckCircle2 className="w-5 h-5 text-green-300 mt-0.5 flex-shrink-0" />
                         <div>
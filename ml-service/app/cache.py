@@ -0,0 +1,140 @@
+"""
+Prediction Cache
+Per-user LRU + TTL cache for model responses
+
+Dashboard refreshes send the same profile over and over. Responses are cached
+under a hash of the canonicalized request payload plus the version of the
+model that produced them, so a retrained artifact never serves stale results.
+Each endpoint family gets its own namespace with its own capacity and counters.
+"""
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+CACHE_NAMESPACES = ("dropout", "streak", "recommend", "quantum", "insights", "engagement")
+
+
+def canonical_key(payload: Dict, model_version: str = "") -> str:
+    """Stable hash of a request payload, independent of key order"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{model_version}|{canonical}".encode()).hexdigest()
+
+
+class LRUTTLCache:
+    """Bounded mapping that evicts the least recently used entry and expires old ones"""
+
+    def __init__(self, capacity: int = 1024, ttl: float = 300.0):
+        """
+        Args:
+            capacity: Maximum number of entries (0 disables caching)
+            ttl: Seconds an entry stays valid (0 or less means no expiry)
+        """
+        self.capacity = capacity
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if self.ttl > 0 and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # Callers may mutate the response, never hand out the cached object
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any):
+        if self.capacity <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+class PredictionCache:
+    """One LRUTTLCache per namespace (dropout, streak, recommend, quantum, insights, engagement)"""
+
+    def __init__(self, capacity: int = 1024, ttl: float = 300.0, enabled: bool = True,
+                 namespaces: Iterable[str] = CACHE_NAMESPACES):
+        self.enabled = enabled
+        self.namespaces = {name: LRUTTLCache(capacity, ttl) for name in namespaces}
+
+    def _namespace(self, namespace: str) -> LRUTTLCache:
+        if namespace not in self.namespaces:
+            raise KeyError(f"Unknown cache namespace '{namespace}'")
+        return self.namespaces[namespace]
+
+    def get(self, namespace: str, payload: Dict, model_version: str = "") -> Optional[Any]:
+        if not self.enabled:
+            return None
+        return self._namespace(namespace).get(canonical_key(payload, model_version))
+
+    def put(self, namespace: str, payload: Dict, value: Any, model_version: str = ""):
+        if self.enabled:
+            self._namespace(namespace).put(canonical_key(payload, model_version), value)
+
+    def clear(self, namespace: Optional[str] = None):
+        for name, cache in self.namespaces.items():
+            if namespace is None or name == namespace:
+                cache.clear()
+
+    def stats(self) -> Dict:
+        return {
+            "enabled": self.enabled,
+            "namespaces": {name: cache.stats() for name, cache in self.namespaces.items()}
+        }
+
+
+def create_cache_from_env() -> PredictionCache:
+    """
+    Build the service cache.
+
+    ML_CACHE=0 disables it, ML_CACHE_SIZE sets the entries per namespace
+    (default 1024) and ML_CACHE_TTL the lifetime in seconds (default 300).
+    """
+    return PredictionCache(
+        capacity=int(os.getenv("ML_CACHE_SIZE", "1024")),
+        ttl=float(os.getenv("ML_CACHE_TTL", "300")),
+        enabled=os.getenv("ML_CACHE", "1").lower() in ("1", "true", "yes")
+    )
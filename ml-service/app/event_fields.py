@@ -0,0 +1,32 @@
+"""
+Event Fields
+Parsing of raw event-log cells (activities.csv, social.csv, challenges.csv)
+
+Shared by the feature store and the streaming temporal features, so both
+read dates, numbers and flags from CSV rows or JSON events the same way.
+"""
+import math
+from datetime import date
+from typing import Optional
+
+
+def parse_day(value) -> int:
+    """Day ordinal of a date, datetime or ISO string"""
+    if isinstance(value, date):
+        return value.toordinal()
+    return date.fromisoformat(str(value)[:10]).toordinal()
+
+
+def parse_number(value) -> Optional[float]:
+    """Float value of a CSV cell, None when missing"""
+    if value is None or value == "":
+        return None
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def parse_flag(value) -> bool:
+    """Boolean value of a CSV cell ("true"/"1"/"yes", NaN is False)"""
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes")
+    return bool(value) and not (isinstance(value, float) and math.isnan(value))
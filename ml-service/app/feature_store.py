@@ -0,0 +1,308 @@
+"""
+Feature Store
+Per-user aggregates maintained incrementally from raw event logs
+
+Ingests rows shaped like activities.csv, social.csv and challenges.csv and
+keeps, for every user:
+
+- lifetime totals (the features the models were trained on: days_active,
+  total_days, meditation_streak, avg_sleep, completion_rate, total_points, ...)
+- rolling 7-day and 30-day sums, kept as day buckets in two deques with
+  running totals, so an in-order event costs O(1) amortized
+- streaming temporal features (slope, 3-day decline, trends, momentum; see
+  app/temporal_features.py), updated as each activity day arrives
+- a materialized feature row, rebuilt only when the user changed
+
+Prediction endpoints read that row by user_id instead of estimating the
+history from a handful of request fields. Windows are anchored on the user's
+latest event day. Activity rows are one per user-day and must arrive in date
+order; a replayed or late day is dropped from every aggregate (totals, windows,
+streaks and temporal features alike) and counted in late_activities.
+"""
+import threading
+import time
+import logging
+from collections import deque
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from app.event_fields import parse_day, parse_flag, parse_number
+from app.temporal_features import TemporalFeatureState
+
+logger = logging.getLogger(__name__)
+
+ROLLING_WINDOWS = (7, 30)
+
+# Per-day bucket layout
+DAY_METRICS = [
+    "steps", "steps_logged",
+    "meditation_minutes", "meditation_logged",
+    "sleep_hours", "sleep_logged",
+    "exercise_minutes",
+    "activity_days", "goal_completed",
+    "social_interactions",
+    "challenges_started", "challenges_completed", "points_earned",
+]
+_M = {name: i for i, name in enumerate(DAY_METRICS)}
+
+# Feature order of the dropout/streak predictors (see DropoutPredictor._create_feature_vector)
+MODEL_FEATURES = [
+    "days_active", "total_days", "avg_steps", "meditation_streak", "avg_meditation", "avg_sleep",
+    "completion_rate", "total_points", "social_score", "social_interactions", "notification_response",
+    "mood_correlation",
+]
+
+# Not observable in the event logs; same defaults as the predictors
+DEFAULT_FEATURES = {"notification_response": 0.5, "mood_correlation": 0.5}
+
+
+def feature_vector(row: Dict) -> List[float]:
+    """Predictor input vector (MODEL_FEATURES order) from a materialized row"""
+    return [row.get(name, DEFAULT_FEATURES.get(name, 0.0)) for name in MODEL_FEATURES]
+
+
+class UserFeatureState:
+    """Running aggregates for one user"""
+
+    __slots__ = (
+        "last_day", "windows", "window_sums",
+        "totals", "current_streak", "max_streak", "last_goal_day", "last_activity_day",
+        "temporal", "row", "dirty",
+    )
+
+    def __init__(self):
+        self.last_day: Optional[int] = None
+        # Day buckets [day, values] shared between the windows, newest on the right
+        self.windows = {w: deque() for w in ROLLING_WINDOWS}
+        self.window_sums = {w: np.zeros(len(DAY_METRICS)) for w in ROLLING_WINDOWS}
+        self.totals = np.zeros(len(DAY_METRICS))
+        self.current_streak = 0
+        self.max_streak = 0
+        self.last_goal_day: Optional[int] = None
+        self.last_activity_day: Optional[int] = None
+        self.temporal = TemporalFeatureState()
+        self.row: Optional[Dict] = None
+        self.dirty = True
+
+    def _advance(self, day: int):
+        """Move the window anchor to a newer day and evict expired buckets"""
+        self.last_day = day
+        for w, window in self.windows.items():
+            sums = self.window_sums[w]
+            while window and window[0][0] <= day - w:
+                sums -= window.popleft()[1]
+
+    def _bucket(self, window: deque, day: int) -> Optional[list]:
+        for bucket in reversed(window):
+            if bucket[0] == day:
+                return bucket
+            if bucket[0] < day:
+                return None
+        return None
+
+    def add(self, day: int, values: np.ndarray):
+        """Add one event's per-day values"""
+        self.totals += values
+        self.dirty = True
+
+        if self.last_day is None or day > self.last_day:
+            self._advance(day)
+        longest = max(ROLLING_WINDOWS)
+        if day <= self.last_day - longest:
+            # Too old for any window, lifetime totals only
+            return
+
+        bucket = self._bucket(self.windows[longest], day)
+        if bucket is None:
+            bucket = [day, np.zeros(len(DAY_METRICS))]
+            for w, window in self.windows.items():
+                if day > self.last_day - w:
+                    if not window or window[-1][0] < day:
+                        window.append(bucket)
+                    else:
+                        # Late event for a day with no bucket yet: keep the deque sorted
+                        position = next(i for i, b in enumerate(window) if b[0] > day)
+                        window.insert(position, bucket)
+        bucket[1] += values
+        for w in ROLLING_WINDOWS:
+            if day > self.last_day - w:
+                self.window_sums[w] += values
+
+    def record_goal(self, day: int, completed: bool):
+        """Update the consecutive goal-completed day streak"""
+        if self.last_activity_day is None or day > self.last_activity_day:
+            self.last_activity_day = day
+        if not completed or (self.last_goal_day is not None and day <= self.last_goal_day):
+            return
+        if self.last_goal_day is not None and day == self.last_goal_day + 1:
+            self.current_streak += 1
+        else:
+            self.current_streak = 1
+        self.last_goal_day = day
+        self.max_streak = max(self.max_streak, self.current_streak)
+
+    def materialize(self, user_id: str) -> Dict:
+        """Feature row in the service's feature vocabulary"""
+        t = self.totals
+
+        def ratio(num, den):
+            return float(num / den) if den else 0.0
+
+        last7 = self.window_sums[7]
+        row = {
+            "user_id": user_id,
+            # Lifetime features, as computed for training
+            "days_active": int(t[_M["goal_completed"]]),
+            "total_days": int(t[_M["activity_days"]]),
+            "avg_steps": ratio(last7[_M["steps"]], last7[_M["steps_logged"]]),
+            "meditation_streak": int(self.max_streak),
+            "current_streak": int(self.current_streak if self.last_goal_day == self.last_activity_day else 0),
+            "avg_meditation": ratio(t[_M["meditation_minutes"]], t[_M["meditation_logged"]]),
+            "avg_sleep": ratio(t[_M["sleep_hours"]], t[_M["sleep_logged"]]),
+            "completion_rate": ratio(t[_M["challenges_completed"]], t[_M["challenges_started"]]),
+            "total_points": int(t[_M["points_earned"]]),
+            "social_score": min(1.0, float(t[_M["social_interactions"]]) / 100.0),
+            "social_interactions": int(t[_M["social_interactions"]]),
+            "last_event_date": date.fromordinal(self.last_day).isoformat() if self.last_day else None,
+        }
+        for w in ROLLING_WINDOWS:
+            s = self.window_sums[w]
+            row.update({
+                f"steps_mean_{w}d": ratio(s[_M["steps"]], s[_M["steps_logged"]]),
+                f"meditation_mean_{w}d": ratio(s[_M["meditation_minutes"]], s[_M["meditation_logged"]]),
+                f"sleep_mean_{w}d": ratio(s[_M["sleep_hours"]], s[_M["sleep_logged"]]),
+                f"exercise_minutes_{w}d": float(s[_M["exercise_minutes"]]),
+                f"active_days_{w}d": int(s[_M["activity_days"]]),
+                f"goal_rate_{w}d": ratio(s[_M["goal_completed"]], s[_M["activity_days"]]),
+                f"social_interactions_{w}d": int(s[_M["social_interactions"]]),
+                f"challenges_completed_{w}d": int(s[_M["challenges_completed"]]),
+                f"points_{w}d": int(s[_M["points_earned"]]),
+            })
+        row.update(self.temporal.features())
+        self.row = row
+        self.dirty = False
+        return row
+
+
+class FeatureStore:
+    """In-memory per-user feature store fed by activity, social and challenge events"""
+
+    def __init__(self):
+        self._users: Dict[str, UserFeatureState] = {}
+        self._lock = threading.Lock()
+        self.events_ingested = {"activities": 0, "social": 0, "challenges": 0}
+        self.late_activities = 0
+        self.last_ingest: Optional[float] = None
+
+    def _state(self, user_id: str) -> UserFeatureState:
+        state = self._users.get(user_id)
+        if state is None:
+            state = self._users[user_id] = UserFeatureState()
+        return state
+
+    def ingest_activity(self, event: Dict):
+        """One activities.csv row: user_id, date, steps, meditation_minutes, sleep_hours, ..."""
+        values = np.zeros(len(DAY_METRICS))
+        for metric, logged in (("steps", "steps_logged"), ("meditation_minutes", "meditation_logged"),
+                               ("sleep_hours", "sleep_logged")):
+            value = parse_number(event.get(metric))
+            if value is not None:
+                values[_M[metric]] = value
+                values[_M[logged]] = 1
+        values[_M["exercise_minutes"]] = parse_number(event.get("exercise_minutes")) or 0.0
+        values[_M["activity_days"]] = 1
+        completed = parse_flag(event.get("completed_daily_goal", False))
+        values[_M["goal_completed"]] = float(completed)
+
+        day = parse_day(event["date"])
+        state = self._state(str(event["user_id"]))
+        self.events_ingested["activities"] += 1
+        # The temporal state decides once whether the day is new; a replayed or
+        # late day must not reach the totals and windows either
+        if not state.temporal.update(day, parse_number(event.get("engagement_score")),
+                                     parse_number(event.get("steps")), completed):
+            self.late_activities += 1
+            return
+        state.add(day, values)
+        state.record_goal(day, completed)
+
+    def ingest_social(self, event: Dict):
+        """One social.csv row: user_id, interaction_type, date"""
+        values = np.zeros(len(DAY_METRICS))
+        values[_M["social_interactions"]] = 1
+        self._state(str(event["user_id"])).add(parse_day(event["date"]), values)
+        self.events_ingested["social"] += 1
+
+    def ingest_challenge(self, event: Dict):
+        """One challenges.csv row: user_id, challenge_name, category, difficulty, start_date, completed, points_earned"""
+        values = np.zeros(len(DAY_METRICS))
+        values[_M["challenges_started"]] = 1
+        values[_M["challenges_completed"]] = float(parse_flag(event.get("completed", False)))
+        values[_M["points_earned"]] = parse_number(event.get("points_earned")) or 0.0
+        self._state(str(event["user_id"])).add(parse_day(event.get("start_date") or event["date"]), values)
+        self.events_ingested["challenges"] += 1
+
+    def ingest(self, activities: Iterable[Dict] = (), social: Iterable[Dict] = (),
+               challenges: Iterable[Dict] = ()) -> Dict[str, int]:
+        """
+        Ingest a batch of events of each kind
+
+        Returns:
+            Number of events ingested per kind
+        """
+        counts = {"activities": 0, "social": 0, "challenges": 0}
+        with self._lock:
+            for kind, events, handler in (("activities", activities, self.ingest_activity),
+                                          ("social", social, self.ingest_social),
+                                          ("challenges", challenges, self.ingest_challenge)):
+                for event in events:
+                    handler(event)
+                    counts[kind] += 1
+            self.last_ingest = time.time()
+        return counts
+
+    def ingest_csv(self, activities_path: Optional[str] = None, social_path: Optional[str] = None,
+                   challenges_path: Optional[str] = None) -> Dict[str, int]:
+        """Bootstrap from the CSV exports (rows are ingested in date order)"""
+        import pandas as pd
+
+        def rows(path, date_column):
+            if not path:
+                return []
+            df = pd.read_csv(path).sort_values(date_column, kind="stable")
+            return df.to_dict("records")
+
+        counts = self.ingest(
+            activities=rows(activities_path, "date"),
+            social=rows(social_path, "date"),
+            challenges=rows(challenges_path, "start_date"),
+        )
+        logger.info(f"✓ Feature store loaded {counts} for {len(self._users)} users")
+        return counts
+
+    def get_features(self, user_id: str) -> Optional[Dict]:
+        """Materialized feature row, or None for an unknown user"""
+        state = self._users.get(user_id)
+        if state is None:
+            return None
+        if state.dirty:
+            with self._lock:
+                if state.dirty:
+                    state.materialize(user_id)
+        return dict(state.row)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._users
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def stats(self) -> Dict:
+        return {
+            "users": len(self._users),
+            "events_ingested": dict(self.events_ingested),
+            "late_activities": self.late_activities,
+            "last_ingest": self.last_ingest,
+        }
@@ -0,0 +1,272 @@
+"""
+Inference Executor
+Runs blocking sklearn / PennyLane model calls off the asyncio event loop.
+
+Models are registered on a named lane. Each lane owns its own pool, so a slow
+quantum simulation only queues behind other quantum work and never holds up
+classical predictions.
+"""
+import asyncio
+import multiprocessing
+import os
+import time
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from app.models.registry import ModelUnavailableError
+
+logger = logging.getLogger(__name__)
+
+LANE_KINDS = ("thread", "process")
+
+# Models living inside a process-pool worker, built once by the initializer
+_WORKER_MODELS: Dict[str, Any] = {}
+_WORKER_ERRORS: Dict[str, str] = {}
+
+
+def _init_worker(factories: Dict[str, Callable[[], Any]]):
+    """Build every model of a process lane once per worker process."""
+    for name, factory in factories.items():
+        try:
+            _WORKER_MODELS[name] = factory()
+        except Exception as e:
+            # Raising here would break the whole pool; report per call instead
+            _WORKER_ERRORS[name] = str(e)
+
+
+def _call_worker_model(name: str, method: str, args: tuple, kwargs: dict):
+    """Entry point executed inside a process-pool worker."""
+    if name not in _WORKER_MODELS:
+        raise ModelUnavailableError(f"Model '{name}' failed to load: {_WORKER_ERRORS.get(name)}")
+    return getattr(_WORKER_MODELS[name], method)(*args, **kwargs)
+
+
+def _worker_has_model(name: str) -> bool:
+    return name in _WORKER_MODELS
+
+
+def _call_model(factory: Callable[[], Any], method: str, args: tuple, kwargs: dict):
+    """Entry point executed inside a thread-pool worker."""
+    return getattr(factory(), method)(*args, **kwargs)
+
+
+def _load_model(factory: Callable[[], Any]) -> bool:
+    try:
+        factory()
+        return True
+    except ModelUnavailableError:
+        return False
+
+
+class InferenceLane:
+    """A pool of workers plus the counters reported by /api/metrics"""
+
+    def __init__(self, name: str, kind: str = "thread", max_workers: int = 2):
+        if kind not in LANE_KINDS:
+            raise ValueError(f"Unknown executor kind '{kind}' for lane '{name}' (expected one of {LANE_KINDS})")
+
+        self.name = name
+        self.kind = kind
+        self.max_workers = max(1, int(max_workers))
+        self.factories: Dict[str, Callable[[], Any]] = {}
+        self._pool: Optional[Executor] = None
+
+        # Metrics (only touched from the event loop thread)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def pool(self) -> Executor:
+        """Create the pool on first use so process workers see every registered factory."""
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(dict(self.factories),)
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"inference-{self.name}"
+                )
+            logger.info(f"✅ Inference lane '{self.name}' started ({self.kind} pool, {self.max_workers} workers)")
+        return self._pool
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting for a free worker."""
+        return max(0, self.in_flight - self.max_workers)
+
+    def stats(self) -> Dict:
+        finished = self.completed + self.failed
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "started": self._pool is not None,
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_latency_ms": round(self.total_latency / finished * 1000, 3) if finished else 0.0,
+            "max_latency_ms": round(self.max_latency * 1000, 3)
+        }
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+class InferenceExecutor:
+    """
+    Routes model calls to the lane they were registered on.
+
+    Every model is described by a zero-argument factory. Thread lanes call it
+    inside the worker thread (typically a lazy registry lookup), so loading
+    never blocks the event loop. Process lanes call it once per worker process,
+    so only the method name and arguments cross the process boundary.
+    """
+
+    def __init__(self):
+        self.lanes: Dict[str, InferenceLane] = {}
+        self._models: Dict[str, tuple] = {}
+
+    def add_lane(self, name: str, kind: str = "thread", max_workers: int = 2) -> InferenceLane:
+        lane = InferenceLane(name, kind=kind, max_workers=max_workers)
+        self.lanes[name] = lane
+        return lane
+
+    def register_model(self, name: str, factory: Callable[[], Any], lane: str):
+        """
+        Register a model on a lane.
+
+        Args:
+            name: Key used by run()
+            factory: Zero-argument callable returning the model; must be
+                     picklable for process lanes
+            lane: Lane name
+        """
+        target = self.lanes[lane]
+        if target.kind == "process":
+            if target._pool is not None:
+                raise RuntimeError(f"Lane '{lane}' already started; register models before first use")
+            target.factories[name] = factory
+        self._models[name] = (factory, target)
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._models
+
+    async def run(self, name: str, method: str, *args, **kwargs) -> Any:
+        """Call `method` on model `name` in its lane's pool and await the result."""
+        if name not in self._models:
+            raise RuntimeError(f"Model '{name}' is not loaded")
+
+        factory, lane = self._models[name]
+        if lane.kind == "process":
+            try:
+                future = lane.pool.submit(_call_worker_model, name, method, args, kwargs)
+            except BrokenProcessPool:
+                lane.shutdown()
+                future = lane.pool.submit(_call_worker_model, name, method, args, kwargs)
+        else:
+            future = lane.pool.submit(_call_model, factory, method, args, kwargs)
+
+        lane.submitted += 1
+        lane.in_flight += 1
+        lane.peak_in_flight = max(lane.peak_in_flight, lane.in_flight)
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wrap_future(future)
+            lane.completed += 1
+            return result
+        except BrokenProcessPool:
+            # A crashed worker poisons the whole pool; rebuild it on the next call
+            lane.failed += 1
+            logger.error(f"Inference lane '{lane.name}' lost a worker process, restarting pool")
+            lane.shutdown()
+            raise
+        except Exception:
+            lane.failed += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            lane.in_flight -= 1
+            lane.total_latency += elapsed
+            lane.max_latency = max(lane.max_latency, elapsed)
+
+    async def warm_up(self, names: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+        """
+        Load models inside their lanes ahead of traffic.
+
+        Returns whether each model is available. Process lanes start their
+        workers, which build every model of the lane in the initializer.
+        """
+        results = {}
+        for name in (names if names is not None else list(self._models)):
+            if name not in self._models:
+                results[name] = False
+                continue
+            factory, lane = self._models[name]
+            if lane.kind == "process":
+                future = lane.pool.submit(_worker_has_model, name)
+            else:
+                future = lane.pool.submit(_load_model, factory)
+            try:
+                results[name] = await asyncio.wrap_future(future)
+            except Exception as e:
+                logger.warning(f"⚠️  Warm-up of '{name}' failed: {e}")
+                results[name] = False
+        return results
+
+    async def is_available(self, name: str) -> bool:
+        """
+        Probe whether a model loads in its own lane.
+
+        Process-lane models are built inside the workers, so the parent's
+        registry never sees them load or fail; this asks the lane instead. The
+        probe queues behind the lane's work, so record its result rather than
+        calling it per request.
+        """
+        return (await self.warm_up([name]))[name]
+
+    def stats(self) -> Dict:
+        return {
+            "lanes": {name: lane.stats() for name, lane in self.lanes.items()},
+            "models": {name: lane.name for name, (_, lane) in self._models.items()}
+        }
+
+    def shutdown(self):
+        for lane in self.lanes.values():
+            lane.shutdown()
+
+
+def create_executor_from_env() -> InferenceExecutor:
+    """
+    Build the service executor from environment variables:
+
+        ML_CLASSICAL_EXECUTOR / ML_CLASSICAL_WORKERS  (default: thread, 4)
+        ML_QUANTUM_EXECUTOR   / ML_QUANTUM_WORKERS    (default: process, 1)
+    """
+    executor = InferenceExecutor()
+    executor.add_lane(
+        "classical",
+        kind=os.getenv("ML_CLASSICAL_EXECUTOR", "thread"),
+        max_workers=int(os.getenv("ML_CLASSICAL_WORKERS", 4))
+    )
+    executor.add_lane(
+        "quantum",
+        kind=os.getenv("ML_QUANTUM_EXECUTOR", "process"),
+        max_workers=int(os.getenv("ML_QUANTUM_WORKERS", 1))
+    )
+    return executor
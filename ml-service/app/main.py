@@ -1,21 +1,21 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Dict, Optional
+from pydantic import BaseModel, ValidationError
+from typing import Any, List, Dict, Optional
+from functools import partial
+import asyncio
+import os
+import time
 import uvicorn
 import logging
 
-# Import our ML models
-from app.models.recommender import ChallengeRecommender
-from app.models.predictor import DropoutPredictor, StreakPredictor
+# Import our ML models (predictors are constructed lazily by the registry)
 from app.models.personalizer import MotivationGenerator, DifficultyCalibrator
-
-# Import Quantum ML models
-try:
-    from app.quantum.hybrid_model import QuantumEnhancedDropoutPredictor
-except ImportError:
-    QuantumEnhancedDropoutPredictor = None
-    logging.warning("Quantum modules could not be imported. Running in classical-only mode.")
+from app.models.registry import model_registry, get_model, ModelUnavailableError
+from app.inference import create_executor_from_env
+from app.cache import create_cache_from_env
+from app.feature_store import FeatureStore
+from app.temporal_features import TEMPORAL_FEATURES
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -32,33 +32,121 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize ML models
-try:
-    challenge_recommender = ChallengeRecommender()
-    dropout_predictor = DropoutPredictor()
-    streak_predictor = StreakPredictor()
-    motivation_generator = MotivationGenerator()
-    difficulty_calibrator = DifficultyCalibrator()
-    logger.info("✅ ML models initialized successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize ML models: {e}")
-    # Initialize with None to allow app to start
-    challenge_recommender = None
-    dropout_predictor = None
-    streak_predictor = None
-    motivation_generator = None
-    difficulty_calibrator = None
-
-# Initialize Quantum ML models
-try:
-    if QuantumEnhancedDropoutPredictor:
-        quantum_dropout_predictor = QuantumEnhancedDropoutPredictor(n_qubits=4)
-        logger.info("✅ Quantum ML models initialized")
+# Rule-based personalizers are cheap and stay eager
+motivation_generator = MotivationGenerator()
+difficulty_calibrator = DifficultyCalibrator()
+
+# Route all model inference through worker pools so the event loop stays free.
+# Each model is built on first use (or during warm-up) via the shared registry.
+inference_executor = create_executor_from_env()
+inference_executor.register_model("recommender", partial(get_model, "recommender"), lane="classical")
+inference_executor.register_model("dropout", partial(get_model, "dropout"), lane="classical")
+inference_executor.register_model("streak", partial(get_model, "streak"), lane="classical")
+inference_executor.register_model("motivation_engine", partial(get_model, "motivation_engine"), lane="classical")
+inference_executor.register_model("quantum_dropout", partial(get_model, "quantum_dropout"), lane="quantum")
+
+# Repeated dashboard loads send identical profiles; serve them from memory.
+# Keys include the model version, so redeployed artifacts start a fresh cache.
+prediction_cache = create_cache_from_env()
+CACHE_MODELS = {
+    "dropout": "dropout", "streak": "streak", "recommend": "recommender",
+    "quantum": "quantum_dropout", "insights": "motivation_engine", "engagement": "motivation_engine"
+}
+
+def cache_version(namespace: str) -> str:
+    return model_registry.model_version(CACHE_MODELS[namespace])
+
+async def cached_run(namespace: str, profile, model: str, method: str, **kwargs):
+    """Run a model method unless a response for this exact profile (or feature row) is cached"""
+    payload = profile if isinstance(profile, dict) else profile.dict()
+    version = cache_version(namespace)
+    cached = prediction_cache.get(namespace, payload, version)
+    if cached is not None:
+        return cached
+    result = await inference_executor.run(model, method, **kwargs)
+    # Don't pin a degraded response for the whole TTL (the dropout and streak
+    # predictors and the AI engine mark theirs with status "fallback", also
+    # inside the insights sections)
+    if not _is_fallback(result):
+        prediction_cache.put(namespace, payload, result, version)
+    return result
+
+def _is_fallback(result) -> bool:
+    if not isinstance(result, dict):
+        return False
+    sections = result.get("sections") or {}
+    return result.get("status") == "fallback" or any(
+        isinstance(section, dict) and section.get("status") == "fallback" for section in sections.values()
+    )
+
+# Per-user aggregates from activity/social/challenge events, so predictions can
+# be requested by user_id alone. ML_FEATURE_STORE_DATA points at a directory
+# with activities.csv / social.csv / challenges.csv to load at startup.
+feature_store = FeatureStore()
+FEATURE_STORE_DATA = os.getenv("ML_FEATURE_STORE_DATA")
+
+async def _load_feature_store():
+    paths = {
+        f"{name}_path": os.path.join(FEATURE_STORE_DATA, f"{name}.csv")
+        for name in ("activities", "social", "challenges")
+    }
+    paths = {key: path for key, path in paths.items() if os.path.exists(path)}
+    await asyncio.to_thread(feature_store.ingest_csv, **paths)
+
+# Models loaded in the background at startup (comma-separated, "none" to skip)
+WARMUP_MODELS = [
+    name.strip() for name in os.getenv("ML_WARMUP", "recommender,dropout,streak").split(",")
+    if name.strip() and name.strip() != "none"
+]
+warmup_state = {"done": not WARMUP_MODELS, "results": {}}
+
+# Quantum lane availability (None until probed). The quantum model is built in
+# its lane's worker processes, so it is probed through the lane: once after the
+# startup warm-up, and again in the background only while it is marked failed,
+# at most every QUANTUM_REPROBE_SECONDS. Requests only read the recorded state.
+QUANTUM_REPROBE_SECONDS = float(os.getenv("QUANTUM_REPROBE_SECONDS", "60"))
+quantum_state = {"available": None, "checked": 0.0, "probing": False}
+
+async def _probe_quantum():
+    quantum_state["probing"] = True
+    try:
+        quantum_state["available"] = await inference_executor.is_available("quantum_dropout")
+    finally:
+        quantum_state["checked"] = time.monotonic()
+        quantum_state["probing"] = False
+
+def _mark_quantum_unavailable():
+    quantum_state["available"] = False
+    quantum_state["checked"] = time.monotonic()
+
+def quantum_available() -> Optional[bool]:
+    """Recorded quantum lane state; schedules a background re-probe once a failure is stale."""
+    if (quantum_state["available"] is False and not quantum_state["probing"]
+            and time.monotonic() - quantum_state["checked"] >= QUANTUM_REPROBE_SECONDS):
+        quantum_state["probing"] = True
+        asyncio.create_task(_probe_quantum())
+    return quantum_state["available"]
+
+async def _warm_up_models():
+    warmup_state["results"] = await inference_executor.warm_up(WARMUP_MODELS)
+    warmup_state["done"] = True
+    logger.info(f"✅ Model warm-up complete: {warmup_state['results']}")
+    if "quantum_dropout" in warmup_state["results"]:
+        quantum_state["available"] = warmup_state["results"]["quantum_dropout"]
+        quantum_state["checked"] = time.monotonic()
     else:
-        raise ImportError("QuantumEnhancedDropoutPredictor class not available")
-except Exception as e:
-    quantum_dropout_predictor = None
-    logger.warning(f"⚠️  Quantum ML disabled: {e}")
+        await _probe_quantum()
+
+@app.on_event("startup")
+async def start_model_warmup():
+    if WARMUP_MODELS:
+        asyncio.create_task(_warm_up_models())
+    if FEATURE_STORE_DATA:
+        asyncio.create_task(_load_feature_store())
+
+@app.on_event("shutdown")
+def shutdown_inference_executor():
+    inference_executor.shutdown()
 
 # Pydantic models for request/response
 class UserProfile(BaseModel):
@@ -87,17 +175,113 @@ class DropoutPrediction(BaseModel):
     recommended_interventions: List[str]
     days_until_predicted_dropout: int
 
+class BatchDropoutRequest(BaseModel):
+    # Items are validated one by one so a bad profile only fails its own slot
+    profiles: List[Dict[str, Any]]
+
+class BatchDropoutItem(BaseModel):
+    index: int
+    user_id: Optional[str] = None
+    prediction: Optional[DropoutPrediction] = None
+    error: Optional[str] = None
+
+class BatchDropoutResponse(BaseModel):
+    count: int
+    succeeded: int
+    failed: int
+    results: List[BatchDropoutItem]
+
 class StreakPrediction(BaseModel):
     user_id: str
     streak_break_probability: float
     current_streak: int
     recommended_actions: List[str]
 
+class EngagementPrediction(BaseModel):
+    user_id: Optional[str] = None
+    engagement_level: str
+    confidence: Optional[float] = None
+    probabilities: Dict[str, float] = {}
+
+class BatchEngagementRequest(BaseModel):
+    profiles: List[Dict[str, Any]]
+
+class BatchEngagementItem(BaseModel):
+    index: int
+    user_id: Optional[str] = None
+    prediction: Optional[EngagementPrediction] = None
+    error: Optional[str] = None
+
+class BatchEngagementResponse(BaseModel):
+    count: int
+    succeeded: int
+    failed: int
+    results: List[BatchEngagementItem]
+
+class FeatureIngestRequest(BaseModel):
+    # Rows shaped like activities.csv, social.csv and challenges.csv
+    activities: List[Dict[str, Any]] = []
+    social: List[Dict[str, Any]] = []
+    challenges: List[Dict[str, Any]] = []
+
 class MotivationMessage(BaseModel):
     message: str
     tone: str
     personalization_score: float
 
+def dropout_inputs(profile: UserProfile) -> Dict:
+    """DropoutPredictor.predict arguments for a profile"""
+    return {
+        "user_id": profile.user_id,
+        "days_active": profile.days_active,
+        "engagement_metrics": {
+            "steps": profile.avg_steps_last_7_days,
+            "social": profile.social_engagement_score,
+            "notification_response": profile.response_rate_to_notifications
+        }
+    }
+
+def streak_inputs(profile: UserProfile) -> Dict:
+    """StreakPredictor.predict arguments for a profile"""
+    return {
+        "user_id": profile.user_id,
+        "current_streak": profile.meditation_streak,
+        "completion_rate": profile.challenge_completion_rate,
+        "recent_activity": profile.avg_steps_last_7_days
+    }
+
+def recommend_inputs(profile: UserProfile, top_n: int = 5) -> Dict:
+    """ChallengeRecommender.get_recommendations arguments for a profile"""
+    return {
+        "user_id": profile.user_id,
+        "user_features": {
+            "completion_rate": profile.challenge_completion_rate,
+            "social_score": profile.social_engagement_score,
+            "activity_times": profile.preferred_activity_times,
+            "current_streaks": profile.meditation_streak
+        },
+        "top_n": top_n
+    }
+
+def engine_features(profile: UserProfile) -> Dict:
+    """Base features shared by the quantum model and the AI engine"""
+    return {
+        'days_active': profile.days_active,
+        'total_days': profile.days_active,
+        'avg_steps': profile.avg_steps_last_7_days,
+        'meditation_streak': profile.meditation_streak,
+        'current_streak': profile.meditation_streak,
+        'current_streaks': profile.meditation_streak,
+        'avg_meditation': profile.meditation_streak * 5,
+        'avg_sleep': 7,
+        'completion_rate': profile.challenge_completion_rate,
+        'total_points': profile.days_active * 50,
+        'social_score': profile.social_engagement_score,
+        'social_interactions': int(profile.social_engagement_score * 100),
+        'notification_response': profile.response_rate_to_notifications,
+        'activity_times': profile.preferred_activity_times,
+    }
+
 @app.get("/")
 async def root():
     return {
@@ -108,6 +292,7 @@ async def root():
             "recommendations": "/api/recommend-challenge",
             "predictions": {
                 "dropout": "/api/predict-dropout",
+                "dropout_batch": "/api/predict-dropout/batch",
                 "dropout_quantum": "/api/predict-dropout-quantum",
                 "streak": "/api/predict-streak",
                 "compare": "/api/predict-compare"
@@ -115,7 +300,9 @@ async def root():
             "personalization": {
                 "motivation": "/api/generate-motivation",
                 "difficulty": "/api/calibrate-difficulty"
-            }
+            },
+            "metrics": "/api/metrics",
+            "readiness": "/ready"
         }
     }
 
@@ -126,15 +313,8 @@ async def recommend_challenge(profile: UserProfile):
     Uses collaborative filtering and user behavior patterns.
     """
     try:
-        recommendations = challenge_recommender.get_recommendations(
-            user_id=profile.user_id,
-            user_features={
-                "completion_rate": profile.challenge_completion_rate,
-                "social_score": profile.social_engagement_score,
-                "activity_times": profile.preferred_activity_times,
-                "current_streaks": profile.meditation_streak
-            },
-            top_n=5
+        recommendations = await cached_run(
+            "recommend", profile, "recommender", "get_recommendations", **recommend_inputs(profile)
         )
         return recommendations
     except Exception as e:
@@ -147,37 +327,152 @@ async def predict_dropout(profile: UserProfile):
     Predict likelihood of user dropping out in the next 7 days.
     """
     try:
-        prediction = dropout_predictor.predict(
-            user_id=profile.user_id,
-            days_active=profile.days_active,
-            engagement_metrics={
-                "steps": profile.avg_steps_last_7_days,
-                "social": profile.social_engagement_score,
-                "notification_response": profile.response_rate_to_notifications
-            }
-        )
+        prediction = await cached_run("dropout", profile, "dropout", "predict", **dropout_inputs(profile))
         return prediction
     except Exception as e:
         logger.error(f"Error in dropout prediction: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/predict-dropout/batch", response_model=BatchDropoutResponse)
+async def predict_dropout_batch(request: BatchDropoutRequest):
+    """
+    Predict dropout likelihood for many users in a single call.
+    Profiles are scored as one feature matrix; results keep input order and
+    invalid items are reported individually instead of failing the batch.
+    """
+    try:
+        results: List[Optional[Dict]] = [None] * len(request.profiles)
+        batch = []
+        batch_indices = []
+        batch_payloads = []
+        version = cache_version("dropout")
+        
+        for i, raw_profile in enumerate(request.profiles):
+            try:
+                profile = UserProfile(**raw_profile)
+            except ValidationError as e:
+                results[i] = {
+                    "index": i,
+                    "user_id": raw_profile.get("user_id"),
+                    "error": f"Invalid profile: {e.errors()}"
+                }
+                continue
+            
+            payload = profile.dict()
+            cached = prediction_cache.get("dropout", payload, version)
+            if cached is not None:
+                results[i] = {"index": i, "user_id": cached["user_id"], "prediction": cached}
+                continue
+            
+            batch_payloads.append(payload)
+            batch.append(dropout_inputs(profile))
+            batch_indices.append(i)
+        
+        predictions = await inference_executor.run("dropout", "predict_batch", batch) if batch else []
+        
+        for i, payload, prediction in zip(batch_indices, batch_payloads, predictions):
+            if "error" in prediction:
+                results[i] = {"index": i, "user_id": prediction.get("user_id"), "error": prediction["error"]}
+                continue
+            if not _is_fallback(prediction):
+                prediction_cache.put("dropout", payload, prediction, version)
+            results[i] = {"index": i, "user_id": prediction["user_id"], "prediction": prediction}
+        
+        failed = sum(1 for item in results if item.get("error") is not None)
+        return {
+            "count": len(results),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "results": results
+        }
+    except Exception as e:
+        logger.error(f"Error in batch dropout prediction: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/predict-streak", response_model=StreakPrediction)
 async def predict_streak_break(profile: UserProfile):
     """
     Predict likelihood of streak breaking.
     """
     try:
-        prediction = streak_predictor.predict(
-            user_id=profile.user_id,
-            current_streak=profile.meditation_streak,
-            completion_rate=profile.challenge_completion_rate,
-            recent_activity=profile.avg_steps_last_7_days
-        )
+        prediction = await cached_run("streak", profile, "streak", "predict", **streak_inputs(profile))
         return prediction
     except Exception as e:
         logger.error(f"Error in streak prediction: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/predict/engagement", response_model=EngagementPrediction)
+async def predict_engagement(profile: UserProfile):
+    """
+    Classify the user's engagement level with the AI engine's engagement classifier.
+    """
+    try:
+        predictions = await cached_run(
+            "engagement", profile, "motivation_engine", "classify_engagement_batch",
+            features_list=[dict(engine_features(profile), user_id=profile.user_id)]
+        )
+        return predictions[0]
+    except Exception as e:
+        logger.error(f"Error in engagement prediction: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/predict/engagement/batch", response_model=BatchEngagementResponse)
+async def predict_engagement_batch(request: BatchEngagementRequest):
+    """
+    Classify engagement for many users in a single call.
+    Cached profiles are served from the "engagement" cache; the rest are
+    scaled, scored and decoded as one array. Invalid items are reported
+    individually instead of failing the batch.
+    """
+    try:
+        results: List[Optional[Dict]] = [None] * len(request.profiles)
+        batch = []
+        batch_indices = []
+        batch_payloads = []
+        version = cache_version("engagement")
+        
+        for i, raw_profile in enumerate(request.profiles):
+            try:
+                profile = UserProfile(**raw_profile)
+            except ValidationError as e:
+                results[i] = {
+                    "index": i,
+                    "user_id": raw_profile.get("user_id"),
+                    "error": f"Invalid profile: {e.errors()}"
+                }
+                continue
+            
+            # Same entries as /api/predict/engagement, which caches the one-item list
+            payload = profile.dict()
+            cached = prediction_cache.get("engagement", payload, version)
+            if cached is not None:
+                results[i] = {"index": i, "user_id": cached[0]["user_id"], "prediction": cached[0]}
+                continue
+            
+            batch_payloads.append(payload)
+            batch.append(dict(engine_features(profile), user_id=profile.user_id))
+            batch_indices.append(i)
+        
+        predictions = await inference_executor.run(
+            "motivation_engine", "classify_engagement_batch", batch
+        ) if batch else []
+        
+        for i, payload, prediction in zip(batch_indices, batch_payloads, predictions):
+            if not _is_fallback(prediction):
+                prediction_cache.put("engagement", payload, [prediction], version)
+            results[i] = {"index": i, "user_id": prediction["user_id"], "prediction": prediction}
+        
+        failed = sum(1 for item in results if item.get("error") is not None)
+        return {
+            "count": len(results),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "results": results
+        }
+    except Exception as e:
+        logger.error(f"Error in batch engagement prediction: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/generate-motivation", response_model=MotivationMessage)
 async def generate_motivation(profile: UserProfile):
     """
@@ -214,6 +509,37 @@ async def calibrate_difficulty(profile: UserProfile, current_difficulty: int):
         logger.error(f"Error calibrating difficulty: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Uncached hybrid model calls by path; in cascade mode "classical_only" skipped the circuit
+quantum_paths = {"hybrid": 0, "classical_only": 0}
+
+async def quantum_prediction(user_id: str, features: Dict, payload: Dict) -> Dict:
+    """Hybrid model prediction with risk level and circuit info, cached under payload"""
+    version = cache_version("quantum")
+    cached = prediction_cache.get("quantum", payload, version)
+    if cached is not None:
+        return cached
+    
+    # Get quantum prediction
+    try:
+        prediction = await inference_executor.run("quantum_dropout", "predict", features)
+    except ModelUnavailableError:
+        _mark_quantum_unavailable()
+        raise
+    quantum_state["available"] = True
+    quantum_paths[prediction.get('inference_path', 'hybrid')] += 1
+    
+    # risk_level comes from the model: a cascade-skipped response has only a
+    # probability interval, whose bucket the model has already fixed
+    prediction['user_id'] = user_id
+    prediction['model_type'] = 'Hybrid Quantum-Classical'
+    
+    # Add quantum info
+    quantum_info = await inference_executor.run("quantum_dropout", "get_quantum_info")
+    prediction['quantum_info'] = quantum_info
+    
+    prediction_cache.put("quantum", payload, prediction, version)
+    return prediction
+
 @app.post("/api/predict-dropout-quantum")
 async def predict_dropout_quantum(profile: UserProfile):
     """
@@ -221,53 +547,141 @@ async def predict_dropout_quantum(profile: UserProfile):
     Combines 4-qubit quantum circuit with classical ensemble.
     """
     try:
-        if quantum_dropout_predictor is None:
-            raise HTTPException(
-                status_code=503, 
-                detail="Quantum ML service unavailable"
-            )
-        
-        # Prepare features for quantum model
-        features = {
-            'days_active': profile.days_active,
-            'total_days': profile.days_active,
-            'avg_steps': profile.avg_steps_last_7_days,
-            'meditation_streak': profile.meditation_streak,
-            'avg_meditation': profile.meditation_streak * 5,
-            'avg_sleep': 7,
-            'completion_rate': profile.challenge_completion_rate,
-            'total_points': profile.days_active * 50,
-            'social_score': profile.social_engagement_score,
-            'social_interactions': int(profile.social_engagement_score * 100),
-            'notification_response': profile.response_rate_to_notifications,
-        }
-        
-        # Get quantum prediction
-        prediction = quantum_dropout_predictor.predict(features)
-        
-        # Add user_id and risk classification
-        prediction['user_id'] = profile.user_id
-        prediction['model_type'] = 'Hybrid Quantum-Classical'
-        
-        if prediction['dropout_probability'] > 0.7:
-            prediction['risk_level'] = 'high'
-        elif prediction['dropout_probability'] > 0.4:
-            prediction['risk_level'] = 'medium'
-        else:
-            prediction['risk_level'] = 'low'
-        
-        # Add quantum info
-        quantum_info = quantum_dropout_predictor.get_quantum_info()
-        prediction['quantum_info'] = quantum_info
-        
-        return prediction
+        return await quantum_prediction(profile.user_id, engine_features(profile), profile.dict())
         
-    except HTTPException:
-        raise
+    except ModelUnavailableError as e:
+        logger.warning(f"Quantum ML unavailable: {e}")
+        raise HTTPException(
+            status_code=503, 
+            detail="Quantum ML service unavailable"
+        )
     except Exception as e:
         logger.error(f"Error in quantum dropout prediction: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/features/ingest")
+async def ingest_features(request: FeatureIngestRequest):
+    """
+    Feed raw activity, social and challenge events into the feature store.
+    Rolling 7/30-day and lifetime aggregates are updated incrementally.
+    """
+    try:
+        counts = await asyncio.to_thread(
+            feature_store.ingest, request.activities, request.social, request.challenges
+        )
+        return {"ingested": counts, "users": len(feature_store)}
+    except (KeyError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid event: {e}")
+
+@app.post("/api/features/activity")
+async def ingest_activity(event: Dict[str, Any]):
+    """
+    Ingest one day's activity (an activities.csv row) and return the user's
+    updated temporal features: slope, 3-day decline, trends and momentum.
+    """
+    try:
+        await asyncio.to_thread(feature_store.ingest, [event])
+    except (KeyError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid event: {e}")
+    return user_temporal_features(str(event["user_id"]))
+
+def stored_features(user_id: str) -> Dict:
+    """Materialized feature row of a user, 404 if the store has never seen them"""
+    features = feature_store.get_features(user_id)
+    if features is None:
+        raise HTTPException(status_code=404, detail=f"No features for user '{user_id}'")
+    return features
+
+@app.get("/api/features/{user_id}")
+async def get_user_features(user_id: str):
+    """Current feature row of a user (lifetime, 7-day and 30-day aggregates)."""
+    return stored_features(user_id)
+
+def user_temporal_features(user_id: str) -> Dict:
+    features = stored_features(user_id)
+    return {"user_id": user_id, "last_event_date": features["last_event_date"],
+            **{name: features[name] for name in TEMPORAL_FEATURES + ["temporal_days"]}}
+
+@app.get("/api/features/{user_id}/temporal")
+async def get_user_temporal_features(user_id: str):
+    """Streaming temporal features of a user, current as of the last ingested activity."""
+    return user_temporal_features(user_id)
+
+@app.post("/api/users/{user_id}/predict-dropout", response_model=DropoutPrediction)
+async def predict_dropout_for_user(user_id: str):
+    """
+    Dropout prediction from the user's stored features; no profile payload needed.
+    """
+    features = stored_features(user_id)
+    try:
+        return await cached_run(
+            "dropout", features, "dropout", "predict_from_features", user_id=user_id, features=features
+        )
+    except Exception as e:
+        logger.error(f"Error in dropout prediction: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/users/{user_id}/predict-streak", response_model=StreakPrediction)
+async def predict_streak_for_user(user_id: str):
+    """
+    Streak break prediction from the user's stored features.
+    """
+    features = stored_features(user_id)
+    try:
+        return await cached_run(
+            "streak", features, "streak", "predict_from_features", user_id=user_id, features=features
+        )
+    except Exception as e:
+        logger.error(f"Error in streak prediction: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/users/{user_id}/predict-dropout-quantum")
+async def predict_dropout_quantum_for_user(user_id: str):
+    """
+    Hybrid quantum-classical dropout prediction from the user's stored features.
+    """
+    features = stored_features(user_id)
+    try:
+        return await quantum_prediction(user_id, features, features)
+    except ModelUnavailableError as e:
+        logger.warning(f"Quantum ML unavailable: {e}")
+        raise HTTPException(status_code=503, detail="Quantum ML service unavailable")
+    except Exception as e:
+        logger.error(f"Error in quantum dropout prediction: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/insights")
+async def get_insights(profile: UserProfile, concurrent: bool = False):
+    """
+    Everything the dashboard shows, in one round trip.
+    The AI engine resolves the base features once and scores its six models in
+    one pass (on threads if concurrent=true). The dropout and streak sections
+    come from the standalone predictors on the same fields, so they equal
+    /api/predict-dropout and /api/predict-streak; insights.dropout_risk and
+    insights.streak_risk are the engine's own scores and can differ from them.
+    Sections the engine could not produce are returned as null and listed in "errors".
+    """
+    response = {"user_id": profile.user_id, "errors": {}}
+    sections = {}
+    try:
+        insights = await cached_run(
+            "insights", profile, "motivation_engine", "get_comprehensive_insights",
+            user_id=profile.user_id, user_features=engine_features(profile),
+            concurrent=concurrent, sections=True
+        )
+        sections = insights.pop("sections", {})
+        response["insights"] = insights
+    except Exception as e:
+        logger.error(f"Error in insights: {str(e)}")
+        response["insights"] = None
+        response["errors"]["insights"] = str(e)
+    
+    for name in ("dropout", "streak", "recommendations"):
+        response[name] = sections.get(name)
+        if response[name] is None:
+            response["errors"][name] = response["errors"].get("insights", "not produced by the AI engine")
+    return response
+
 @app.post("/api/predict-compare")
 async def predict_compare(profile: UserProfile):
     """
@@ -276,30 +690,27 @@ async def predict_compare(profile: UserProfile):
     """
     try:
         # Get classical prediction
-        classical = dropout_predictor.predict(
-            user_id=profile.user_id,
-            days_active=profile.days_active,
-            engagement_metrics={
-                "steps": profile.avg_steps_last_7_days,
-                "social": profile.social_engagement_score,
-                "notification_response": profile.response_rate_to_notifications
-            }
-        )
+        classical = await cached_run("dropout", profile, "dropout", "predict", **dropout_inputs(profile))
         
         # Get quantum prediction if available
         quantum = None
-        if quantum_dropout_predictor is not None:
+        if quantum_available() is not False:
             try:
-                features = {
-                    'days_active': profile.days_active,
-                    'completion_rate': profile.challenge_completion_rate,
-                    'social_score': profile.social_engagement_score,
-                    'avg_steps': profile.avg_steps_last_7_days,
-                }
-                quantum = quantum_dropout_predictor.predict(features)
+                # Same features, cache entry, cascade counters and risk level as /api/predict-dropout-quantum
+                quantum = await quantum_prediction(profile.user_id, engine_features(profile), profile.dict())
             except Exception as e:
                 logger.warning(f"Quantum prediction failed: {e}")
         
+        if not quantum:
+            recommendation = "Use classical"
+        elif quantum['inference_path'] == 'classical_only':
+            # No quantum probability to compare against
+            recommendation = "Quantum skipped"
+        elif abs(quantum['dropout_probability'] - 0.5) > abs(classical['dropout_probability'] - 0.5):
+            recommendation = "Use quantum"
+        else:
+            recommendation = "Use classical"
+        
         return {
             "user_id": profile.user_id,
             "classical": {
@@ -309,31 +720,65 @@ async def predict_compare(profile: UserProfile):
                 "accuracy": "93.7%"
             },
             "quantum": {
-                "dropout_probability": quantum['dropout_probability'] if quantum else None,
-                "quantum_component": quantum['quantum_component'] if quantum else None,
-                "classical_component": quantum['classical_component'] if quantum else None,
-                "risk_level": "high" if quantum and quantum['dropout_probability'] > 0.7 else "medium" if quantum and quantum['dropout_probability'] > 0.4 else "low",
+                # A cascade-skipped circuit leaves only dropout_probability_range, no probability or quantum_component
+                **{key: quantum[key] for key in
+                   ("dropout_probability", "dropout_probability_range", "quantum_component",
+                    "classical_component", "inference_path")
+                   if key in quantum},
+                "risk_level": quantum['risk_level'],
                 "model": "Hybrid Quantum-Classical",
                 "qubits": 4,
                 "available": quantum is not None
             } if quantum else {"available": False, "reason": "Quantum service unavailable"},
-            "recommendation": "Use classical" if not quantum else (
-                "Use quantum" if abs(quantum['dropout_probability'] - 0.5) > abs(classical['dropout_probability'] - 0.5) else "Use classical"
-            )
+            "recommendation": recommendation
         }
         
     except Exception as e:
         logger.error(f"Error in prediction comparison: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/metrics")
+async def metrics():
+    """Inference executor queue depth, in-flight calls and latency per lane, model load state, cache counters, feature store size and the quantum cascade skip rate."""
+    quantum_requests = sum(quantum_paths.values())
+    return {
+        "executor": inference_executor.stats(),
+        "registry": model_registry.status(),
+        "cache": prediction_cache.stats(),
+        "feature_store": feature_store.stats(),
+        "quantum_cascade": {
+            "requests": quantum_requests,
+            "quantum_evaluated": quantum_paths["hybrid"],
+            "quantum_skipped": quantum_paths["classical_only"],
+            "skip_fraction": round(quantum_paths["classical_only"] / quantum_requests, 4) if quantum_requests else 0.0
+        }
+    }
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint for monitoring."""
+    # The quantum model lives in its lane's worker processes by default, so its
+    # state is the one recorded from probes through the lane, not the parent registry
+    available = quantum_available()
+    quantum_status = "not_loaded" if available is None else "loaded" if available else "failed"
     return {
         "status": "healthy", 
-        "models_loaded": True,
-        "quantum_available": quantum_dropout_predictor is not None
+        "models_loaded": warmup_state["done"] and all(warmup_state["results"].values()),
+        "models": dict(model_registry.status()["models"], quantum_dropout=quantum_status),
+        "quantum_available": bool(available)
+    }
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 503 until the startup warm-up has finished."""
+    body = {
+        "ready": warmup_state["done"],
+        "warmup": warmup_state["results"],
+        "registry": model_registry.status()
     }
+    if not warmup_state["done"]:
+        raise HTTPException(status_code=503, detail=body)
+    return body
 
 if __name__ == "__main__":
     import os
@@ -2,14 +2,68 @@
 Integrated AI Motivation Engine
 Combines all 6 ML models for comprehensive user insights
 """
-import joblib
 import numpy as np
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 import logging
 import os
 
+from app.models.registry import load_model, get_model, ModelUnavailableError
+
 logger = logging.getLogger(__name__)
 
+# Shared base features (name, default), resolved once per request
+BASE_FEATURES = [
+    ('days_active', 10),
+    ('total_days', 30),
+    ('avg_steps', 5000),
+    ('meditation_streak', 3),
+    ('avg_meditation', 5),
+    ('avg_sleep', 7),
+    ('completion_rate', 0.5),
+    ('total_points', 500),
+    ('social_score', 0.5),
+    ('social_interactions', 50),
+    ('notification_response', 0.5),
+    ('current_streak', 5),
+    ('avg_streak', 3),
+    ('recent_completion_rate', 0.5),
+    ('meditation_minutes', 5),
+    ('challenge_completion', 0.5),
+    ('behavioral_consistency', 0.5),
+    ('completion_trend', 0),
+    ('steps_trend', 0),
+    ('engagement_momentum', 0),
+]
+
+# Recommendations per request; the insights card shows the top three
+RECOMMENDATIONS = 5
+
+# Constant slots appended after the base features (engineered-feature placeholders)
+PLACEHOLDERS = [0.0, 0.5]
+_INDEX = {name: i for i, (name, _) in enumerate(BASE_FEATURES)}
+_INDEX['zero'] = len(BASE_FEATURES)
+_INDEX['mood_correlation'] = len(BASE_FEATURES) + 1
+
+# Input columns of each model, as positions in the base vector
+MODEL_COLUMNS = {
+    name: np.array([_INDEX[column] for column in columns])
+    for name, columns in {
+        'dropout': ['days_active', 'total_days', 'avg_steps', 'meditation_streak', 'avg_meditation', 'avg_sleep',
+                    'completion_rate', 'total_points', 'social_score', 'social_interactions',
+                    'notification_response', 'mood_correlation'],
+        'streak': ['current_streak', 'avg_streak', 'completion_rate', 'recent_completion_rate', 'days_active',
+                   'avg_steps', 'meditation_minutes', 'social_score', 'challenge_completion'] + ['zero'] * 3,
+        'engagement': ['days_active', 'total_days', 'avg_steps', 'avg_meditation', 'avg_sleep', 'completion_rate',
+                       'total_points', 'social_score', 'social_interactions', 'notification_response'] + ['zero'] * 13,
+        'tone': ['completion_rate', 'behavioral_consistency', 'social_score', 'completion_trend', 'steps_trend',
+                 'engagement_momentum', 'days_active', 'avg_steps', 'social_interactions', 'notification_response'],
+        'difficulty': ['completion_rate', 'behavioral_consistency', 'engagement_momentum', 'completion_trend',
+                       'steps_trend', 'social_score', 'days_active', 'avg_steps', 'social_interactions',
+                       'notification_response'],
+    }.items()
+}
+
 class AIMotivationEngine:
     """
     Unified AI system combining:
@@ -27,7 +81,8 @@ class AIMotivationEngine:
         
         # Load predictors
         self.dropout_model = self._load_model("dropout_predictor_ENSEMBLE.pkl")
-        self.dropout_scaler = self._load_model("dropout_scaler_ROBUST.pkl")
+        # Same scaler as the standalone DropoutPredictor, so both report one score
+        self.dropout_scaler = self._load_model("scaler_ENSEMBLE.pkl")
         
         self.streak_model = self._load_model("streak_predictor.pkl")
         self.streak_scaler = self._load_model("streak_scaler.pkl")
@@ -35,6 +90,7 @@ class AIMotivationEngine:
         self.engagement_model = self._load_model("engagement_classifier.pkl")
         self.engagement_scaler = self._load_model("engagement_scaler.pkl")
         self.engagement_encoder = self._load_model("engagement_label_encoder.pkl")
+        self.engagement_labels = self._label_lookup(self.engagement_model, self.engagement_encoder)
         
         self.recommender = self._load_model("challenge_recommender.pkl")
         
@@ -45,37 +101,86 @@ class AIMotivationEngine:
         self.difficulty_model = self._load_model("difficulty_predictor.pkl")
         self.difficulty_scaler = self._load_model("difficulty_scaler.pkl")
         
+        self._pool = None
+        
         logger.info("✅ AI Motivation Engine initialized with 6 ML models")
     
     def _load_model(self, filename):
         """Load model with fallback"""
-        path = os.path.join(self.model_dir, filename)
-        if os.path.exists(path):
-            return joblib.load(path)
+        model = load_model(os.path.join(self.model_dir, filename))
+        if model is not None:
+            return model
         logger.warning(f"Model {filename} not found, using fallback")
         return None
     
-    def get_comprehensive_insights(self, user_id: str, user_features: Dict) -> Dict:
+    def _label_lookup(self, model, encoder) -> Optional[np.ndarray]:
+        """Decoded label for each predict_proba column, so decoding is one array index"""
+        if model is None or encoder is None:
+            return None
+        return np.asarray(encoder.inverse_transform(model.classes_))
+    
+    def build_base_features(self, user_features: Dict) -> np.ndarray:
+        """
+        Resolve the shared base features once for all models
+        
+        Returns:
+            Vector in BASE_FEATURES order followed by the constant placeholders
+        """
+        return np.array(
+            [user_features.get(name, default) for name, default in BASE_FEATURES] + PLACEHOLDERS,
+            dtype=float
+        )
+    
+    def build_base_matrix(self, features_list: List[Dict]) -> np.ndarray:
+        """Base features for many users, one row each"""
+        return np.array(
+            [[features.get(name, default) for name, default in BASE_FEATURES] + PLACEHOLDERS for features in features_list],
+            dtype=float
+        ).reshape(len(features_list), len(BASE_FEATURES) + len(PLACEHOLDERS))
+    
+    def _model_row(self, base: np.ndarray, model: str) -> np.ndarray:
+        """One-row feature matrix for a model, gathered from the base vector"""
+        return base[MODEL_COLUMNS[model]].reshape(1, -1)
+    
+    def get_comprehensive_insights(self, user_id: str, user_features: Dict, concurrent: bool = False,
+                                   sections: bool = False) -> Dict:
         """
         Generate complete AI-powered insights for a user
         
+        Args:
+            user_id: User identifier
+            user_features: Raw user features (missing ones fall back to defaults)
+            concurrent: Run the independent models on a thread pool
+            sections: Also return "sections": the dropout, streak and recommendation
+                payloads of the standalone endpoints (see _dashboard_sections)
+        
         Returns:
             Comprehensive dict with all predictions, recommendations, and personalized content
         """
         try:
-            # 1. Risk Predictions
-            dropout_risk = self._predict_dropout(user_features)
-            streak_risk = self._predict_streak_break(user_features)
-            
-            # 2. User Segmentation
-            engagement_level = self._classify_engagement(user_features)
+            base = self.build_base_features(user_features)
             
-            # 3. Personalization
-            tone = self._select_tone(user_features)
-            difficulty = self._predict_difficulty(user_features)
+            # 1-4. Risk predictions, segmentation, personalization, recommendations
+            tasks = {
+                "dropout": (self._predict_dropout, base),
+                "streak": (self._predict_streak_break, base),
+                "engagement": (self._classify_engagement, base),
+                "tone": (self._select_tone, base),
+                "difficulty": (self._predict_difficulty, base),
+                "challenges": (self._recommend_challenges, dict(user_features, user_id=user_id)),
+            }
+            if concurrent:
+                futures = {name: self._get_pool().submit(fn, arg) for name, (fn, arg) in tasks.items()}
+                results = {name: future.result() for name, future in futures.items()}
+            else:
+                results = {name: fn(arg) for name, (fn, arg) in tasks.items()}
             
-            # 4. Recommendations
-            challenges = self._recommend_challenges(user_features)
+            dropout_risk = results["dropout"]
+            streak_risk = results["streak"]
+            engagement_level = results["engagement"]
+            tone = results["tone"]
+            difficulty = results["difficulty"]
+            recommendations = results["challenges"]
             
             # 5. Generate personalized message
             message = self._generate_message(
@@ -87,7 +192,7 @@ class AIMotivationEngine:
                 dropout_risk, streak_risk, engagement_level, tone
             )
             
-            return {
+            insights = {
                 "user_id": user_id,
                 
                 # Risk Assessment
@@ -114,7 +219,7 @@ class AIMotivationEngine:
                 },
                 
                 # Recommendations
-                "recommended_challenges": challenges[:3],
+                "recommended_challenges": self._challenge_summary(recommendations),
                 "recommended_actions": actions,
                 
                 # Meta
@@ -122,105 +227,107 @@ class AIMotivationEngine:
                     dropout_risk, streak_risk, tone
                 )
             }
+            if sections:
+                insights["sections"] = self._dashboard_sections(user_id, user_features, recommendations)
+            return insights
             
         except Exception as e:
             logger.error(f"Error in AI engine: {str(e)}")
             return self._fallback_insights(user_id)
     
-    def _predict_dropout(self, features: Dict) -> float:
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=len(MODEL_COLUMNS) + 1, thread_name_prefix="ai-engine")
+        return self._pool
+    
+    def _predict_dropout(self, base: np.ndarray) -> float:
         """Predict dropout probability"""
         if self.dropout_model is None:
             return 0.5
         
-        # Create feature vector
-        feat_vec = np.array([[
-            features.get('days_active', 10),
-            features.get('total_days', 30),
-            features.get('avg_steps', 5000),
-            features.get('meditation_streak', 3),
-            features.get('avg_meditation', 5),
-            features.get('avg_sleep', 7),
-            features.get('completion_rate', 0.5),
-            features.get('total_points', 500),
-            features.get('social_score', 0.5),
-            features.get('social_interactions', 50),
-            features.get('notification_response', 0.5),
-            0.5  # mood correlation
-        ]])
-        
+        feat_vec = self._model_row(base, "dropout")
         if self.dropout_scaler:
             feat_vec = self.dropout_scaler.transform(feat_vec)
         
         return float(self.dropout_model.predict_proba(feat_vec)[0][1])
     
-    def _predict_streak_break(self, features: Dict) -> float:
+    def _predict_streak_break(self, base: np.ndarray) -> float:
         """Predict streak breaking probability"""
         if self.streak_model is None:
             return 0.3
         
-        feat_vec = np.array([[
-            features.get('current_streak', 5),
-            features.get('avg_streak', 3),
-            features.get('completion_rate', 0.5),
-            features.get('recent_completion_rate', 0.5),
-            features.get('days_active', 10),
-            features.get('avg_steps', 5000),
-            features.get('meditation_minutes', 5),
-            features.get('social_score', 0.5),
-            features.get('challenge_completion', 0.5),
-            0, 0, 0  # Engineered features
-        ]])
-        
+        feat_vec = self._model_row(base, "streak")
         if self.streak_scaler:
             feat_vec = self.streak_scaler.transform(feat_vec)
         
         return float(self.streak_model.predict_proba(feat_vec)[0][1])
     
-    def _classify_engagement(self, features: Dict) -> str:
+    def _classify_engagement(self, base: np.ndarray) -> str:
         """Classify engagement level"""
         if self.engagement_model is None:
             return "moderate"
         
-        feat_vec = np.array([[
-            features.get('days_active', 10),
-            features.get('total_days', 30),
-            features.get('avg_steps', 5000),
-            features.get('avg_meditation', 5),
-            features.get('avg_sleep', 7),
-            features.get('completion_rate', 0.5),
-            features.get('total_points', 500),
-            features.get('social_score', 0.5),
-            features.get('social_interactions', 50),
-            features.get('notification_response', 0.5),
-            *([0]*13)  # Engineered features placeholder
-        ]])
+        labels, _ = self._score_engagement(base.reshape(1, -1))
+        return labels[0]
+    
+    def _score_engagement(self, base: np.ndarray):
+        """
+        Engagement labels and class probabilities for a base feature matrix
+        
+        Args:
+            base: [n_users, n_base] from build_base_matrix
         
+        Returns:
+            (labels [n_users], probabilities [n_users, n_classes])
+        """
+        X = base[:, MODEL_COLUMNS["engagement"]]
         if self.engagement_scaler:
-            feat_vec = self.engagement_scaler.transform(feat_vec)
+            X = self.engagement_scaler.transform(X)
         
-        pred = self.engagement_model.predict(feat_vec)[0]
-        if self.engagement_encoder:
-            return self.engagement_encoder.inverse_transform([pred])[0]
-        return "moderate"
+        probabilities = self.engagement_model.predict_proba(X)
+        if self.engagement_labels is None:
+            return np.full(len(X), "moderate", dtype=object), probabilities
+        return self.engagement_labels[np.argmax(probabilities, axis=1)], probabilities
     
-    def _select_tone(self, features: Dict) -> str:
+    def classify_engagement_batch(self, features_list: List[Dict]) -> List[Dict]:
+        """
+        Classify engagement for many users with one scaler/model call
+        
+        Args:
+            features_list: User feature dicts (same keys as get_comprehensive_insights)
+        
+        Returns:
+            One dict per user: user_id, engagement_level, confidence, probabilities
+        """
+        if not features_list:
+            return []
+        if self.engagement_model is None:
+            return [
+                {"user_id": features.get("user_id"), "engagement_level": "moderate", "confidence": None, "probabilities": {}}
+                for features in features_list
+            ]
+        
+        labels, probabilities = self._score_engagement(self.build_base_matrix(features_list))
+        confidences = probabilities.max(axis=1)
+        class_names = self.engagement_labels if self.engagement_labels is not None else self.engagement_model.classes_
+        class_names = [str(name) for name in class_names]
+        
+        return [
+            {
+                "user_id": features.get("user_id"),
+                "engagement_level": str(label),
+                "confidence": round(float(confidence), 3),
+                "probabilities": {name: round(float(p), 3) for name, p in zip(class_names, row)}
+            }
+            for features, label, confidence, row in zip(features_list, labels, confidences, probabilities)
+        ]
+    
+    def _select_tone(self, base: np.ndarray) -> str:
         """Select optimal message tone"""
         if self.tone_model is None:
             return "encouraging"
         
-        feat_vec = np.array([[
-            features.get('completion_rate', 0.5),
-            features.get('behavioral_consistency', 0.5),
-            features.get('social_score', 0.5),
-            features.get('completion_trend', 0),
-            features.get('steps_trend', 0),
-            features.get('engagement_momentum', 0),
-            features.get('days_active', 10),
-            features.get('avg_steps', 5000),
-            features.get('social_interactions', 50),
-            features.get('notification_response', 0.5)
-        ]])
-        
+        feat_vec = self._model_row(base, "tone")
         if self.tone_scaler:
             feat_vec = self.tone_scaler.transform(feat_vec)
         
@@ -229,38 +336,69 @@ class AIMotivationEngine:
             return self.tone_encoder.inverse_transform([pred])[0]
         return "encouraging"
     
-    def _predict_difficulty(self, features: Dict) -> float:
+    def _predict_difficulty(self, base: np.ndarray) -> float:
         """Predict optimal difficulty"""
         if self.difficulty_model is None:
             return 3.0
         
-        feat_vec = np.array([[
-            features.get('completion_rate', 0.5),
-            features.get('behavioral_consistency', 0.5),
-            features.get('engagement_momentum', 0),
-            features.get('completion_trend', 0),
-            features.get('steps_trend', 0),
-            features.get('social_score', 0.5),
-            features.get('days_active', 10),
-            features.get('avg_steps', 5000),
-            features.get('social_interactions', 50),
-            features.get('notification_response', 0.5)
-        ]])
-        
+        feat_vec = self._model_row(base, "difficulty")
         if self.difficulty_scaler:
             feat_vec = self.difficulty_scaler.transform(feat_vec)
         
         return float(np.clip(self.difficulty_model.predict(feat_vec)[0], 1, 5))
     
-    def _recommend_challenges(self, features: Dict) -> List[Dict]:
-        """Get challenge recommendations"""
-        # Simplified - would use full recommender
+    def _recommend_challenges(self, features: Dict) -> Optional[List[Dict]]:
+        """Challenge recommendations from the shared ChallengeRecommender (None if unavailable)"""
+        if self.recommender is not None:
+            try:
+                return get_model("recommender").get_recommendations(
+                    user_id=features.get('user_id', ''),
+                    user_features=features,
+                    top_n=RECOMMENDATIONS
+                )
+            except ModelUnavailableError as e:
+                logger.warning(f"Recommender unavailable, using defaults: {e}")
+        return None
+    
+    def _challenge_summary(self, recommendations: Optional[List[Dict]]) -> List[Dict]:
+        """Top three recommendations for the insights card, or defaults"""
+        if recommendations:
+            return [
+                {"id": rec["challenge_id"], "name": rec["challenge_name"], "confidence": rec["confidence_score"]}
+                for rec in recommendations[:3]
+            ]
         return [
             {"id": "C001", "name": "Morning Meditation", "confidence": 0.85},
             {"id": "C002", "name": "10K Steps", "confidence": 0.78},
             {"id": "C003", "name": "Hydration Hero", "confidence": 0.72},
         ]
     
+    def _dashboard_sections(self, user_id: str, user_features: Dict,
+                            recommendations: Optional[List[Dict]]) -> Dict:
+        """
+        Dropout, streak and recommendation payloads of the standalone endpoints
+        
+        The dropout and streak sections are scored by DropoutPredictor and
+        StreakPredictor from the same request fields as /api/predict-dropout and
+        /api/predict-streak, so they match those endpoints. They can differ from
+        dropout_risk / streak_risk, which this engine scores on its own feature rows.
+        """
+        engagement_metrics = {
+            "steps": user_features.get("avg_steps", 5000),
+            "social": user_features.get("social_score", 0.5),
+            "notification_response": user_features.get("notification_response", 0.5)
+        }
+        return {
+            "dropout": get_model("dropout").predict(
+                user_id, user_features.get("days_active", 0), engagement_metrics
+            ),
+            "streak": get_model("streak").predict(
+                user_id, int(user_features.get("current_streak", 0)),
+                user_features.get("completion_rate", 0.5), user_features.get("avg_steps", 5000)
+            ),
+            "recommendations": recommendations,
+        }
+    
     def _generate_message(self, tone, engagement, dropout_risk, streak_risk):
         """Generate personalized message"""
         templates = {
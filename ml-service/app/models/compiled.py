@@ -0,0 +1,325 @@
+"""
+Compiled Tree Ensembles
+Flattens trained sklearn models into plain NumPy arrays for fast inference
+
+sklearn spends most of a single-row predict_proba call on input validation,
+estimator dispatch inside VotingClassifier and per-tree Python loops. The
+compiler below turns the saved models into flat node arrays (feature,
+threshold, children, leaf values) and evaluates every tree of a batch in
+lock-step, one NumPy gather per tree level.
+
+Supported: RandomForest/ExtraTrees/DecisionTree classifiers, GradientBoosting
+classifiers (log_loss / exponential), LogisticRegression, soft VotingClassifier
+over any of these, and Standard/Robust/MinMax scalers. compile_model returns
+None for anything else so callers can keep the sklearn object.
+"""
+import numpy as np
+from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _expit(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def _softmax(x: np.ndarray) -> np.ndarray:
+    x = x - x.max(axis=1, keepdims=True)
+    np.exp(x, out=x)
+    return x / x.sum(axis=1, keepdims=True)
+
+
+def _binary_to_proba(p1: np.ndarray) -> np.ndarray:
+    return np.column_stack([1.0 - p1, p1])
+
+
+class FlatTrees:
+    """
+    Many decision trees concatenated into one node table
+
+    Nodes are addressed by slot = 2 * node so that the child of a slot is
+    children[slot + go_right] without extra arithmetic. Leaves point to
+    themselves with an infinite threshold, so every tree can be advanced
+    max_depth times without checking for leaves.
+    """
+
+    def __init__(self, trees: List, leaf_values: List[np.ndarray]):
+        features, thresholds, children, values, roots = [], [], [], [], []
+        offset = 0
+        self.max_depth = 0
+
+        for tree, tree_values in zip(trees, leaf_values):
+            node_ids = np.arange(tree.node_count)
+            is_leaf = tree.children_left == -1
+            left = np.where(is_leaf, node_ids, tree.children_left) + offset
+            right = np.where(is_leaf, node_ids, tree.children_right) + offset
+
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            children.append(np.column_stack([left, right]).ravel())
+            values.append(tree_values)
+            roots.append(offset)
+
+            offset += tree.node_count
+            self.max_depth = max(self.max_depth, int(tree.max_depth))
+
+        # Per-slot copies of the node fields (both slots of a node hold the same value)
+        self.feature = np.repeat(np.concatenate(features), 2).astype(np.intp)
+        self.threshold = np.repeat(np.concatenate(thresholds), 2).astype(np.float64)
+        # children[2 * node] = left slot, children[2 * node + 1] = right slot
+        self.children = (2 * np.concatenate(children)).astype(np.intp)
+        self.values = np.concatenate(values).astype(np.float64)
+        self.root_slots = 2 * np.asarray(roots, dtype=np.intp)
+
+    @classmethod
+    def merge(cls, tables: List["FlatTrees"]) -> "FlatTrees":
+        """One node table holding the trees of several tables, so they share a traversal"""
+        merged = cls.__new__(cls)
+        slot_offsets = np.cumsum([0] + [table.feature.shape[0] for table in tables[:-1]])
+        merged.max_depth = max(table.max_depth for table in tables)
+        merged.feature = np.concatenate([table.feature for table in tables])
+        merged.threshold = np.concatenate([table.threshold for table in tables])
+        merged.children = np.concatenate([table.children + off for table, off in zip(tables, slot_offsets)])
+        merged.values = None
+        merged.root_slots = np.concatenate([table.root_slots + off for table, off in zip(tables, slot_offsets)])
+        return merged
+
+    @property
+    def n_nodes(self) -> int:
+        return self.feature.shape[0] // 2
+
+    @property
+    def n_trees(self) -> int:
+        return self.root_slots.shape[0]
+
+    def apply(self, X: np.ndarray) -> np.ndarray:
+        """Leaf node index per (sample, tree), shape [n_samples, n_trees]"""
+        # sklearn compares float32 inputs against float64 thresholds
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n_samples, n_features = X.shape
+        flat_X = X.ravel()
+
+        if n_samples == 1:
+            slots = self.root_slots
+            for _ in range(self.max_depth):
+                go_right = flat_X.take(self.feature.take(slots)) > self.threshold.take(slots)
+                slots = self.children.take(slots + go_right)
+            return (slots >> 1)[None, :]
+
+        row_offsets = (np.arange(n_samples, dtype=np.intp) * n_features)[:, None]
+        slots = np.repeat(self.root_slots[None, :], n_samples, axis=0)
+        for _ in range(self.max_depth):
+            go_right = flat_X.take(row_offsets + self.feature.take(slots)) > self.threshold.take(slots)
+            slots = self.children.take(slots + go_right)
+        return slots >> 1
+
+
+class CompiledForest:
+    """RandomForest / ExtraTrees / DecisionTree classifier"""
+
+    def __init__(self, model):
+        estimators = getattr(model, "estimators_", [model])
+        trees = [est.tree_ for est in estimators]
+
+        leaf_values = []
+        for tree in trees:
+            # Class weights of each node; predict_proba normalizes them per leaf
+            value = tree.value[:, 0, :]
+            total = value.sum(axis=1, keepdims=True)
+            leaf_values.append(np.divide(value, total, out=np.zeros_like(value), where=total > 0))
+
+        self.trees = FlatTrees(trees, leaf_values)
+        self.n_classes = leaf_values[0].shape[1]
+
+    def predict_from_leaves(self, leaves: np.ndarray) -> np.ndarray:
+        return self.trees.values[leaves].mean(axis=1)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        return self.predict_from_leaves(self.trees.apply(X))
+
+
+class CompiledGradientBoosting:
+    """GradientBoostingClassifier with a constant (prior or zero) init"""
+
+    def __init__(self, model):
+        init = model.init_
+        if not (init == "zero" or type(init).__name__ == "DummyClassifier"):
+            raise TypeError(f"Unsupported init estimator {type(init).__name__}")
+        loss = getattr(model, "loss", "log_loss")
+        if loss not in ("log_loss", "deviance", "exponential"):
+            raise TypeError(f"Unsupported loss '{loss}'")
+
+        stages = model.estimators_  # [n_stages, n_tree_classes]
+        self.n_stages, self.n_tree_classes = stages.shape
+        trees = [est.tree_ for est in stages.ravel()]
+        leaf_values = [tree.value[:, 0, 0] for tree in trees]
+
+        self.trees = FlatTrees(trees, leaf_values)
+        self.learning_rate = float(model.learning_rate)
+        self.loss = loss
+        n_features = model.n_features_in_
+        self.init_raw = np.asarray(model._raw_predict_init(np.zeros((1, n_features))), dtype=np.float64)[0]
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        return self.predict_from_leaves(self.trees.apply(X))
+
+    def predict_from_leaves(self, leaves: np.ndarray) -> np.ndarray:
+        contributions = self.trees.values[leaves].reshape(leaves.shape[0], self.n_stages, self.n_tree_classes)
+        raw = self.init_raw + self.learning_rate * contributions.sum(axis=1)
+
+        if self.n_tree_classes == 1:
+            scale = 2.0 if self.loss == "exponential" else 1.0
+            return _binary_to_proba(_expit(scale * raw[:, 0]))
+        return _softmax(raw)
+
+
+class CompiledLogistic:
+    """LogisticRegression (binary, multinomial or one-vs-rest)"""
+
+    def __init__(self, model):
+        self.coef = np.asarray(model.coef_, dtype=np.float64).T
+        self.intercept = np.asarray(model.intercept_, dtype=np.float64)
+        multi_class = getattr(model, "multi_class", "auto")
+        self.ovr = multi_class == "ovr" or model.solver == "liblinear"
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        scores = np.asarray(X, dtype=np.float64) @ self.coef + self.intercept
+        if scores.shape[1] == 1:
+            return _binary_to_proba(_expit(scores[:, 0]))
+        if self.ovr:
+            proba = _expit(scores)
+            return proba / proba.sum(axis=1, keepdims=True)
+        return _softmax(scores)
+
+
+class CompiledVoting:
+    """Soft VotingClassifier: weighted mean of member probabilities"""
+
+    def __init__(self, model):
+        if model.voting != "soft":
+            raise TypeError("Only soft voting exposes predict_proba")
+        self.members = [_compile_classifier(est) for est in model.estimators_]
+        self.weights = None if model.weights is None else np.asarray(model.weights, dtype=np.float64)
+
+        # Walk the trees of all tree-based members in a single traversal
+        tree_members = [m for m in self.members if hasattr(m, "predict_from_leaves")]
+        self.shared_trees = FlatTrees.merge([m.trees for m in tree_members]) if tree_members else None
+        self.leaf_ranges = {}
+        tree_start, node_start = 0, 0
+        for member in tree_members:
+            tree_stop = tree_start + member.trees.n_trees
+            self.leaf_ranges[id(member)] = (tree_start, tree_stop, node_start)
+            tree_start, node_start = tree_stop, node_start + member.trees.n_nodes
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        leaves = self.shared_trees.apply(X) if self.shared_trees is not None else None
+        probas = []
+        for member in self.members:
+            if id(member) in self.leaf_ranges:
+                tree_start, tree_stop, node_start = self.leaf_ranges[id(member)]
+                probas.append(member.predict_from_leaves(leaves[:, tree_start:tree_stop] - node_start))
+            else:
+                probas.append(member.predict_proba(X))
+        return np.average(np.stack(probas), axis=0, weights=self.weights)
+
+
+def _compile_classifier(model):
+    name = type(model).__name__
+    if name in ("RandomForestClassifier", "ExtraTreesClassifier", "DecisionTreeClassifier", "ExtraTreeClassifier"):
+        return CompiledForest(model)
+    if name == "GradientBoostingClassifier":
+        return CompiledGradientBoosting(model)
+    if name == "LogisticRegression":
+        return CompiledLogistic(model)
+    if name == "VotingClassifier":
+        return CompiledVoting(model)
+    raise TypeError(f"Cannot compile {name}")
+
+
+class CompiledClassifier:
+    """Drop-in replacement for the predict_proba/predict API of a fitted classifier"""
+
+    def __init__(self, model):
+        self.source_type = type(model).__name__
+        self.classes_ = np.asarray(model.classes_)
+        self.n_features_in_ = int(model.n_features_in_)
+        self.engine = _compile_classifier(model)
+
+    def predict_proba(self, X) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(f"X has {X.shape[1]} features, but {self.source_type} is expecting {self.n_features_in_} features as input.")
+        return self.engine.predict_proba(X)
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+
+class CompiledScaler:
+    """StandardScaler / RobustScaler / MinMaxScaler without sklearn's validation overhead"""
+
+    def __init__(self, scaler):
+        name = type(scaler).__name__
+        n_features = int(scaler.n_features_in_)
+        self.source_type = name
+        self.n_features_in_ = n_features
+
+        if name in ("StandardScaler", "RobustScaler"):
+            # (X - center) / scale
+            if name == "StandardScaler":
+                center = scaler.mean_ if scaler.with_mean else None
+                scale = scaler.scale_ if scaler.with_std else None
+            else:
+                center, scale = scaler.center_, scaler.scale_
+            self.center = np.zeros(n_features) if center is None else np.asarray(center, dtype=np.float64)
+            self.scale = np.ones(n_features) if scale is None else np.asarray(scale, dtype=np.float64)
+            self.multiply = False
+        elif name == "MinMaxScaler":
+            # X * scale_ + min_
+            self.center = -np.asarray(scaler.min_, dtype=np.float64)
+            self.scale = np.asarray(scaler.scale_, dtype=np.float64)
+            self.multiply = True
+        else:
+            raise TypeError(f"Cannot compile {name}")
+
+    def transform(self, X) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(f"X has {X.shape[1]} features, but {self.source_type} is expecting {self.n_features_in_} features as input.")
+        if self.multiply:
+            return X * self.scale - self.center
+        return (X - self.center) / self.scale
+
+
+def compile_model(model) -> Optional[object]:
+    """
+    Compile a fitted classifier or scaler, or return None if unsupported
+
+    Callers should keep the original object when None is returned.
+    """
+    if model is None or not hasattr(model, "n_features_in_"):
+        return None
+    try:
+        if hasattr(model, "predict_proba") and hasattr(model, "classes_"):
+            return CompiledClassifier(model)
+        if hasattr(model, "transform"):
+            return CompiledScaler(model)
+    except (TypeError, AttributeError) as e:
+        logger.info(f"Keeping sklearn {type(model).__name__}: {e}")
+    return None
+
+
+def verify_compiled(model, compiled, n_samples: int = 256, atol: float = 1e-9, seed: int = 0) -> bool:
+    """Check a compiled model against the sklearn original on random probe rows"""
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_samples, compiled.n_features_in_))
+    if isinstance(compiled, CompiledScaler):
+        expected, actual = model.transform(X), compiled.transform(X)
+    else:
+        expected, actual = model.predict_proba(X), compiled.predict_proba(X)
+    return bool(np.allclose(expected, actual, rtol=0, atol=atol))
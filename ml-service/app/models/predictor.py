@@ -3,15 +3,14 @@ Updated Predictor models - now using trained .pkl files
 """
 
 import numpy as np
-import joblib
 import os
 import logging
 from typing import Dict, List
 
-logger = logging.getLogger(__name__)
+from app.models.registry import MODEL_DIR, load_model
+from app.feature_store import feature_vector
 
-# Load trained models
-MODEL_DIR = "./models/saved"
+logger = logging.getLogger(__name__)
 
 class DropoutPredictor:
     def __init__(self):
@@ -20,9 +19,9 @@ class DropoutPredictor:
         model_path = os.path.join(MODEL_DIR, "dropout_predictor_ENSEMBLE.pkl")
         scaler_path = os.path.join(MODEL_DIR, "scaler_ENSEMBLE.pkl")
         
-        if os.path.exists(model_path):
-            self.model = joblib.load(model_path)
-            self.scaler = joblib.load(scaler_path)
+        self.model = load_model(model_path)
+        if self.model is not None:
+            self.scaler = load_model(scaler_path)
             logger.info(f"✓ Loaded ENSEMBLE dropout predictor (93.7% accuracy)")
             logger.info(f"  Model: {type(self.model).__name__}")
         else:
@@ -30,9 +29,9 @@ class DropoutPredictor:
             logger.warning(f"⚠️ Ensemble not found, using basic model")
             model_path = os.path.join(MODEL_DIR, "dropout_predictor.pkl")
             scaler_path = os.path.join(MODEL_DIR, "scaler.pkl")
-            if os.path.exists(model_path):
-                self.model = joblib.load(model_path)
-                self.scaler = joblib.load(scaler_path)
+            self.model = load_model(model_path)
+            if self.model is not None:
+                self.scaler = load_model(scaler_path)
                 logger.info(f"✓ Loaded basic dropout predictor")
             else:
                 logger.error(f"⚠️ No dropout model found")
@@ -84,27 +83,120 @@ class DropoutPredictor:
             # Get probability from trained model
             dropout_prob = self.model.predict_proba(features_scaled)[0][1]
             
-            # Determine risk level
-            risk_level = self._get_risk_level(dropout_prob)
+            return self._build_prediction(user_id, dropout_prob, days_active, engagement_metrics)
             
-            # Get interventions
-            interventions = self._get_interventions(risk_level, engagement_metrics)
+        except Exception as e:
+            logger.error(f"Error in dropout prediction: {str(e)}")
+            return self._get_fallback_prediction(user_id)
+    
+    def predict_from_features(self, user_id: str, features: Dict) -> Dict:
+        """
+        Predict dropout probability from a feature-store row (app.feature_store)
+        instead of estimating the user's history from request fields.
+        """
+        engagement_metrics = {
+            "steps": features.get("avg_steps", 5000),
+            "social": features.get("social_score", 0.5),
+            "notification_response": features.get("notification_response", 0.5)
+        }
+        try:
+            if self.model is None:
+                return self._get_fallback_prediction(user_id)
             
-            # Estimate days until dropout
-            days_until_dropout = self._estimate_days_until_dropout(dropout_prob, days_active)
+            X = [feature_vector(features)]
+            if self.scaler is not None:
+                X = self.scaler.transform(X)
+            dropout_prob = self.model.predict_proba(X)[0][1]
             
-            return {
-                "user_id": user_id,
-                "dropout_probability": round(float(dropout_prob), 3),
-                "risk_level": risk_level,
-                "recommended_interventions": interventions,
-                "days_until_predicted_dropout": days_until_dropout
-            }
+            return self._build_prediction(user_id, dropout_prob, features.get("days_active", 0), engagement_metrics)
             
         except Exception as e:
             logger.error(f"Error in dropout prediction: {str(e)}")
             return self._get_fallback_prediction(user_id)
     
+    def predict_batch(self, profiles: List[Dict]) -> List[Dict]:
+        """
+        Predict dropout probability for many users in one vectorized pass.
+        
+        Args:
+            profiles: List of dicts with user_id, days_active and engagement_metrics
+            
+        Returns:
+            One result per profile, in input order. Items whose features could
+            not be built carry an "error" key instead of a prediction.
+        """
+        results: List[Dict] = [None] * len(profiles)
+        rows = []
+        row_indices = []
+        
+        # Build one feature matrix, recording per-item failures
+        for i, profile in enumerate(profiles):
+            user_id = profile.get("user_id")
+            try:
+                features = self._create_feature_vector(
+                    profile["days_active"], profile.get("engagement_metrics", {})
+                )
+                rows.append(features)
+                row_indices.append(i)
+            except Exception as e:
+                results[i] = {"user_id": user_id, "error": str(e)}
+        
+        if not rows:
+            return results
+        
+        if self.model is None:
+            for i in row_indices:
+                results[i] = self._get_fallback_prediction(profiles[i].get("user_id"))
+            return results
+        
+        try:
+            # Scale and score the whole matrix at once
+            X = np.asarray(rows, dtype=float)
+            if self.scaler is not None:
+                X = self.scaler.transform(X)
+            dropout_probs = self.model.predict_proba(X)[:, 1]
+        except Exception as e:
+            logger.error(f"Error in batch dropout prediction: {str(e)}")
+            for i in row_indices:
+                results[i] = self._get_fallback_prediction(profiles[i].get("user_id"))
+            return results
+        
+        for i, dropout_prob in zip(row_indices, dropout_probs):
+            profile = profiles[i]
+            results[i] = self._build_prediction(
+                profile.get("user_id"),
+                dropout_prob,
+                profile["days_active"],
+                profile.get("engagement_metrics", {})
+            )
+        
+        return results
+    
+    def _build_prediction(
+        self,
+        user_id: str,
+        dropout_prob: float,
+        days_active: int,
+        engagement_metrics: Dict
+    ) -> Dict:
+        """Turn a raw dropout probability into the API response payload."""
+        # Determine risk level
+        risk_level = self._get_risk_level(dropout_prob)
+        
+        # Get interventions
+        interventions = self._get_interventions(risk_level, engagement_metrics)
+        
+        # Estimate days until dropout
+        days_until_dropout = self._estimate_days_until_dropout(dropout_prob, days_active)
+        
+        return {
+            "user_id": user_id,
+            "dropout_probability": round(float(dropout_prob), 3),
+            "risk_level": risk_level,
+            "recommended_interventions": interventions,
+            "days_until_predicted_dropout": days_until_dropout
+        }
+    
     def _create_feature_vector(self, days_active: int, engagement_metrics: Dict) -> List[float]:
         """Create feature vector in the same order as training."""
         # Calculate derived features
@@ -195,7 +287,8 @@ class DropoutPredictor:
             "dropout_probability": 0.5,
             "risk_level": "medium",
             "recommended_interventions": ["Monitor engagement closely"],
-            "days_until_predicted_dropout": 7
+            "days_until_predicted_dropout": 7,
+            "status": "fallback"
         }
 
 
@@ -205,9 +298,9 @@ class StreakPredictor:
         model_path = os.path.join(MODEL_DIR, "streak_predictor.pkl")
         scaler_path = os.path.join(MODEL_DIR, "scaler.pkl")
         
-        if os.path.exists(model_path):
-            self.model = joblib.load(model_path)
-            self.scaler = joblib.load(scaler_path)
+        self.model = load_model(model_path)
+        if self.model is not None:
+            self.scaler = load_model(scaler_path)
             logger.info(f"✓ Loaded trained streak predictor from {model_path}")
         else:
             logger.warning(f"⚠️ Trained model not found, using fallback")
@@ -240,20 +333,41 @@ class StreakPredictor:
             # Get probability of streak breaking
             break_prob = self.model.predict_proba(features_scaled)[0][1]
             
-            # Get recommendations
-            actions = self._get_streak_actions(break_prob, current_streak)
+            return self._build_prediction(user_id, break_prob, current_streak)
+            
+        except Exception as e:
+            logger.error(f"Error in streak prediction: {str(e)}")
+            return self._get_fallback_prediction(user_id, current_streak)
+    
+    def predict_from_features(self, user_id: str, features: Dict) -> Dict:
+        """
+        Predict streak break probability from a feature-store row (app.feature_store).
+        """
+        current_streak = int(features.get("current_streak", 0))
+        try:
+            if self.model is None:
+                return self._get_fallback_prediction(user_id, current_streak)
+            
+            X = [feature_vector(features)]
+            if self.scaler is not None:
+                X = self.scaler.transform(X)
+            break_prob = self.model.predict_proba(X)[0][1]
             
-            return {
-                "user_id": user_id,
-                "streak_break_probability": round(float(break_prob), 3),
-                "current_streak": current_streak,
-                "recommended_actions": actions
-            }
+            return self._build_prediction(user_id, break_prob, current_streak)
             
         except Exception as e:
             logger.error(f"Error in streak prediction: {str(e)}")
             return self._get_fallback_prediction(user_id, current_streak)
     
+    def _build_prediction(self, user_id: str, break_prob: float, current_streak: int) -> Dict:
+        """Turn a raw streak break probability into the API response payload."""
+        return {
+            "user_id": user_id,
+            "streak_break_probability": round(float(break_prob), 3),
+            "current_streak": current_streak,
+            "recommended_actions": self._get_streak_actions(break_prob, current_streak)
+        }
+    
     def _create_feature_vector(self, current_streak: int, completion_rate: float, recent_activity: float) -> List[float]:
         """Create feature vector from streak data."""
         # Estimate full feature set
@@ -315,5 +429,6 @@ class StreakPredictor:
             "user_id": user_id,
             "streak_break_probability": 0.3,
             "current_streak": streak,
-            "recommended_actions": [f"Keep your {streak}-day streak alive!"]
+            "recommended_actions": [f"Keep your {streak}-day streak alive!"],
+            "status": "fallback"
         }
@@ -8,9 +8,10 @@ import pandas as pd
 from sklearn.metrics.pairwise import cosine_similarity
 from typing import List, Dict
 import logging
-import joblib
 import os
 
+from app.models.registry import load_model
+
 logger = logging.getLogger(__name__)
 
 class ChallengeRecommender:
@@ -21,8 +22,8 @@ class ChallengeRecommender:
         features_path = "./models/saved/recommender_features.txt"
         metadata_path = "./models/saved/challenge_metadata.csv"
         
-        if os.path.exists(model_path):
-            self.model = joblib.load(model_path)
+        self.model = load_model(model_path)
+        if self.model is not None:
             logger.info(f"✓ Loaded trained recommender from {model_path}")
             
             # Load feature names
@@ -38,6 +39,9 @@ class ChallengeRecommender:
             self.challenges = self._load_challenges()  # Use mock data
             self.feature_names = []
         
+        # Challenge-side features never change per request, so build them once
+        self.challenge_features = self._create_challenge_matrix(self.challenges)
+        
         # Keep this for fallback
         self.user_challenge_matrix = self._create_user_challenge_matrix()
         
@@ -168,44 +172,60 @@ class ChallengeRecommender:
                 # Fallback to rule-based
                 return self._get_fallback_recommendations(user_features, top_n)
             
-            # Calculate ML scores for each challenge
-            scores = []
+            n_challenges = len(self.challenges)
+            top_n = min(top_n, n_challenges)
+            if top_n <= 0:
+                return []
+            
+            # Broadcast the user row against the whole catalog and score it in one call
+            user_row = self._create_user_feature_row(user_features)
+            feature_matrix = np.hstack([
+                self.challenge_features,
+                np.broadcast_to(user_row, (n_challenges, user_row.shape[0]))
+            ])
+            confidences = np.round(self.model.predict_proba(feature_matrix)[:, 1], 3)
+            
+            # Select the top N without sorting the full catalog
+            if top_n < n_challenges:
+                top_idx = np.argpartition(-confidences, top_n - 1)[:top_n]
+            else:
+                top_idx = np.arange(n_challenges)
+            # Highest confidence first, catalog order breaks ties
+            top_idx = top_idx[np.lexsort((top_idx, -confidences[top_idx]))]
             
-            for _, challenge in self.challenges.iterrows():
-                # Prepare feature vector
-                feature_vector = self._create_feature_vector(user_features, challenge)
-                
-                # Get ML prediction probability
-                confidence = self.model.predict_proba([feature_vector])[0][1]
-                
+            scores = []
+            for idx in top_idx:
+                challenge = self.challenges.iloc[idx]
+                confidence = float(confidences[idx])
                 scores.append({
                     "challenge_id": challenge["id"],
                     "challenge_name": challenge["name"],
-                    "confidence_score": round(float(confidence), 3),
+                    "confidence_score": confidence,
                     "reasoning": self._get_reasoning(challenge, user_features, confidence),
                     "difficulty_level": int(challenge["difficulty"]),
                     "estimated_completion_time": self._estimate_time(challenge)
                 })
             
-            # Sort by ML confidence and return top N
-            scores.sort(key=lambda x: x["confidence_score"], reverse=True)
-            return scores[:top_n]
+            return scores
             
         except Exception as e:
             logger.error(f"Error in get_recommendations: {str(e)}")
             return self._get_fallback_recommendations(user_features, top_n)
     
-    def _create_feature_vector(self, user_features: Dict, challenge: pd.Series) -> List[float]:
-        """Create feature vector for ML model prediction."""
-        return [
-            challenge["difficulty"],
+    def _create_challenge_matrix(self, challenges: pd.DataFrame) -> np.ndarray:
+        """Challenge-side model features, one row per catalog entry."""
+        return challenges[["difficulty"]].to_numpy(dtype=float)
+    
+    def _create_user_feature_row(self, user_features: Dict) -> np.ndarray:
+        """User-side model features, appended to every challenge row."""
+        return np.array([
             user_features.get("days_active", user_features.get("completion_rate", 0.5) * 30),
             user_features.get("avg_steps", user_features.get("completion_rate", 0.5) * 8000),
             user_features.get("meditation_streak", user_features.get("current_streaks", 0)),
             user_features.get("avg_sleep", 7.0),
             user_features.get("completion_rate", 0.5),
             user_features.get("social_score", 0.5)
-        ]
+        ], dtype=float)
     
     def _estimate_time(self, challenge: pd.Series) -> int:
         """Estimate completion time based on challenge category."""
@@ -0,0 +1,301 @@
+"""
+Model Registry
+Lazily loads model artifacts and predictors, once per process
+
+- Artifacts (.pkl, .npy, ...) are cached by absolute path, so a pickle shared by
+  several predictors (e.g. dropout_predictor_ENSEMBLE.pkl used by DropoutPredictor,
+  the hybrid quantum model and AIMotivationEngine) is only unpickled once.
+- Predictors are registered by import path and constructed on first use, so
+  importing the service never pulls in sklearn pickles or PennyLane.
+- warm_up() and status() back the service readiness endpoint.
+- model_version() fingerprints the files a predictor is built from, so caches
+  can key responses on the model that produced them.
+- With ML_MMAP_MODELS=1, pickles exported by export_mmap_models.py are loaded
+  with mmap_mode='r' so their NumPy arrays live in the shared page cache.
+- load_model() compiles classifiers and scalers into flat NumPy engines
+  (app.models.compiled) after checking them against the sklearn originals;
+  set ML_COMPILED_MODELS=0 to serve the sklearn objects directly.
+"""
+import hashlib
+import importlib
+import os
+import threading
+import time
+import logging
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import joblib
+
+logger = logging.getLogger(__name__)
+
+MODEL_DIR = "./models/saved"
+
+# Uncompressed copies of the pickles, written by export_mmap_models.py
+MMAP_SUBDIR = "mmap"
+
+# Suffix of compiled exports next to the mmap copies, e.g. mmap/scaler.compiled.pkl
+COMPILED_SUFFIX = ".compiled.pkl"
+
+# Predictors the ML service knows how to build: name -> (import path, kwargs)
+SERVICE_MODELS = {
+    "recommender": ("app.models.recommender:ChallengeRecommender", {}),
+    "dropout": ("app.models.predictor:DropoutPredictor", {}),
+    "streak": ("app.models.predictor:StreakPredictor", {}),
+    "motivation_engine": ("app.models.ai_engine:AIMotivationEngine", {}),
+    "quantum_dropout": ("app.quantum.hybrid_model:QuantumEnhancedDropoutPredictor", {"n_qubits": 4}),
+}
+
+# Files each predictor reads from model_dir, used for model_version()
+MODEL_ARTIFACTS = {
+    "recommender": ["challenge_recommender.pkl", "recommender_features.txt", "challenge_metadata.csv"],
+    "dropout": ["dropout_predictor_ENSEMBLE.pkl", "scaler_ENSEMBLE.pkl", "dropout_predictor.pkl", "scaler.pkl",
+                "feature_names.txt"],
+    "streak": ["streak_predictor.pkl", "scaler.pkl"],
+    "quantum_dropout": ["quantum_weights.npy", "quantum_norm_params.json", "dropout_predictor_ENSEMBLE.pkl"],
+    "motivation_engine": ["dropout_predictor_ENSEMBLE.pkl", "scaler_ENSEMBLE.pkl", "streak_predictor.pkl",
+                          "streak_scaler.pkl", "engagement_classifier.pkl", "engagement_scaler.pkl",
+                          "engagement_label_encoder.pkl", "challenge_recommender.pkl", "tone_selector.pkl",
+                          "tone_scaler.pkl", "tone_label_encoder.pkl", "difficulty_predictor.pkl",
+                          "difficulty_scaler.pkl"],
+}
+# The engine's insights sections come from the dropout, streak and recommender predictors
+MODEL_ARTIFACTS["motivation_engine"] = list(dict.fromkeys(
+    MODEL_ARTIFACTS["motivation_engine"]
+    + [filename for name in ("dropout", "streak", "recommender") for filename in MODEL_ARTIFACTS[name]]
+))
+
+
+class ModelUnavailableError(RuntimeError):
+    """Raised when a registered model cannot be constructed"""
+
+
+class ModelRegistry:
+    def __init__(self, model_dir: str = MODEL_DIR, mmap: Optional[bool] = None, compiled: Optional[bool] = None):
+        self.model_dir = model_dir
+        if mmap is None:
+            mmap = os.getenv("ML_MMAP_MODELS", "0").lower() in ("1", "true", "yes")
+        if compiled is None:
+            compiled = os.getenv("ML_COMPILED_MODELS", "1").lower() in ("1", "true", "yes")
+        self.mmap = mmap
+        self.compiled = compiled
+        self._artifacts: Dict[str, Any] = {}
+        self._compiled: Dict[str, Any] = {}
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._models: Dict[str, Any] = {}
+        self._errors: Dict[str, str] = {}
+        self._load_times: Dict[str, float] = {}
+        self._model_artifacts: Dict[str, list] = {}
+        self._versions: Dict[str, str] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.warmed_up = False
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def artifact_path(self, filename: str) -> str:
+        """Absolute path of an artifact, relative names resolve against model_dir"""
+        path = filename if os.path.isabs(filename) or os.path.dirname(filename) else os.path.join(self.model_dir, filename)
+        return os.path.abspath(path)
+
+    def mmap_path(self, path: str) -> str:
+        """Location of the uncompressed export of an artifact"""
+        return os.path.join(os.path.dirname(path), MMAP_SUBDIR, os.path.basename(path))
+
+    def compiled_path(self, path: str) -> str:
+        """Location of the compiled export of a model artifact"""
+        return os.path.splitext(self.mmap_path(path))[0] + COMPILED_SUFFIX
+
+    def load_artifact(self, filename: str, loader: Callable[[str], Any] = joblib.load) -> Optional[Any]:
+        """
+        Load an artifact once and share it with every caller.
+
+        Returns None if the file does not exist, matching the fallback
+        behaviour of the predictors.
+        """
+        path = self.artifact_path(filename)
+        if path in self._artifacts:
+            return self._artifacts[path]
+
+        with self._key_lock(path):
+            if path in self._artifacts:
+                return self._artifacts[path]
+
+            mmap_path = self.mmap_path(path)
+            use_mmap = self.mmap and loader is joblib.load and os.path.exists(mmap_path)
+            if not use_mmap and not os.path.exists(path):
+                return None
+
+            start = time.perf_counter()
+            if use_mmap:
+                artifact = joblib.load(mmap_path, mmap_mode='r')
+            else:
+                artifact = loader(path)
+            self._load_times[path] = time.perf_counter() - start
+            self._artifacts[path] = artifact
+            logger.info(f"✓ Loaded artifact {os.path.basename(path)} ({self._load_times[path] * 1000:.0f} ms)")
+            return artifact
+
+    def load_model(self, filename: str) -> Optional[Any]:
+        """
+        Load a classifier or scaler, compiled for fast inference when possible.
+
+        Unsupported models, and compiled models that disagree with sklearn on
+        the probe rows, are returned as the original sklearn object.
+        """
+        if not self.compiled:
+            return self.load_artifact(filename)
+
+        path = self.artifact_path(filename)
+        if path in self._compiled:
+            return self._compiled[path]
+
+        with self._key_lock(f"compiled:{path}"):
+            if path in self._compiled:
+                return self._compiled[path]
+
+            from app.models.compiled import compile_model, verify_compiled
+
+            compiled_path = self.compiled_path(path)
+            start = time.perf_counter()
+            if self.mmap and os.path.exists(compiled_path):
+                # Verified by export_mmap_models.py when it was written
+                model = joblib.load(compiled_path, mmap_mode='r')
+            else:
+                original = self.load_artifact(path)
+                if original is None:
+                    return None
+                model = compile_model(original)
+                if model is None:
+                    model = original
+                elif not verify_compiled(original, model):
+                    logger.warning(f"⚠️  Compiled {os.path.basename(path)} does not match sklearn, keeping original")
+                    model = original
+                else:
+                    logger.info(f"✓ Compiled {os.path.basename(path)} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+            self._compiled[path] = model
+            return model
+
+    def register(self, name: str, target, artifacts: Iterable[str] = (), **kwargs):
+        """
+        Register a predictor factory.
+
+        Args:
+            name: Registry key
+            target: Class/callable, or "module:attr" import path resolved on first use
+            artifacts: Files the predictor is built from, fingerprinted by model_version()
+            kwargs: Constructor arguments
+        """
+        def factory():
+            cls = target
+            if isinstance(target, str):
+                module_name, attr = target.split(":")
+                cls = getattr(importlib.import_module(module_name), attr)
+            return cls(**kwargs)
+
+        with self._lock:
+            self._factories[name] = factory
+            self._model_artifacts[name] = list(artifacts)
+            self._versions.pop(name, None)
+            self._models.pop(name, None)
+            self._errors.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """Return the predictor, constructing it on first use"""
+        if name in self._models:
+            return self._models[name]
+        if name not in self._factories:
+            raise ModelUnavailableError(f"Model '{name}' is not registered")
+        if name in self._errors:
+            raise ModelUnavailableError(f"Model '{name}' failed to load: {self._errors[name]}")
+
+        with self._key_lock(f"model:{name}"):
+            if name in self._models:
+                return self._models[name]
+            start = time.perf_counter()
+            try:
+                model = self._factories[name]()
+            except Exception as e:
+                self._errors[name] = str(e)
+                logger.warning(f"⚠️  Model '{name}' unavailable: {e}")
+                raise ModelUnavailableError(f"Model '{name}' failed to load: {e}") from e
+            self._load_times[f"model:{name}"] = time.perf_counter() - start
+            self._models[name] = model
+            return model
+
+    def model_version(self, name: str) -> str:
+        """
+        Short fingerprint (name, size, mtime) of a predictor's artifact files.
+
+        Computed once per process, like the models themselves, so it changes
+        when a retrained model is deployed and the service restarts.
+        """
+        if name not in self._versions:
+            digest = hashlib.sha1(name.encode())
+            for filename in self._model_artifacts.get(name, []):
+                path = self.artifact_path(filename)
+                if os.path.exists(path):
+                    stat = os.stat(path)
+                    digest.update(f"|{filename}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+            self._versions[name] = digest.hexdigest()[:12]
+        return self._versions[name]
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def warm_up(self, names: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+        """Eagerly construct models; failures are recorded, not raised"""
+        results = {}
+        for name in (names if names is not None else list(self._factories)):
+            try:
+                self.get(name)
+                results[name] = True
+            except ModelUnavailableError:
+                results[name] = False
+        self.warmed_up = True
+        return results
+
+    def status(self) -> Dict:
+        return {
+            "warmed_up": self.warmed_up,
+            "mmap": self.mmap,
+            "compiled": sorted(
+                os.path.basename(path) for path, model in self._compiled.items()
+                if type(model).__module__ == "app.models.compiled"
+            ),
+            "models": {
+                name: "loaded" if name in self._models else "failed" if name in self._errors else "not_loaded"
+                for name in self._factories
+            },
+            "errors": dict(self._errors),
+            "artifacts": {
+                os.path.basename(path): round(self._load_times.get(path, 0.0) * 1000, 1)
+                for path in self._artifacts
+            }
+        }
+
+
+def create_service_registry(model_dir: str = MODEL_DIR, mmap: Optional[bool] = None,
+                            compiled: Optional[bool] = None) -> ModelRegistry:
+    registry = ModelRegistry(model_dir, mmap=mmap, compiled=compiled)
+    for name, (target, kwargs) in SERVICE_MODELS.items():
+        registry.register(name, target, artifacts=MODEL_ARTIFACTS.get(name, ()), **kwargs)
+    return registry
+
+
+# Process-wide registry shared by the predictors and the API
+model_registry = create_service_registry()
+
+
+def load_artifact(filename: str, loader: Callable[[str], Any] = joblib.load) -> Optional[Any]:
+    return model_registry.load_artifact(filename, loader)
+
+
+def load_model(filename: str) -> Optional[Any]:
+    return model_registry.load_model(filename)
+
+
+def get_model(name: str) -> Any:
+    """Module-level accessor, picklable for process-pool workers"""
+    return model_registry.get(name)
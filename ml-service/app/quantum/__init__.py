@@ -1,10 +1,23 @@
 """Quantum ML package initialization"""
-from .quantum_circuit import QuantumPatternRecognition, quantum_kernel
-from .hybrid_model import QuantumEnhancedDropoutPredictor, QuantumSupportVectorMachine
+from .statevector import StatevectorQuantumCircuit
+from .kernel import QuantumKernelEngine
+from .hybrid_model import QuantumEnhancedDropoutPredictor, QuantumSupportVectorMachine, create_quantum_circuit
 
 __all__ = [
     'QuantumPatternRecognition',
     'quantum_kernel',
+    'StatevectorQuantumCircuit',
+    'QuantumKernelEngine',
+    'create_quantum_circuit',
     'QuantumEnhancedDropoutPredictor',
     'QuantumSupportVectorMachine'
 ]
+
+
+def __getattr__(name):
+    # PennyLane-backed names are imported on first access so the NumPy
+    # backend can run without pennylane/qiskit installed
+    if name in ('QuantumPatternRecognition', 'quantum_kernel'):
+        from . import quantum_circuit
+        return getattr(quantum_circuit, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
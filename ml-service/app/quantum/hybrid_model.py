@@ -3,30 +3,98 @@ Hybrid Quantum-Classical Dropout Predictor
 Combines quantum feature processing with classical ML
 """
 import numpy as np
-import joblib
 import logging
 import os
-from typing import Dict
-from .quantum_circuit import QuantumPatternRecognition, quantum_kernel
+from typing import Dict, Optional, Sequence, Tuple
+from .statevector import StatevectorQuantumCircuit
+from .kernel import NystromFeatureMap, QuantumKernelEngine
+from app.models.registry import load_model
 
 logger = logging.getLogger(__name__)
 
+QUANTUM_BACKENDS = ("pennylane", "numpy")
+
+# Response buckets: risk_level cutoffs (checked high first) and the high/low label boundary
+RISK_LEVELS = ((0.7, "high"), (0.4, "medium"))
+DECISION_THRESHOLD = 0.5
+RISK_THRESHOLDS = tuple(sorted({threshold for threshold, _ in RISK_LEVELS} | {DECISION_THRESHOLD}))
+
+# Cascade: encodable inputs sampled per qubit to find the circuit's output range
+QUANTUM_RANGE_GRID = 17
+
+
+def risk_level(probability: float) -> str:
+    """low / medium / high bucket of a dropout probability"""
+    for threshold, level in RISK_LEVELS:
+        if probability > threshold:
+            return level
+    return "low"
+
+
+def quantum_range_margin(n_qubits: int, grid: int = QUANTUM_RANGE_GRID) -> float:
+    """
+    Bound on how far the circuit's probability can go past its extremes on the grid
+    
+    Inputs x in [0, 1] are encoded as RY(pi * x), so neighbouring grid nodes are
+    h = pi / (grid - 1) apart in every angle. <Z0> is <psi(theta)| O |psi(theta)>
+    with ||O|| = 1 and generators Y/2, so by the parameter-shift rule every
+    second derivative d2<Z0>/dtheta_i dtheta_j is the expectation of a double
+    commutator of norm <= 1. At an extremum, the gradient vanishes along the
+    smallest face of the input box that contains it, and that face holds a grid
+    node within h/2 in each free angle; Taylor's theorem then bounds the gap in
+    <Z0> by (n_qubits * h / 2)^2 / 2, half that in probability (<Z0> + 1) / 2.
+    """
+    step = np.pi / (grid - 1)
+    return (n_qubits * step / 2) ** 2 / 4
+
+
+def create_quantum_circuit(n_qubits: int = 4, n_layers: int = 3, backend: Optional[str] = None):
+    """
+    Build the dropout classifier circuit on the requested simulator backend.
+
+    "pennylane" runs the circuit on default.qubit; "numpy" uses the closed-form
+    statevector simulator and never imports PennyLane. Defaults to the
+    QUANTUM_BACKEND environment variable (pennylane if unset).
+    """
+    backend = backend or os.getenv("QUANTUM_BACKEND", "pennylane")
+    if backend == "numpy":
+        return StatevectorQuantumCircuit(n_qubits=n_qubits, n_layers=n_layers)
+    if backend == "pennylane":
+        from .quantum_circuit import QuantumPatternRecognition
+        return QuantumPatternRecognition(n_qubits=n_qubits, n_layers=n_layers)
+    raise ValueError(f"Unknown quantum backend '{backend}' (expected one of {QUANTUM_BACKENDS})")
+
 class QuantumEnhancedDropoutPredictor:
     """
     Hybrid model: Quantum circuit for feature extraction + Classical ensemble
+    
+    Cascade mode runs the classical ensemble first. The quantum probability of
+    the loaded weights always lies in quantum_range (grid extremes widened by
+    quantum_range_margin), so the blend alpha * classical + beta * quantum is
+    confined to an interval; when no risk threshold falls inside it, the risk
+    bucket is already decided and the circuit is skipped. Such responses carry
+    that interval and its bucket instead of a probability.
     """
     
-    def __init__(self, n_qubits: int = 4):
+    def __init__(self, n_qubits: int = 4, backend: Optional[str] = None, cascade: Optional[bool] = None,
+                 cascade_thresholds: Optional[Sequence[float]] = None):
         """
         Initialize hybrid quantum-classical model
         
         Args:
             n_qubits: Number of qubits for quantum circuit
+            backend: Simulator backend ("pennylane" or "numpy"), see create_quantum_circuit
+            cascade: Skip the circuit when it cannot change the risk bucket.
+                     Defaults to the QUANTUM_CASCADE environment variable (off if unset)
+            cascade_thresholds: Extra probability cutoffs the caller reads from the result
+                                (or QUANTUM_CASCADE_THRESHOLDS="0.6,0.8"); RISK_THRESHOLDS
+                                are always included, since skipped responses report the bucket
         """
         self.n_qubits = n_qubits
+        self.n_layers = 3
         
         # Quantum component
-        self.quantum_circuit = QuantumPatternRecognition(n_qubits=n_qubits, n_layers=3)
+        self.quantum_circuit = create_quantum_circuit(n_qubits=n_qubits, n_layers=self.n_layers, backend=backend)
         
         # Try to load trained quantum weights
         try:
@@ -55,10 +123,12 @@ class QuantumEnhancedDropoutPredictor:
         
         # Classical component (load trained model)
         try:
-            self.classical_model = joblib.load('./models/saved/dropout_predictor_ENSEMBLE.pkl')
-            logger.info("✅ Loaded classical dropout ensemble")
-        except:
+            self.classical_model = load_model('./models/saved/dropout_predictor_ENSEMBLE.pkl')
+        except Exception:
             self.classical_model = None
+        if self.classical_model is not None:
+            logger.info("✅ Loaded classical dropout ensemble")
+        else:
             logger.warning("⚠️  Classical model not found, using quantum only")
         
         # Dynamic weighting: If quantum is trained, give it more weight
@@ -71,7 +141,51 @@ class QuantumEnhancedDropoutPredictor:
             self.beta = 0.3   # 30% quantum (untrained)
             logger.info("📊 Using classical-heavy mode (quantum untrained)")
         
-        logger.info(f"✅ Hybrid Quantum-Classical model initialized ({n_qubits} qubits)")
+        if cascade is None:
+            cascade = os.getenv("QUANTUM_CASCADE", "0").lower() in ("1", "true", "yes")
+        if cascade_thresholds is None:
+            env_thresholds = os.getenv("QUANTUM_CASCADE_THRESHOLDS")
+            cascade_thresholds = [float(t) for t in env_thresholds.split(",")] if env_thresholds else ()
+        self.cascade = cascade
+        self.cascade_thresholds = tuple(sorted(set(cascade_thresholds) | set(RISK_THRESHOLDS)))
+        self.quantum_range = self.calibrate_quantum_range() if cascade else (0.0, 1.0)
+        
+        mode = f", cascade over thresholds {self.cascade_thresholds}" if cascade else ""
+        logger.info(f"✅ Hybrid Quantum-Classical model initialized ({n_qubits} qubits{mode})")
+    
+    def calibrate_quantum_range(self) -> Tuple[float, float]:
+        """
+        Range of quantum probabilities the current weights can produce
+        
+        predict() encodes min-max normalized features, so the circuit only ever
+        sees inputs in [0, 1]^n_qubits. The range is taken over a grid of those
+        inputs (NumPy statevector, whatever the serving backend) and widened by
+        quantum_range_margin for points between grid nodes.
+        """
+        simulator = StatevectorQuantumCircuit(n_qubits=self.n_qubits, n_layers=self.n_layers)
+        simulator.weights = np.asarray(self.quantum_circuit.weights, dtype=float)
+        
+        axis = np.linspace(0.0, 1.0, QUANTUM_RANGE_GRID)
+        low, high = 1.0, 0.0
+        # One slab of the grid (fixed first qubit value) at a time
+        for first in axis:
+            grid = np.meshgrid([first], *([axis] * (self.n_qubits - 1)), indexing='ij')
+            probs = (simulator.expectations(np.stack(grid, axis=-1).reshape(-1, self.n_qubits)) + 1) / 2
+            low, high = min(low, probs.min()), max(high, probs.max())
+        
+        margin = quantum_range_margin(self.n_qubits)
+        self.quantum_range = (max(0.0, low - margin), min(1.0, high + margin))
+        return self.quantum_range
+    
+    def _blend_range(self, classical_prob: float) -> Tuple[float, float]:
+        """Interval [low, high] holding every blend the quantum term can produce"""
+        return (self.alpha * classical_prob + self.beta * self.quantum_range[0],
+                self.alpha * classical_prob + self.beta * self.quantum_range[1])
+    
+    def _quantum_can_change_bucket(self, classical_prob: float) -> bool:
+        """True if some threshold t has low <= t < high for the possible blends [low, high]"""
+        low, high = self._blend_range(classical_prob)
+        return any(low <= threshold < high for threshold in self.cascade_thresholds)
     
     def predict(self, features: Dict) -> Dict:
         """
@@ -81,30 +195,45 @@ class QuantumEnhancedDropoutPredictor:
             features: User feature dictionary
             
         Returns:
-            Prediction with quantum and classical components
+            Prediction with quantum and classical components. When the cascade
+            skips the circuit there is no dropout_probability, confidence or
+            quantum_component; dropout_probability_range holds the interval the
+            blend is confined to, and prediction / risk_level hold its bucket.
         """
         # Extract feature vector
         feature_vec = self._prepare_features(features)
         
-        # Quantum prediction
-        quantum_prob = self.quantum_circuit.predict(feature_vec)
-        
-        # Classical prediction
+        # Classical prediction (cheap, always first)
         if self.classical_model:
             classical_prob = float(self.classical_model.predict_proba([feature_vec])[0][1])
         else:
             classical_prob = 0.5
         
-        # Hybrid combination
-        hybrid_prob = self.alpha * classical_prob + self.beta * quantum_prob
+        weights = {"classical": self.alpha, "quantum": self.beta}
         
+        if self.cascade and not self._quantum_can_change_bucket(classical_prob):
+            # No threshold inside the interval, so every point of it has the same bucket
+            low, high = self._blend_range(classical_prob)
+            return {
+                "dropout_probability_range": [low, high],
+                "classical_component": classical_prob,
+                "hybrid_weights": weights,
+                "prediction": "high_risk" if low > DECISION_THRESHOLD else "low_risk",
+                "risk_level": risk_level(low),
+                "inference_path": "classical_only"
+            }
+        
+        quantum_prob = self.quantum_circuit.predict(feature_vec)
+        hybrid_prob = self.alpha * classical_prob + self.beta * quantum_prob
         return {
             "dropout_probability": hybrid_prob,
             "quantum_component": quantum_prob,
             "classical_component": classical_prob,
-            "hybrid_weights": {"classical": self.alpha, "quantum": self.beta},
-            "prediction": "high_risk" if hybrid_prob > 0.5 else "low_risk",
-            "confidence": abs(hybrid_prob - 0.5) * 2  # 0 to 1 scale
+            "hybrid_weights": weights,
+            "prediction": "high_risk" if hybrid_prob > DECISION_THRESHOLD else "low_risk",
+            "risk_level": risk_level(hybrid_prob),
+            "confidence": abs(hybrid_prob - 0.5) * 2,  # 0 to 1 scale
+            "inference_path": "hybrid"
         }
     
     def quantum_feature_extraction(self, features: np.ndarray) -> np.ndarray:
@@ -117,21 +246,11 @@ class QuantumEnhancedDropoutPredictor:
         Returns:
             Quantum-transformed features
         """
-        quantum_features = []
-        
         # Use quantum kernel to compare with different basis states
-        basis_states = [
-            np.array([1, 0, 0, 0]),
-            np.array([0, 1, 0, 0]),
-            np.array([0, 0, 1, 0]),
-            np.array([0, 0, 0, 1])
-        ]
+        basis_states = np.eye(4)
         
-        for basis in basis_states:
-            kernel_val = quantum_kernel(features[:4], basis, self.n_qubits)
-            quantum_features.append(kernel_val)
-        
-        return np.array(quantum_features)
+        kernel_engine = QuantumKernelEngine(n_qubits=self.n_qubits)
+        return kernel_engine.gram(np.asarray(features)[:4], basis_states)[0]
     
     def _prepare_features(self, features: Dict) -> np.ndarray:
         """Convert feature dict to numpy array (15 features for ensemble model)"""
@@ -164,22 +283,59 @@ class QuantumEnhancedDropoutPredictor:
                 "classical_weight": self.alpha,
                 "quantum_weight": self.beta
             },
-            "total_parameters": circuit_info["n_parameters"]
+            "total_parameters": circuit_info["n_parameters"],
+            "cascade": {
+                "enabled": self.cascade,
+                "thresholds": list(self.cascade_thresholds),
+                "quantum_range": [round(float(v), 4) for v in self.quantum_range]
+            }
         }
 
 
 class QuantumSupportVectorMachine:
     """
     Quantum Support Vector Machine using quantum kernel
+
+    fit() solves the soft-margin SVM dual (sklearn's libsvm solver) on the
+    precomputed quantum Gram matrix and keeps only the support vectors, i.e.
+    the training points with non-zero alpha. predict() evaluates the kernel
+    against that support set only, and save() persists just the support set.
+    
+    With n_landmarks set (Nystrom mode), fit() instead maps the data through
+    a NystromFeatureMap of m landmark users and trains a linear SVM on the
+    explicit features: O(N m) kernel evaluations to train and m per query,
+    so it scales to the full user base. See kernel.nystrom_report for the
+    approximation error at each m.
     """
     
-    def __init__(self, n_qubits: int = 4):
+    def __init__(self, n_qubits: int = 4, kernel_chunk_size: Optional[int] = None, C: float = 1.0,
+                 n_landmarks: Optional[int] = None, random_state: int = 42):
+        """
+        Args:
+            n_qubits: Number of qubits (leading features that get encoded)
+            kernel_chunk_size: Rows per Gram matrix block, see QuantumKernelEngine
+            C: Soft-margin penalty of the dual problem
+            n_landmarks: Number of Nystrom landmarks m; None solves the exact dual
+            random_state: Seed for landmark sampling
+        """
         self.n_qubits = n_qubits
+        self.C = C
+        self.n_landmarks = n_landmarks
+        self.random_state = random_state
+        self.kernel_engine = QuantumKernelEngine(n_qubits=n_qubits, chunk_size=kernel_chunk_size)
         self.support_vectors = None
         self.support_labels = None
         self.alphas = None
+        self.dual_coef = None  # alpha_i * y_i (y in {-1, +1}) per support vector
+        self.intercept = 0.0
+        self.classes = None
+        self.n_training_samples = 0
+        # Nystrom mode: decision = K(X, landmarks) @ landmark_weights + intercept
+        self.landmarks = None
+        self.landmark_weights = None
         
-        logger.info(f"✅ Quantum SVM initialized ({n_qubits} qubits)")
+        mode = f"Nystrom, {n_landmarks} landmarks" if n_landmarks else "exact dual"
+        logger.info(f"✅ Quantum SVM initialized ({n_qubits} qubits, {mode})")
     
     def quantum_kernel_matrix(self, X1: np.ndarray, X2: np.ndarray) -> np.ndarray:
         """
@@ -191,27 +347,71 @@ class QuantumSupportVectorMachine:
         Returns:
             Kernel matrix
         """
-        K = np.zeros((len(X1), len(X2)))
-        
-        for i, x1 in enumerate(X1):
-            for j, x2 in enumerate(X2):
-                K[i, j] = quantum_kernel(x1, x2, self.n_qubits)
-        
-        return K
+        return self.kernel_engine.gram(X1, X2)
     
     def fit(self, X: np.ndarray, y: np.ndarray):
         """
-        Fit QSVM (simplified - stores all points as support vectors)
+        Fit QSVM by solving the dual on the precomputed quantum Gram matrix
         
         Args:
             X: Training features
-            y: Training labels
+            y: Training labels (two classes)
         """
-        self.support_vectors = X
-        self.support_labels = y
-        self.alphas = np.ones(len(y)) / len(y)  # Simplified
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y)
+        classes = np.unique(y)
+        if len(classes) != 2:
+            raise ValueError(f"QSVM needs exactly two classes, got {len(classes)}")
+        
+        if self.n_landmarks:
+            return self._fit_nystrom(X, y)
+        
+        from sklearn.svm import SVC
+        
+        gram = self.quantum_kernel_matrix(X, X)
+        svc = SVC(C=self.C, kernel='precomputed').fit(gram, y)
+        
+        # Keep only the non-zero-alpha points
+        support = svc.support_
+        self.support_vectors = X[support]
+        self.support_labels = y[support]
+        self.dual_coef = svc.dual_coef_[0].copy()
+        self.alphas = np.abs(self.dual_coef)
+        self.intercept = float(svc.intercept_[0])
+        self.classes = svc.classes_
+        self.n_training_samples = len(X)
         
-        logger.info(f"QSVM fitted with {len(X)} support vectors")
+        logger.info(f"QSVM fitted with {len(support)} support vectors "
+                    f"({len(support) / len(X):.1%} of {len(X)} training points)")
+        return self
+    
+    def _fit_nystrom(self, X: np.ndarray, y: np.ndarray):
+        """Linear SVM on the Nystrom features of the quantum kernel"""
+        from sklearn.svm import LinearSVC
+        
+        feature_map = NystromFeatureMap(self.kernel_engine, self.n_landmarks, self.random_state).fit(X)
+        clf = LinearSVC(C=self.C).fit(feature_map.transform(X), y)
+        
+        # Fold the feature map into the weights: phi(X) @ w = K(X, L) @ (normalization.T @ w)
+        self.landmarks = feature_map.landmarks
+        self.landmark_weights = feature_map.normalization.T @ clf.coef_[0]
+        self.intercept = float(clf.intercept_[0])
+        self.classes = clf.classes_
+        self.n_training_samples = len(X)
+        
+        logger.info(f"QSVM (Nystrom) fitted with {len(self.landmarks)} landmarks on {len(X)} training points")
+        return self
+    
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        """Signed distance to the margin; positive means classes[1]"""
+        if self.landmarks is not None:
+            return self.quantum_kernel_matrix(X, self.landmarks) @ self.landmark_weights + self.intercept
+        if self.support_vectors is None:
+            raise ValueError("Model not fitted")
+        
+        # Kernel between test points and the support set only
+        K = self.quantum_kernel_matrix(X, self.support_vectors)
+        return K @ self.dual_coef + self.intercept
     
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
@@ -223,16 +423,59 @@ class QuantumSupportVectorMachine:
         Returns:
             Predictions
         """
+        decision = self.decision_function(X)
+        return self.classes[(decision > 0).astype(int)]
+    
+    def save(self, path: str):
+        """Persist the support set and dual coefficients, or the landmarks and their weights (.npz)"""
+        if self.landmarks is not None:
+            np.savez_compressed(
+                path,
+                landmarks=self.landmarks,
+                landmark_weights=self.landmark_weights,
+                intercept=self.intercept,
+                classes=self.classes,
+                n_qubits=self.n_qubits,
+                C=self.C,
+                n_training_samples=self.n_training_samples,
+            )
+            return
         if self.support_vectors is None:
             raise ValueError("Model not fitted")
-        
-        # Compute kernel between test and support vectors
-        K = self.quantum_kernel_matrix(X, self.support_vectors)
-        
-        # Decision function
-        decision = np.dot(K, self.alphas * self.support_labels)
-        
-        return (decision > 0).astype(int)
+        np.savez_compressed(
+            path,
+            support_vectors=self.support_vectors,
+            support_labels=self.support_labels,
+            dual_coef=self.dual_coef,
+            intercept=self.intercept,
+            classes=self.classes,
+            n_qubits=self.n_qubits,
+            C=self.C,
+            n_training_samples=self.n_training_samples,
+        )
+    
+    @classmethod
+    def load(cls, path: str, kernel_chunk_size: Optional[int] = None) -> "QuantumSupportVectorMachine":
+        """Load a model written by save()"""
+        with np.load(path, allow_pickle=False) as data:
+            if "landmarks" in data:
+                model = cls(n_qubits=int(data["n_qubits"]), kernel_chunk_size=kernel_chunk_size,
+                            C=float(data["C"]), n_landmarks=len(data["landmarks"]))
+                model.landmarks = data["landmarks"]
+                model.landmark_weights = data["landmark_weights"]
+                model.intercept = float(data["intercept"])
+                model.classes = data["classes"]
+                model.n_training_samples = int(data["n_training_samples"])
+                return model
+            model = cls(n_qubits=int(data["n_qubits"]), kernel_chunk_size=kernel_chunk_size, C=float(data["C"]))
+            model.support_vectors = data["support_vectors"]
+            model.support_labels = data["support_labels"]
+            model.dual_coef = data["dual_coef"]
+            model.alphas = np.abs(model.dual_coef)
+            model.intercept = float(data["intercept"])
+            model.classes = data["classes"]
+            model.n_training_samples = int(data["n_training_samples"])
+        return model
 
 
 if __name__ == "__main__":
@@ -255,11 +498,17 @@ if __name__ == "__main__":
     prediction = hybrid_model.predict(test_user)
     
     print("\n📊 Hybrid Prediction Results:")
-    print(f"   Dropout Probability: {prediction['dropout_probability']:.3f}")
-    print(f"   Quantum Component:   {prediction['quantum_component']:.3f}")
+    if prediction['inference_path'] == 'hybrid':
+        print(f"   Dropout Probability: {prediction['dropout_probability']:.3f}")
+        print(f"   Quantum Component:   {prediction['quantum_component']:.3f}")
+    else:
+        low, high = prediction['dropout_probability_range']
+        print(f"   Dropout Probability: {low:.3f} - {high:.3f}")
+        print("   Quantum Component:   skipped (cascade)")
     print(f"   Classical Component: {prediction['classical_component']:.3f}")
-    print(f"   Prediction:          {prediction['prediction']}")
-    print(f"   Confidence:          {prediction['confidence']:.3f}")
+    print(f"   Prediction:          {prediction['prediction']} ({prediction['risk_level']} risk)")
+    if 'confidence' in prediction:
+        print(f"   Confidence:          {prediction['confidence']:.3f}")
     
     # Get model info
     info = hybrid_model.get_quantum_info()
@@ -5,6 +5,7 @@ Uses PennyLane for quantum feature encoding and classification
 import pennylane as qml
 from pennylane import numpy as np
 import matplotlib.pyplot as plt
+from functools import lru_cache, partial
 from typing import List, Tuple
 import logging
 
@@ -30,19 +31,33 @@ class QuantumPatternRecognition:
         # Create quantum device
         self.dev = qml.device('default.qubit', wires=n_qubits)
         
-        # Initialize weights randomly
+        # Build the QNode once; every prediction reuses it
+        self.qnode = qml.QNode(self.circuit, self.dev)
+        
+        # Initialize weights randomly (setter binds them to the QNode)
         self.weights = np.random.randn(n_layers, n_qubits, 3, requires_grad=True)
         
         logger.info(f"✅ Quantum circuit initialized: {n_qubits} qubits, {n_layers} layers")
     
+    @property
+    def weights(self):
+        return self._weights
+    
+    @weights.setter
+    def weights(self, weights):
+        """Store weights and bind them to the cached QNode."""
+        self._weights = weights
+        self._bound_qnode = partial(self.qnode, weights=weights)
+    
     def feature_encoding(self, features: np.ndarray):
         """
         Encode classical features into quantum state using angle encoding
         
         Args:
-            features: Classical feature vector (length = n_qubits)
+            features: Classical feature vector (length = n_qubits), or a
+                      [batch, n_features] matrix for parameter broadcasting
         """
-        for i, feature in enumerate(features[:self.n_qubits]):
+        for i, feature in enumerate(features.T[:self.n_qubits]):
             qml.RY(feature * np.pi, wires=i)
     
     def variational_layer(self, weights):
@@ -62,6 +77,28 @@ class QuantumPatternRecognition:
         for i in range(self.n_qubits):
             qml.CNOT(wires=[i, (i + 1) % self.n_qubits])
     
+    def circuit(self, features, weights):
+        """
+        Full classifier circuit: angle encoding + variational layers
+        
+        Args:
+            features: Normalized features, single vector or [batch, n_features]
+            weights: Variational weights [n_layers, n_qubits, 3]
+        """
+        self.feature_encoding(features)
+        
+        for layer_weights in weights:
+            self.variational_layer(layer_weights)
+        
+        return qml.expval(qml.PauliZ(0))
+    
+    @staticmethod
+    def _normalize(features: np.ndarray) -> np.ndarray:
+        """Min-max normalize each sample (last axis) to [0, 1]"""
+        f_min = features.min(axis=-1, keepdims=True)
+        f_max = features.max(axis=-1, keepdims=True)
+        return (features - f_min) / (f_max - f_min + 1e-10)
+    
     def predict(self, features: np.ndarray) -> float:
         """
         Quantum prediction for single sample
@@ -73,37 +110,37 @@ class QuantumPatternRecognition:
             Prediction probability (0 to 1)
         """
         # Normalize features to [0, 1]
-        features_norm = (features - features.min()) / (features.max() - features.min() + 1e-10)
-        
-        # Define quantum circuit for this prediction
-        @qml.qnode(self.dev)
-        def circuit(features, weights):
-            # Feature encoding
-            for i, feature in enumerate(features[:self.n_qubits]):
-                qml.RY(feature * np.pi, wires=i)
-            
-            # Variational layers
-            for layer_weights in weights:
-                # Rotations
-                for i in range(self.n_qubits):
-                    qml.RX(layer_weights[i, 0], wires=i)
-                    qml.RY(layer_weights[i, 1], wires=i)
-                    qml.RZ(layer_weights[i, 2], wires=i)
-                
-                # Entanglement
-                for i in range(self.n_qubits):
-                    qml.CNOT(wires=[i, (i + 1) % self.n_qubits])
-            
-            return qml.expval(qml.PauliZ(0))
+        features_norm = self._normalize(np.asarray(features, dtype=float))
         
         # Get quantum expectation (-1 to 1)
-        expectation = circuit(features_norm, self.weights)
+        expectation = self._bound_qnode(features_norm)
         
         # Convert to probability (0 to 1)
         probability = (expectation + 1) / 2
         
         return float(probability)
     
+    def predict_batch(self, features: np.ndarray) -> np.ndarray:
+        """
+        Quantum prediction for many samples in one broadcast execution
+        
+        Args:
+            features: Feature matrix [batch, n_features]
+            
+        Returns:
+            Prediction probabilities, shape [batch]
+        """
+        features = np.asarray(features, dtype=float)
+        if features.ndim != 2:
+            raise ValueError(f"Expected a [batch, n_features] matrix, got shape {features.shape}")
+        
+        features_norm = self._normalize(features)
+        
+        # RY angles of shape [batch] are broadcast through a single simulation
+        expectations = self._bound_qnode(features_norm)
+        
+        return (np.asarray(expectations, dtype=float).reshape(-1) + 1) / 2
+    
     def train_step(self, features: np.ndarray, label: int, learning_rate: float = 0.01):
         """
         Single training step using parameter shift rule
@@ -173,6 +210,16 @@ def quantum_kernel(x1: np.ndarray, x2: np.ndarray, n_qubits: int = 4) -> float:
     Returns:
         Kernel value (similarity)
     """
+    kernel_circuit = _kernel_qnode(n_qubits)
+    
+    # Kernel is overlap of quantum states
+    probs = kernel_circuit(x1, x2)
+    return float(probs[0])  # Probability of |0>^n state
+
+
+@lru_cache(maxsize=None)
+def _kernel_qnode(n_qubits: int):
+    """Kernel QNode, built once per qubit count and reused by quantum_kernel"""
     dev = qml.device('default.qubit', wires=n_qubits)
     
     @qml.qnode(dev)
@@ -187,9 +234,7 @@ def quantum_kernel(x1: np.ndarray, x2: np.ndarray, n_qubits: int = 4) -> float:
         
         return qml.probs(wires=range(n_qubits))
     
-    # Kernel is overlap of quantum states
-    probs = kernel_circuit(x1, x2)
-    return float(probs[0])  # Probability of |0>^n state
+    return kernel_circuit
 
 
 if __name__ == "__main__":
@@ -0,0 +1,186 @@
+"""
+Closed-form Statevector Simulator
+Pure-NumPy backend for the fixed dropout classifier circuit (no PennyLane needed)
+
+The production circuit is angle encoding (RY per qubit) followed by layers of
+RX/RY/RZ rotations and a ring of CNOTs, measuring Z on wire 0. With the weights
+fixed, the whole variational block is one 2^n x 2^n unitary U, so the
+expectation for an encoded state |s> is <s| U^dag Z0 U |s>. The observable
+U^dag Z0 U is precomputed once and every batch is a single matrix product.
+"""
+import numpy as np
+from typing import Dict
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def rx(theta: float) -> np.ndarray:
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[c, -1j * s], [-1j * s, c]], dtype=complex)
+
+
+def ry(theta: float) -> np.ndarray:
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[c, -s], [s, c]], dtype=complex)
+
+
+def rz(theta: float) -> np.ndarray:
+    return np.array([[np.exp(-0.5j * theta), 0], [0, np.exp(0.5j * theta)]], dtype=complex)
+
+
+def cnot_matrix(control: int, target: int, n_qubits: int) -> np.ndarray:
+    """CNOT as a permutation matrix (wire 0 is the most significant bit, as in PennyLane)"""
+    dim = 2 ** n_qubits
+    matrix = np.zeros((dim, dim), dtype=complex)
+    for basis in range(dim):
+        control_bit = (basis >> (n_qubits - 1 - control)) & 1
+        flipped = basis ^ (control_bit << (n_qubits - 1 - target))
+        matrix[flipped, basis] = 1
+    return matrix
+
+
+def layer_unitary(layer_weights: np.ndarray, n_qubits: int) -> np.ndarray:
+    """
+    Unitary of one variational layer
+
+    Args:
+        layer_weights: [n_qubits, 3] angles for RX, RY, RZ
+    """
+    # Single-qubit rotations, applied RX -> RY -> RZ on every wire
+    rotations = np.array([[1]], dtype=complex)
+    for i in range(n_qubits):
+        rot = rz(layer_weights[i, 2]) @ ry(layer_weights[i, 1]) @ rx(layer_weights[i, 0])
+        rotations = np.kron(rotations, rot)
+
+    # Ring entanglement, applied CNOT(0,1), CNOT(1,2), ..., CNOT(n-1,0)
+    entangler = np.eye(2 ** n_qubits, dtype=complex)
+    for i in range(n_qubits):
+        entangler = cnot_matrix(i, (i + 1) % n_qubits, n_qubits) @ entangler
+
+    return entangler @ rotations
+
+
+def circuit_unitary(weights: np.ndarray) -> np.ndarray:
+    """Unitary of the full variational block for weights [n_layers, n_qubits, 3]"""
+    n_qubits = weights.shape[1]
+    unitary = np.eye(2 ** n_qubits, dtype=complex)
+    for layer_weights in weights:
+        unitary = layer_unitary(layer_weights, n_qubits) @ unitary
+    return unitary
+
+
+def encode_states(features: np.ndarray, n_qubits: int) -> np.ndarray:
+    """
+    Angle-encode normalized features into product statevectors
+
+    Args:
+        features: Normalized features [batch, n_features]; only the first
+                  n_qubits are encoded, missing wires stay in |0>
+
+    Returns:
+        Real statevectors [batch, 2^n_qubits]
+    """
+    batch = features.shape[0]
+    angles = np.zeros((batch, n_qubits))
+    n_encoded = min(n_qubits, features.shape[1])
+    angles[:, :n_encoded] = features[:, :n_encoded] * np.pi
+
+    # RY(theta)|0> = cos(theta/2)|0> + sin(theta/2)|1>
+    qubit_states = np.stack([np.cos(angles / 2), np.sin(angles / 2)], axis=-1)
+
+    states = qubit_states[:, 0, :]
+    for i in range(1, n_qubits):
+        states = np.einsum('bi,bj->bij', states, qubit_states[:, i, :]).reshape(batch, -1)
+    return states
+
+
+class StatevectorQuantumCircuit:
+    """
+    Drop-in replacement for QuantumPatternRecognition inference
+
+    Same weights, normalization and outputs, evaluated with NumPy only.
+    """
+
+    def __init__(self, n_qubits: int = 4, n_layers: int = 3):
+        self.n_qubits = n_qubits
+        self.n_layers = n_layers
+
+        # Initialize weights randomly (setter precomputes the observable)
+        self.weights = np.random.randn(n_layers, n_qubits, 3)
+
+        logger.info(f"✅ NumPy statevector circuit initialized: {n_qubits} qubits, {n_layers} layers")
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights
+
+    @weights.setter
+    def weights(self, weights):
+        """Store weights and precompute U^dag Z0 U for them."""
+        weights = np.asarray(weights, dtype=float)
+        expected = (self.n_layers, self.n_qubits, 3)
+        if weights.shape != expected:
+            raise ValueError(f"Expected weights of shape {expected}, got {weights.shape}")
+
+        self._weights = weights
+        self.unitary = circuit_unitary(weights)
+
+        # PauliZ on wire 0: +1 for the first half of the basis, -1 for the second
+        dim = 2 ** self.n_qubits
+        z0 = np.where(np.arange(dim) < dim // 2, 1.0, -1.0)
+        observable = self.unitary.conj().T @ (z0[:, None] * self.unitary)
+
+        # Encoded states are real, so only the real symmetric part contributes
+        self.observable = observable.real
+
+    @staticmethod
+    def _normalize(features: np.ndarray) -> np.ndarray:
+        """Min-max normalize each sample (last axis) to [0, 1]"""
+        f_min = features.min(axis=-1, keepdims=True)
+        f_max = features.max(axis=-1, keepdims=True)
+        return (features - f_min) / (f_max - f_min + 1e-10)
+
+    def expectations(self, features_norm: np.ndarray) -> np.ndarray:
+        """<Z0> for already-normalized features [batch, n_features]"""
+        states = encode_states(features_norm, self.n_qubits)
+        return np.einsum('bi,ij,bj->b', states, self.observable, states)
+
+    def predict(self, features: np.ndarray) -> float:
+        """
+        Quantum prediction for single sample
+
+        Args:
+            features: Feature vector
+
+        Returns:
+            Prediction probability (0 to 1)
+        """
+        features = np.asarray(features, dtype=float).reshape(1, -1)
+        return float(self.predict_batch(features)[0])
+
+    def predict_batch(self, features: np.ndarray) -> np.ndarray:
+        """
+        Quantum prediction for many samples
+
+        Args:
+            features: Feature matrix [batch, n_features]
+
+        Returns:
+            Prediction probabilities, shape [batch]
+        """
+        features = np.asarray(features, dtype=float)
+        if features.ndim != 2:
+            raise ValueError(f"Expected a [batch, n_features] matrix, got shape {features.shape}")
+
+        return (self.expectations(self._normalize(features)) + 1) / 2
+
+    def get_circuit_info(self) -> Dict:
+        """Get circuit information"""
+        return {
+            "n_qubits": self.n_qubits,
+            "n_layers": self.n_layers,
+            "n_parameters": self._weights.size,
+            "device": "numpy.statevector",
+            "gate_count": self.n_layers * self.n_qubits * 4  # RX, RY, RZ, CNOT per qubit per layer
+        }
@@ -0,0 +1,196 @@
+"""
+Statevector Training Backend
+Pure-NumPy training for the fixed dropout classifier circuit (no PennyLane in the loop)
+
+Same ansatz as StatevectorQuantumCircuit: RY angle encoding, then layers of
+RX/RY/RZ on every wire and a ring of CNOTs, measuring Z on wire 0. Every
+rotation gate has the form exp(-i theta P / 2), so the parameter-shift rule
+is exact:
+
+    d<Z0>/d theta_k = (<Z0>(theta_k + pi/2) - <Z0>(theta_k - pi/2)) / 2
+
+All 2 x n_params shifted weight sets (72 for 3 layers x 4 qubits) plus the
+unshifted one are turned into a stack of observables U^dag Z0 U in one
+batched pass, and the expectations for a whole mini-batch of encoded states
+are a single einsum over that stack.
+"""
+import numpy as np
+from functools import lru_cache
+from typing import Tuple
+
+from .statevector import cnot_matrix, encode_states
+
+SHIFT = np.pi / 2
+
+
+def rotation_stack(angles: np.ndarray) -> np.ndarray:
+    """
+    RZ @ RY @ RX for many weight sets at once
+
+    Args:
+        angles: [..., 3] angles for RX, RY, RZ
+
+    Returns:
+        Complex matrices [..., 2, 2]
+    """
+    half = np.asarray(angles, dtype=float) / 2
+    c, s = np.cos(half), np.sin(half)
+    shape = half.shape[:-1] + (2, 2)
+
+    rx = np.zeros(shape, dtype=complex)
+    rx[..., 0, 0] = rx[..., 1, 1] = c[..., 0]
+    rx[..., 0, 1] = rx[..., 1, 0] = -1j * s[..., 0]
+
+    ry = np.zeros(shape, dtype=complex)
+    ry[..., 0, 0] = ry[..., 1, 1] = c[..., 1]
+    ry[..., 0, 1] = -s[..., 1]
+    ry[..., 1, 0] = s[..., 1]
+
+    rz = np.zeros(shape, dtype=complex)
+    rz[..., 0, 0] = np.exp(-1j * half[..., 2])
+    rz[..., 1, 1] = np.exp(1j * half[..., 2])
+
+    return rz @ ry @ rx
+
+
+@lru_cache(maxsize=None)
+def ring_entangler(n_qubits: int) -> np.ndarray:
+    """CNOT(0,1), CNOT(1,2), ..., CNOT(n-1,0) as one permutation matrix"""
+    entangler = np.eye(2 ** n_qubits, dtype=complex)
+    for i in range(n_qubits):
+        entangler = cnot_matrix(i, (i + 1) % n_qubits, n_qubits) @ entangler
+    return entangler
+
+
+def circuit_unitaries(weights: np.ndarray) -> np.ndarray:
+    """
+    Variational block unitaries for a stack of weight sets
+
+    Args:
+        weights: [P, n_layers, n_qubits, 3]
+
+    Returns:
+        Unitaries [P, 2^n_qubits, 2^n_qubits]
+    """
+    n_sets, n_layers, n_qubits, _ = weights.shape
+    dim = 2 ** n_qubits
+    entangler = ring_entangler(n_qubits)
+    rotations = rotation_stack(weights)  # [P, n_layers, n_qubits, 2, 2]
+
+    unitaries = np.broadcast_to(np.eye(dim, dtype=complex), (n_sets, dim, dim))
+    for layer in range(n_layers):
+        # Tensor product over wires, wire 0 most significant
+        layer_rotations = rotations[:, layer, 0]
+        for i in range(1, n_qubits):
+            size = layer_rotations.shape[-1] * 2
+            layer_rotations = np.einsum(
+                'pij,pkl->pikjl', layer_rotations, rotations[:, layer, i]
+            ).reshape(n_sets, size, size)
+        unitaries = entangler @ layer_rotations @ unitaries
+    return unitaries
+
+
+def z0_observables(weights: np.ndarray) -> np.ndarray:
+    """Real parts of U^dag Z0 U for a stack of weight sets [P, n_layers, n_qubits, 3]"""
+    unitaries = circuit_unitaries(weights)
+    dim = unitaries.shape[-1]
+    z0 = np.where(np.arange(dim) < dim // 2, 1.0, -1.0)
+    # Encoded states are real, so only the real symmetric part contributes
+    return np.einsum('pki,k,pkj->pij', unitaries.conj(), z0, unitaries).real
+
+
+def shifted_weights(weights: np.ndarray) -> np.ndarray:
+    """
+    The unshifted weights followed by every +pi/2 and -pi/2 single-parameter shift
+
+    Returns:
+        [1 + 2 * n_params, n_layers, n_qubits, 3]
+    """
+    n_params = weights.size
+    shifts = np.eye(n_params).reshape((n_params,) + weights.shape) * SHIFT
+    return np.concatenate([weights[None], weights + shifts, weights - shifts])
+
+
+def expectations_and_jacobian(weights: np.ndarray, states: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    <Z0> for a batch of encoded states and its exact gradient w.r.t. every weight
+
+    Args:
+        weights: [n_layers, n_qubits, 3]
+        states: Encoded statevectors [batch, 2^n_qubits]
+
+    Returns:
+        (expectations [batch], jacobian [n_params, batch])
+    """
+    n_params = weights.size
+    observables = z0_observables(shifted_weights(weights))
+    values = np.einsum('bi,pij,bj->pb', states, observables, states)
+    plus, minus = values[1:1 + n_params], values[1 + n_params:]
+    return values[0], (plus - minus) / 2
+
+
+def predict_proba(weights: np.ndarray, features_norm: np.ndarray) -> np.ndarray:
+    """Probabilities (<Z0> + 1) / 2 for normalized features [batch, n_features]"""
+    weights = np.asarray(weights, dtype=float)
+    states = encode_states(np.asarray(features_norm, dtype=float), weights.shape[1])
+    observable = z0_observables(weights[None])[0]
+    return (np.einsum('bi,ij,bj->b', states, observable, states) + 1) / 2
+
+
+def binary_cross_entropy_and_gradient(weights: np.ndarray, features_norm: np.ndarray,
+                                      labels: np.ndarray, eps: float = 1e-10) -> Tuple[float, np.ndarray]:
+    """
+    Clipped binary cross-entropy of the classifier and its exact gradient
+
+    Same loss as train_quantum_model.binary_cross_entropy: predictions are
+    clipped to [eps, 1 - eps], and clipped samples contribute no gradient.
+
+    Returns:
+        (loss, gradient with the shape of weights)
+    """
+    weights = np.asarray(weights, dtype=float)
+    labels = np.asarray(labels, dtype=float)
+    states = encode_states(np.asarray(features_norm, dtype=float), weights.shape[1])
+    expectations, jacobian = expectations_and_jacobian(weights, states)
+
+    raw = (expectations + 1) / 2
+    predictions = np.clip(raw, eps, 1 - eps)
+    loss = -np.mean(labels * np.log(predictions) + (1 - labels) * np.log(1 - predictions))
+
+    d_predictions = (predictions - labels) / (predictions * (1 - predictions)) / len(labels)
+    d_predictions = np.where((raw > eps) & (raw < 1 - eps), d_predictions, 0.0)
+    # dp/dE = 1/2
+    gradient = jacobian @ (d_predictions / 2)
+    return float(loss), gradient.reshape(weights.shape)
+
+
+class AdamOptimizer:
+    """NumPy Adam with qml.AdamOptimizer's update rule and defaults"""
+
+    def __init__(self, stepsize: float = 0.01, beta1: float = 0.9, beta2: float = 0.99, eps: float = 1e-8):
+        self.stepsize = stepsize
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.eps = eps
+        self.reset()
+
+    def reset(self):
+        self.fm = None
+        self.sm = None
+        self.t = 0
+
+    def apply_grad(self, gradient: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        self.t += 1
+        if self.fm is None:
+            self.fm = np.zeros_like(weights)
+            self.sm = np.zeros_like(weights)
+        self.fm = self.beta1 * self.fm + (1 - self.beta1) * gradient
+        self.sm = self.beta2 * self.sm + (1 - self.beta2) * gradient ** 2
+        stepsize = self.stepsize * np.sqrt(1 - self.beta2 ** self.t) / (1 - self.beta1 ** self.t)
+        return weights - stepsize * self.fm / (np.sqrt(self.sm) + self.eps)
+
+    def step_and_cost(self, features_norm: np.ndarray, labels: np.ndarray,
+                      weights: np.ndarray) -> Tuple[np.ndarray, float]:
+        """One Adam step on the cross-entropy; returns (new weights, cost before the step)"""
+        loss, gradient = binary_cross_entropy_and_gradient(weights, features_norm, labels)
+        return self.apply_grad(gradient, weights), loss
@@ -0,0 +1,222 @@
+"""
+Streaming Temporal Features
+Trend and decline features updated in O(1) as each day's activity arrives
+
+Online counterpart of the batch computations in
+data/signal_rich_generator.py (_calculate_temporal_features) and
+data/create_advanced_features.py. Those sort a user's full activity history
+and slice it with head/tail/iloc; here every slice is kept as running state:
+
+- first-N accumulators, frozen once N days have arrived (first 7 days, weeks 1-3)
+- ring buffers with running sums for the trailing windows (last 3, 7 and 10 days)
+- Welford mean/variance for the whole history
+
+Windows are positional like the batch scripts (the last 7 *activity rows*,
+not calendar days), so an update is constant time and the features match
+the batch values to floating-point tolerance. Days must arrive in date
+order per user; an event for a day at or before the latest one is counted in
+late_events and ignored.
+"""
+import math
+from collections import deque
+from typing import Dict, Optional
+
+from app.event_fields import parse_day, parse_flag, parse_number
+
+TEMPORAL_FEATURES = [
+    # signal_rich_generator._calculate_temporal_features (engagement_score)
+    "activity_slope", "three_day_decline", "consistency_score", "momentum",
+    # create_advanced_features.py (completed_daily_goal, steps)
+    "completion_trend", "steps_trend", "engagement_momentum", "behavioral_consistency",
+]
+
+
+class RollingWindow:
+    """Last `size` values with a running sum and count; None marks a missing value"""
+
+    __slots__ = ("values", "total", "count")
+
+    def __init__(self, size: int):
+        self.values = deque(maxlen=size)
+        self.total = 0.0
+        self.count = 0
+
+    def push(self, value: Optional[float]):
+        if len(self.values) == self.values.maxlen:
+            evicted = self.values[0]
+            if evicted is not None:
+                self.total -= evicted
+                self.count -= 1
+        self.values.append(value)
+        if value is not None:
+            self.total += value
+            self.count += 1
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+
+class PrefixMean:
+    """Mean of the first `size` values, frozen once they have all arrived"""
+
+    __slots__ = ("size", "seen", "total", "count")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.seen = 0
+        self.total = 0.0
+        self.count = 0
+
+    def push(self, value: Optional[float]):
+        if self.seen >= self.size:
+            return
+        self.seen += 1
+        if value is not None:
+            self.total += value
+            self.count += 1
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+
+class RunningMoments:
+    """Welford running mean and sample variance (ddof=1, as pandas .std())"""
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, value: Optional[float]):
+        if value is None:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else math.nan
+
+
+def _finite(value: float) -> float:
+    """NaN (pandas' empty/short-history result) reported as 0, like the fillna(0) in the batch script"""
+    return 0.0 if math.isnan(value) else float(value)
+
+
+class TemporalFeatureState:
+    """Running temporal features for one user"""
+
+    __slots__ = (
+        "days", "last_day", "late_events",
+        "engagement", "engagement_first7", "engagement_last7", "engagement_last3", "engagement_last10",
+        "completion_first7", "completion_last7", "completion_weeks", "completed_days",
+        "steps_first7", "steps_last7",
+    )
+
+    def __init__(self):
+        self.days = 0
+        self.last_day: Optional[int] = None
+        self.late_events = 0
+
+        self.engagement = RunningMoments()
+        self.engagement_first7 = PrefixMean(7)
+        self.engagement_last7 = RollingWindow(7)
+        self.engagement_last3 = RollingWindow(3)
+        self.engagement_last10 = RollingWindow(10)
+
+        self.completion_first7 = PrefixMean(7)
+        self.completion_last7 = RollingWindow(7)
+        # Weeks 1-3 (rows 0-6, 7-13, 14-20) for engagement_momentum
+        self.completion_weeks = [PrefixMean(7), PrefixMean(7), PrefixMean(7)]
+        self.completed_days = 0
+
+        self.steps_first7 = PrefixMean(7)
+        self.steps_last7 = RollingWindow(7)
+
+    def update(self, day: int, engagement_score: Optional[float], steps: Optional[float],
+               completed: bool) -> bool:
+        """
+        Add one day's activity
+
+        Returns:
+            False if the day was late (at or before the latest day) and ignored
+        """
+        if self.last_day is not None and day <= self.last_day:
+            self.late_events += 1
+            return False
+        self.last_day = day
+        position = self.days
+        self.days += 1
+
+        self.engagement.push(engagement_score)
+        self.engagement_first7.push(engagement_score)
+        self.engagement_last7.push(engagement_score)
+        self.engagement_last3.push(engagement_score)
+        self.engagement_last10.push(engagement_score)
+
+        completion = float(completed)
+        self.completion_first7.push(completion)
+        self.completion_last7.push(completion)
+        if position < 21:
+            self.completion_weeks[position // 7].push(completion)
+        self.completed_days += int(completed)
+
+        self.steps_first7.push(steps)
+        self.steps_last7.push(steps)
+        return True
+
+    def features(self) -> Dict[str, float]:
+        """Current feature values (TEMPORAL_FEATURES plus temporal_days)"""
+        recent = self.engagement_last7.mean()
+
+        # iloc[-10:-3]: the last 10 rows minus the last 3
+        last3 = self.engagement_last3
+        last10 = self.engagement_last10
+        prev_count = last10.count - last3.count
+        prev = (last10.total - last3.total) / prev_count if prev_count else math.nan
+
+        std = self.engagement.std()
+        if self.days >= 14:
+            early_steps = self.steps_first7.mean()
+            completion_trend = self.completion_last7.mean() - self.completion_first7.mean()
+            steps_trend = (self.steps_last7.mean() - early_steps) / (early_steps + 1)
+        else:
+            completion_trend = steps_trend = 0.0
+        if self.days >= 21:
+            week1, week2, week3 = (week.mean() for week in self.completion_weeks)
+            engagement_momentum = (week3 - week2) - (week2 - week1)
+        else:
+            engagement_momentum = 0.0
+
+        return {
+            "activity_slope": _finite((recent - self.engagement_first7.mean()) / 7),
+            "three_day_decline": _finite(prev - last3.mean()),
+            "consistency_score": _finite(1 / (1 + std)),
+            "momentum": _finite(recent - self.engagement.mean),
+            "completion_trend": _finite(completion_trend),
+            "steps_trend": _finite(steps_trend),
+            "engagement_momentum": _finite(engagement_momentum),
+            "behavioral_consistency": self.completed_days / max(self.days, 1),
+            "temporal_days": self.days,
+        }
+
+
+def temporal_features_frame(activities_df):
+    """
+    Stream an activities DataFrame through TemporalFeatureState, one row at a time
+
+    Rows are fed per user in date order, as the batch scripts sort them.
+    Returns one row of features per user.
+    """
+    import pandas as pd
+
+    states: Dict[str, TemporalFeatureState] = {}
+    order = "day_number" if "day_number" in activities_df.columns else "date"
+    for event in activities_df.sort_values(order, kind="stable").to_dict("records"):
+        state = states.setdefault(str(event["user_id"]), TemporalFeatureState())
+        state.update(parse_day(event["date"]), parse_number(event.get("engagement_score")),
+                     parse_number(event.get("steps")), parse_flag(event.get("completed_daily_goal", False)))
+    return pd.DataFrame([{"user_id": user_id, **state.features()} for user_id, state in states.items()])
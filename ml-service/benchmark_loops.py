@@ -0,0 +1,121 @@
+"""
+Time the vectorized training-set builds against the per-user loops they replaced
+
+    python benchmark_loops.py                 # all three builds
+    python benchmark_loops.py streak          # one of: advanced, streak, recommender
+
+Datasets and reference loops come from loop_parity.py, the same ones the
+parity tests use. Each size first checks the vectorized output against the
+loop; beyond --loop-limit users the loop is not run and its time is
+extrapolated as O(users x log rows), since it filters the whole log once per
+user.
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from data.create_advanced_features import ADVANCED_COLUMNS, create_advanced_features
+from loop_parity import (
+    advanced_features_dataset, build_recommender_pairs_loop, build_streak_training_data_loop,
+    create_advanced_features_loop, recommender_dataset, streak_dataset,
+)
+from training.recommender_pairs import CHALLENGE_TYPES, build_recommender_pairs
+from training.streak_labels import activity_stats, build_streak_training_data
+
+
+def _same_advanced_features(actual, expected):
+    assert actual['user_id'].tolist() == expected['user_id'].tolist()
+    assert np.allclose(actual[ADVANCED_COLUMNS], expected[ADVANCED_COLUMNS], rtol=1e-9, atol=1e-12)
+
+
+def _same_frame(actual, expected):
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False, check_exact=True)
+
+
+# name -> (dataset, vectorized build, reference loop, check, user counts, loop limit)
+BENCHMARKS = {
+    "advanced": (
+        advanced_features_dataset,
+        create_advanced_features,
+        create_advanced_features_loop,
+        _same_advanced_features,
+        (100, 1_000, 10_000, 100_000),
+        1_000,
+    ),
+    "streak": (
+        streak_dataset,
+        lambda features, activities: build_streak_training_data(features, activity_stats(activities)),
+        build_streak_training_data_loop,
+        _same_frame,
+        (1_000, 10_000, 100_000, 1_000_000),
+        2_000,
+    ),
+    "recommender": (
+        recommender_dataset,
+        lambda features, challenges: build_recommender_pairs(features, challenges, CHALLENGE_TYPES),
+        lambda features, challenges: build_recommender_pairs_loop(features, challenges, CHALLENGE_TYPES),
+        _same_frame,
+        (1_000, 10_000, 100_000, 1_000_000),
+        2_000,
+    ),
+}
+
+
+def benchmark(make_dataset, build, reference, check, sizes, loop_limit):
+    """
+    Time build(*dataset) against the reference loop as the user count grows
+
+    Args:
+        make_dataset: n_users -> tuple of frames; the second is the event log
+        build, reference: Vectorized and loop implementations, called on the dataset
+        check: Asserts build's output equals the reference's
+        sizes: User counts to time
+        loop_limit: Largest user count the loop is run for; larger sizes get
+            an extrapolated loop time once one size below it was measured
+    """
+    seconds_per_user_row = None
+    print(f"{'users':>9} {'log rows':>11} {'vectorized s':>13} {'loop s':>12} {'speedup':>9}")
+    for n_users in sizes:
+        dataset = make_dataset(n_users)
+        rows = len(dataset[1])
+        start = time.perf_counter()
+        result = build(*dataset)
+        seconds = time.perf_counter() - start
+
+        if n_users <= loop_limit:
+            start = time.perf_counter()
+            expected = reference(*dataset)
+            loop_seconds = time.perf_counter() - start
+            check(result, expected)
+            seconds_per_user_row = loop_seconds / (n_users * max(rows, 1))
+            loop = f"{loop_seconds:12.2f}"
+        elif seconds_per_user_row is None:
+            print(f"{n_users:>9} {rows:>11} {seconds:>13.3f} {'-':>12} {'-':>9}")
+            continue
+        else:
+            loop_seconds = seconds_per_user_row * n_users * rows
+            loop = f"~{loop_seconds:11.0f}"
+        print(f"{n_users:>9} {rows:>11} {seconds:>13.3f} {loop} {loop_seconds / seconds:>8.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("builds", nargs="*", metavar="build",
+                        help=f"builds to time: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--max-users", type=int, help="skip sizes above this user count")
+    parser.add_argument("--loop-limit", type=int, help="largest user count the loop is run for")
+    args = parser.parse_args()
+    unknown = sorted(set(args.builds) - set(BENCHMARKS))
+    if unknown:
+        parser.error(f"unknown build(s): {', '.join(unknown)}")
+
+    for name in args.builds or BENCHMARKS:
+        make_dataset, build, reference, check, sizes, loop_limit = BENCHMARKS[name]
+        if args.max_users:
+            sizes = [n for n in sizes if n <= args.max_users]
+        if args.loop_limit is not None:
+            loop_limit = args.loop_limit
+        print(f"\n{name}")
+        benchmark(make_dataset, build, reference, check, sizes, loop_limit)
@@ -10,7 +10,29 @@ import random
 import json
 from typing import List, Dict
 
-class HealthDataGenerator:
+try:
+    from data.vectorized_generation import (
+        VectorizedGenerationMixin, activity_dates, current_streaks, dates_before, long_format, per_user_sum, user_ids
+    )
+except ImportError:  # run as a script from data/
+    from vectorized_generation import (
+        VectorizedGenerationMixin, activity_dates, current_streaks, dates_before, long_format, per_user_sum, user_ids
+    )
+
+USER_TYPES = ["highly_engaged", "moderate", "struggling", "dropout"]
+
+CHALLENGE_TYPES = [
+    ("10K Steps Challenge", "exercise", 3),
+    ("Morning Meditation", "meditation", 2),
+    ("Hydration Hero", "water", 1),
+    ("Sleep Sanctuary", "sleep", 3),
+    ("7-Day Streak", "exercise", 5),
+    ("Mindful Eating", "meals", 4),
+    ("Evening Yoga", "exercise", 2),
+    ("Breathwork Beginner", "meditation", 1)
+]
+
+class HealthDataGenerator(VectorizedGenerationMixin):
     def __init__(self, n_users: int = 1000, n_days: int = 90):
         """
         Initialize data generator.
@@ -63,7 +85,7 @@ class HealthDataGenerator:
         
         for i in range(self.n_users):
             # Define user type (affects behavior patterns)
-            user_type = random.choice(["highly_engaged", "moderate", "struggling", "dropout"])
+            user_type = random.choice(USER_TYPES)
             
             profile = {
                 "user_id": f"user_{i:04d}",
@@ -166,16 +188,7 @@ class HealthDataGenerator:
         """Generate challenge participation data."""
         challenges = []
         
-        challenge_types = [
-            ("10K Steps Challenge", "exercise", 3),
-            ("Morning Meditation", "meditation", 2),
-            ("Hydration Hero", "water", 1),
-            ("Sleep Sanctuary", "sleep", 3),
-            ("7-Day Streak", "exercise", 5),
-            ("Mindful Eating", "meals", 4),
-            ("Evening Yoga", "exercise", 2),
-            ("Breathwork Beginner", "meditation", 1)
-        ]
+        challenge_types = CHALLENGE_TYPES
         
         for _, user in users_df.iterrows():
             user_id = user["user_id"]
@@ -332,6 +345,137 @@ class HealthDataGenerator:
         
         return pd.DataFrame(features)
     
+    def _generate_chunk(self, rng: np.random.Generator, user_start: int, n_users: int,
+                        anchor: datetime) -> Dict[str, pd.DataFrame]:
+        """Vectorized generate_complete_dataset() for one block of users (see vectorized_generation.py)."""
+        n, d = n_users, self.n_days
+        ids = user_ids(user_start, n)
+        shape = (n, d)
+
+        # Profiles; per-type behavior parameters in USER_TYPES order
+        type_index = rng.integers(0, len(USER_TYPES), n)
+        users_df = pd.DataFrame({
+            "user_id": ids,
+            "user_type": np.array(USER_TYPES)[type_index],
+            "join_date": dates_before(anchor, rng.integers(1, 366, n)),
+            "age": rng.integers(18, 66, n),
+            "fitness_level": rng.choice(["beginner", "intermediate", "advanced"], n),
+            "primary_goal": rng.choice(["weight_loss", "muscle_gain", "wellness", "stress_reduction"], n),
+            "preferred_activity_time": rng.choice(["morning", "afternoon", "evening", "night"], n)
+        })
+
+        # Activities: both branches drawn as matrices, selected by the completion mask
+        completion_rate = np.array([0.85, 0.65, 0.4, 0.2])[type_index][:, None]
+        step_low = np.array([8000, 5000, 2000, 500])[type_index][:, None]
+        step_high = np.array([15000, 10000, 7000, 3000])[type_index][:, None]
+        meditation_prob = np.array([0.9, 0.6, 0.3, 0.1])[type_index][:, None]
+
+        completed = rng.random(shape) < completion_rate
+
+        def branch(active, inactive):
+            return np.where(completed, active, inactive)
+
+        steps = branch(rng.integers(step_low, step_high + 1, shape), rng.integers(500, 3001, shape))
+        meditates = completed & (rng.random(shape) < meditation_prob)
+        activities_df = long_format(ids, activity_dates(anchor, d), {
+            "steps": steps,
+            "meditation_minutes": np.where(meditates, rng.integers(5, 31, shape), 0),
+            "water_glasses": branch(rng.integers(6, 11, shape), rng.integers(0, 6, shape)),
+            "sleep_hours": np.round(branch(rng.uniform(6, 9, shape), rng.uniform(4, 7, shape)), 1),
+            "meals_logged": rng.integers(0, 4, shape),
+            "exercise_minutes": branch(rng.integers(0, 61, shape), 0),
+            "current_streak": current_streaks(completed),
+            "completed_daily_goal": completed,
+            # Vital Health Metrics
+            "heart_rate": branch(rng.integers(60, 101, shape), rng.integers(70, 111, shape)),
+            "resting_heart_rate": branch(rng.integers(50, 71, shape), rng.integers(65, 86, shape)),
+            "blood_oxygen": branch(rng.integers(96, 101, shape), rng.integers(92, 99, shape)),
+            "blood_pressure_systolic": branch(rng.integers(110, 131, shape), rng.integers(120, 146, shape)),
+            "blood_pressure_diastolic": branch(rng.integers(70, 86, shape), rng.integers(80, 96, shape)),
+            "heart_rate_variability": branch(rng.integers(50, 101, shape), rng.integers(20, 61, shape))
+        })
+
+        # Challenges: one row per attempt, owner = user index in the chunk
+        challenge_low = np.array([10, 5, 2, 1])[type_index]
+        challenge_high = np.array([20, 12, 6, 3])[type_index]
+        owner = np.repeat(np.arange(n), rng.integers(challenge_low, challenge_high + 1))
+        kind = rng.integers(0, len(CHALLENGE_TYPES), len(owner))
+        difficulty = np.array([c[2] for c in CHALLENGE_TYPES])[kind]
+        start_offset = rng.integers(1, d + 1, len(owner))
+        challenge_completed = rng.random(len(owner)) < np.array([0.8, 0.6, 0.35, 0.15])[type_index][owner]
+        completion_date = dates_before(anchor, start_offset - rng.integers(1, 8, len(owner))).astype(object)
+        completion_date[~challenge_completed] = None
+        points = np.where(challenge_completed, difficulty * 50, 0)
+        challenges_df = pd.DataFrame({
+            "user_id": ids[owner],
+            "challenge_name": np.array([c[0] for c in CHALLENGE_TYPES])[kind],
+            "category": np.array([c[1] for c in CHALLENGE_TYPES])[kind],
+            "difficulty": difficulty,
+            "start_date": dates_before(anchor, start_offset),
+            "completion_date": completion_date,
+            "completed": challenge_completed,
+            "points_earned": points,
+            "attempts": rng.integers(1, 4, len(owner))
+        })
+
+        # Social interactions
+        social_low = np.array([50, 20, 5, 0])[type_index]
+        social_high = np.array([150, 60, 25, 10])[type_index]
+        social_counts = rng.integers(social_low, social_high + 1)
+        social_owner = np.repeat(np.arange(n), social_counts)
+        social_dates = dates_before(anchor, rng.integers(1, d + 1, len(social_owner)))
+        social_df = pd.DataFrame({
+            "user_id": ids[social_owner],
+            "interaction_type": rng.choice(["like", "comment", "share", "follow"], len(social_owner)),
+            "date": social_dates,
+            "timestamp": np.char.add(social_dates.astype(str), anchor.strftime(" %H:%M:%S"))
+        })
+
+        # Feature matrix straight from the matrices
+        days_active = completed.sum(axis=1)
+        avg_steps_last_7 = steps[:, -7:].mean(axis=1)
+        n_challenges = np.bincount(owner, minlength=n)
+
+        def last_7(column):
+            return activities_df[column].to_numpy().reshape(shape)[:, -7:].mean(axis=1)
+
+        features_df = pd.DataFrame({
+            "user_id": ids,
+            "days_active": days_active,
+            "total_days": d,
+            "avg_steps_last_7_days": np.round(avg_steps_last_7, 2),
+            "meditation_streak": activities_df["current_streak"].to_numpy().reshape(shape).max(axis=1),
+            "avg_meditation_minutes": np.round(activities_df["meditation_minutes"].to_numpy().reshape(shape).mean(axis=1), 2),
+            "avg_sleep_hours": np.round(activities_df["sleep_hours"].to_numpy().reshape(shape).mean(axis=1), 2),
+            "challenge_completion_rate": np.round(per_user_sum(owner, challenge_completed, n) / np.maximum(n_challenges, 1), 3),
+            "total_points_earned": per_user_sum(owner, points, n).astype(int),
+            "social_engagement_score": np.round(np.minimum(1.0, social_counts / 100.0), 3),
+            "social_interactions_count": social_counts,
+            "preferred_activity_time": users_df["preferred_activity_time"].to_numpy(),
+            "response_rate_to_notifications": np.round(
+                np.where(days_active > 7, rng.uniform(0.3, 0.9, n), rng.uniform(0.1, 0.4, n)), 3),
+            "mood_correlation_with_exercise": np.round(
+                np.where(avg_steps_last_7 > 7000, rng.uniform(0.4, 0.9, n), rng.uniform(0.2, 0.6, n)), 3),
+            # Vital Health Metrics
+            "avg_heart_rate_7d": np.round(last_7("heart_rate"), 1),
+            "avg_resting_heart_rate_7d": np.round(last_7("resting_heart_rate"), 1),
+            "avg_blood_oxygen_7d": np.round(last_7("blood_oxygen"), 1),
+            "avg_bp_systolic_7d": np.round(last_7("blood_pressure_systolic"), 1),
+            "avg_bp_diastolic_7d": np.round(last_7("blood_pressure_diastolic"), 1),
+            "avg_hrv_7d": np.round(last_7("heart_rate_variability"), 1),
+            "user_type": users_df["user_type"].to_numpy(),
+            "fitness_level": users_df["fitness_level"].to_numpy(),
+            "primary_goal": users_df["primary_goal"].to_numpy()
+        })
+
+        return {
+            "users": users_df,
+            "activities": activities_df,
+            "challenges": challenges_df,
+            "social": social_df,
+            "features": features_df
+        }
+    
     def save_datasets(self, datasets: Dict[str, pd.DataFrame], output_dir: str = "./data"):
         """Save all datasets to CSV files."""
         import os
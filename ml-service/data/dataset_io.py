@@ -0,0 +1,261 @@
+"""
+Dataset I/O
+Typed, compressed, columnar storage for the training and feature datasets
+
+Datasets are addressed by their CSV path (data/features.csv,
+data/processed/X_train.csv, ...). read_dataset() prefers the Parquet copy
+next to it (data/features.parquet, a file or a directory of part files) and
+reads only the requested columns, pushing row filters down to the Parquet
+row groups. Without a Parquet copy, or without pyarrow, it falls back to the
+CSV with the same projection and filters applied in pandas, so scripts work
+on fresh checkouts before the one-time conversion. A CSV written after its
+Parquet copy (a regenerated dataset) wins over the stale copy:
+
+    python data/dataset_io.py data data/processed    # convert every CSV under these directories
+"""
+import glob
+import logging
+import operator
+import os
+import time
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+    logging.warning("pyarrow not available. Datasets will be read and written as CSV.")
+
+COMPRESSION = "zstd"
+
+# pyarrow filter operators, for the CSV fallback
+_OPERATORS = {
+    "==": operator.eq, "=": operator.eq, "!=": operator.ne,
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+    "in": lambda column, values: column.isin(values),
+    "not in": lambda column, values: ~column.isin(values),
+}
+
+Filter = Tuple[str, str, object]
+
+
+def parquet_path(path: str) -> str:
+    """data/features.csv -> data/features.parquet"""
+    root, ext = os.path.splitext(path)
+    return (root if ext == ".csv" else path) + ".parquet"
+
+
+def csv_path(path: str) -> str:
+    """data/features.parquet -> data/features.csv"""
+    root, ext = os.path.splitext(path)
+    if ext == ".csv":
+        return path
+    return (root if ext == ".parquet" else path) + ".csv"
+
+
+def _parquet_columns(path: str) -> List[str]:
+    if os.path.isdir(path):
+        return pq.ParquetDataset(path).schema.names
+    return pq.read_schema(path).names
+
+
+def _mtime(path: str) -> float:
+    if os.path.isdir(path):
+        return max((os.path.getmtime(p) for p in glob.glob(os.path.join(path, "*"))),
+                   default=os.path.getmtime(path))
+    return os.path.getmtime(path)
+
+
+def _use_parquet(path: str) -> bool:
+    """True if the Parquet copy of a dataset exists and is not older than its CSV"""
+    source = parquet_path(path)
+    if not (PARQUET_AVAILABLE and os.path.exists(source)):
+        return False
+    csv_source = csv_path(path)
+    if os.path.exists(csv_source) and _mtime(csv_source) > _mtime(source):
+        logging.warning(f"{csv_source} is newer than {source}; reading the CSV "
+                        f"(re-run the conversion to refresh the Parquet copy)")
+        return False
+    return True
+
+
+def _apply_filters(df: pd.DataFrame, filters: Optional[Sequence[Filter]]) -> pd.DataFrame:
+    if not filters:
+        return df
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        mask &= _OPERATORS[op](df[column], value)
+    return df[mask].reset_index(drop=True)
+
+
+def read_dataset(path: str, columns: Optional[Iterable[str]] = None,
+                 filters: Optional[Sequence[Filter]] = None) -> pd.DataFrame:
+    """
+    Read a dataset by its CSV path, from Parquet when a converted copy exists
+
+    Args:
+        path: CSV path of the dataset (the .parquet sibling is used if present
+            and at least as new as the CSV)
+        columns: Columns to read; columns absent from the dataset are skipped, so
+            callers can keep their row.get(column, default) fallbacks
+        filters: Row predicates as (column, op, value) tuples, ANDed, e.g.
+            [("user_id", "in", ids), ("date", ">=", "2025-11-01")]
+
+    Returns:
+        DataFrame with the requested columns in file order
+    """
+    wanted = None if columns is None else set(columns)
+    filter_columns = {column for column, _, _ in filters or ()}
+    source = parquet_path(path)
+
+    if _use_parquet(path):
+        read_columns = None
+        if wanted is not None:
+            read_columns = [c for c in _parquet_columns(source) if c in wanted]
+        df = pd.read_parquet(source, engine="pyarrow", columns=read_columns,
+                             filters=[tuple(f) for f in filters] if filters else None)
+        return df.reset_index(drop=True)
+
+    source = csv_path(path)
+    usecols = None if wanted is None else (lambda column: column in wanted or column in filter_columns)
+    df = _apply_filters(pd.read_csv(source, usecols=usecols), filters)
+    if wanted is not None:
+        df = df[[c for c in df.columns if c in wanted]]
+    return df
+
+
+def _iter_batches(path: str, chunksize: int, columns: Optional[List[str]]):
+    source = parquet_path(path)
+    if _use_parquet(path):
+        if os.path.isdir(source):
+            import pyarrow.dataset as ds
+            batches = ds.dataset(source, format="parquet").to_batches(columns=columns, batch_size=chunksize)
+        else:
+            batches = pq.ParquetFile(source).iter_batches(batch_size=chunksize, columns=columns)
+        for batch in batches:
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(csv_path(path), chunksize=chunksize, usecols=columns)
+
+
+def iter_user_chunks(path: str, chunksize: int, columns: Optional[List[str]] = None):
+    """
+    Read a dataset in chunks of about chunksize rows, cut on user boundaries
+
+    The dataset must keep each user's rows contiguous (as the generators write it);
+    the trailing user of a chunk is carried into the next one.
+    """
+    carry = None
+    seen = set()
+    for chunk in _iter_batches(path, chunksize, columns):
+        if not len(chunk):
+            continue
+        if carry is not None:
+            chunk = pd.concat([carry, chunk], ignore_index=True)
+        trailing = chunk['user_id'] == chunk['user_id'].iloc[-1]
+        carry = chunk[trailing]
+        complete = chunk[~trailing]
+        if len(complete):
+            chunk_users = set(complete['user_id'].unique())
+            if not seen.isdisjoint(chunk_users):
+                raise ValueError(f"{path} is not grouped by user_id; chunked reads need each user's rows contiguous")
+            seen |= chunk_users
+            yield complete
+    if carry is not None and len(carry):
+        if carry['user_id'].iloc[0] in seen:
+            raise ValueError(f"{path} is not grouped by user_id; chunked reads need each user's rows contiguous")
+        yield carry
+
+
+def write_dataset(df, path: str) -> str:
+    """
+    Write a dataset addressed by its CSV path; Parquet when pyarrow is available
+
+    Returns:
+        Path actually written
+    """
+    if isinstance(df, pd.Series):
+        # Same header Series.to_csv writes
+        df = df.to_frame(name="0" if df.name is None else str(df.name))
+    if not PARQUET_AVAILABLE:
+        target = csv_path(path)
+        df.to_csv(target, index=False)
+        return target
+    target = parquet_path(path)
+    df.to_parquet(target, engine="pyarrow", compression=COMPRESSION, index=False)
+    return target
+
+
+def convert_csv(path: str, remove_csv: bool = False) -> str:
+    """
+    One-time conversion of a CSV file, or a directory of part-*.csv files, to Parquet
+
+    Returns:
+        Path of the Parquet copy
+    """
+    if not PARQUET_AVAILABLE:
+        raise ImportError("pyarrow is required to convert datasets: pip install pyarrow")
+    target = parquet_path(path)
+    if os.path.isdir(path):
+        # Partitioned generator output: <table>/part-NNNNN.csv -> <table>.parquet/part-NNNNN.parquet
+        os.makedirs(target, exist_ok=True)
+        for part in sorted(glob.glob(os.path.join(path, "*.csv"))):
+            name = os.path.splitext(os.path.basename(part))[0]
+            pd.read_csv(part).to_parquet(os.path.join(target, f"{name}.parquet"), engine="pyarrow",
+                                         compression=COMPRESSION, index=False)
+    else:
+        pd.read_csv(path).to_parquet(target, engine="pyarrow", compression=COMPRESSION, index=False)
+    if remove_csv and not os.path.isdir(path):
+        os.remove(path)
+    return target
+
+
+def _size(path: str) -> int:
+    if os.path.isdir(path):
+        return sum(os.path.getsize(p) for p in glob.glob(os.path.join(path, "*")))
+    return os.path.getsize(path)
+
+
+def convert_directory(directory: str, remove_csv: bool = False) -> List[dict]:
+    """Convert every CSV (and partitioned CSV directory) under a directory; report size and load time"""
+    report = []
+    sources = sorted(glob.glob(os.path.join(directory, "*.csv")))
+    sources += sorted(d for d in glob.glob(os.path.join(directory, "*"))
+                      if os.path.isdir(d) and glob.glob(os.path.join(d, "part-*.csv")))
+    for source in sources:
+        csv_bytes = _size(source)
+        parts = sorted(glob.glob(os.path.join(source, "part-*.csv"))) if os.path.isdir(source) else [source]
+        start = time.perf_counter()
+        for part in parts:
+            pd.read_csv(part)
+        csv_seconds = time.perf_counter() - start
+        target = convert_csv(source, remove_csv=remove_csv)
+        start = time.perf_counter()
+        pd.read_parquet(target, engine="pyarrow")
+        report.append({
+            "dataset": source,
+            "csv_mb": csv_bytes / 1e6,
+            "parquet_mb": _size(target) / 1e6,
+            "csv_load_s": csv_seconds,
+            "parquet_load_s": time.perf_counter() - start,
+        })
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert CSV datasets to compressed Parquet")
+    parser.add_argument("directories", nargs="*", default=["data", "data/processed"])
+    parser.add_argument("--remove-csv", action="store_true", help="Delete each CSV after converting it")
+    args = parser.parse_args()
+
+    for directory in args.directories:
+        if not os.path.isdir(directory):
+            continue
+        for row in convert_directory(directory, remove_csv=args.remove_csv):
+            print(f"✓ {row['dataset']}: {row['csv_mb']:.1f} MB -> {row['parquet_mb']:.1f} MB, "
+                  f"load {row['csv_load_s']:.2f}s -> {row['parquet_load_s']:.2f}s")
@@ -8,9 +8,21 @@ import numpy as np
 from datetime import datetime, timedelta
 import random
 import json
+import warnings
 from typing import List, Dict
 
-class RealisticHealthDataGenerator:
+try:
+    from data.vectorized_generation import (
+        VectorizedGenerationMixin, activity_dates, current_streaks, dates_before, long_format, per_user_sum,
+        user_ids, weekdays
+    )
+except ImportError:  # run as a script from data/
+    from vectorized_generation import (
+        VectorizedGenerationMixin, activity_dates, current_streaks, dates_before, long_format, per_user_sum,
+        user_ids, weekdays
+    )
+
+class RealisticHealthDataGenerator(VectorizedGenerationMixin):
     def __init__(self, n_users: int = 1000, n_days: int = 90):
         """
         Initialize realistic data generator.
@@ -410,6 +422,213 @@ class RealisticHealthDataGenerator:
         
         return features_df
     
+    def _generate_chunk(self, rng: np.random.Generator, user_start: int, n_users: int,
+                        anchor: datetime) -> Dict[str, pd.DataFrame]:
+        """Vectorized generate_complete_dataset() for one block of users (see vectorized_generation.py)."""
+        n, d = n_users, self.n_days
+        ids = user_ids(user_start, n)
+        shape = (n, d)
+
+        users_df = pd.DataFrame({
+            "user_id": ids,
+            "join_date": dates_before(anchor, rng.integers(1, 366, n)),
+            "age": rng.normal(35, 12, n).astype(int),
+            "fitness_level": rng.choice(["beginner", "intermediate", "advanced"], n),
+            "primary_goal": rng.choice(["weight_loss", "muscle_gain", "wellness", "stress_reduction"], n),
+            "preferred_activity_time": rng.choice(["morning", "afternoon", "evening", "night"], n)
+        })
+
+        # Completion probability: user tendency x weekday x daily variance x drift
+        base_engagement = rng.beta(2, 2, n)[:, None]
+        base_consistency = rng.beta(2, 5, n)[:, None]
+        day_of_week_factor = np.where(weekdays(anchor, d) < 5, 1.2, 0.8)
+        random_factor = rng.uniform(0.5, 1.5, shape)
+        trend_factor = 1 + (np.arange(d) / d) * rng.uniform(-0.3, 0.3, shape)
+        completion_prob = np.clip(base_engagement * base_consistency * day_of_week_factor * random_factor * trend_factor, 0, 1)
+        completed = rng.random(shape) < completion_prob
+
+        def branch(active, inactive):
+            return np.where(completed, active, inactive)
+
+        steps = branch(
+            np.clip(rng.gamma(3, 2000, shape).astype(int), 500, 20000),
+            np.clip(rng.gamma(1.5, 1000, shape).astype(int), 0, 5000)
+        ).astype(float)
+        meditation_minutes = branch(
+            np.clip(rng.exponential(10, shape).astype(int), 0, 60),
+            np.where(rng.random(shape) < 0.8, 0, rng.integers(0, 11, shape))
+        )
+        water_glasses = branch(np.clip(rng.poisson(6, shape), 0, 12), rng.integers(0, 6, shape))
+        sleep_hours = branch(np.clip(rng.normal(7, 1.2, shape), 4, 10), np.clip(rng.normal(6.5, 1.5, shape), 3, 9))
+        exercise_minutes = branch(
+            np.clip(rng.gamma(2, 15, shape).astype(int), 0, 120),
+            np.where(rng.random(shape) < 0.7, 0, rng.integers(0, 31, shape))
+        )
+
+        # Add 5% missing data (real apps have this!)
+        steps[rng.random(shape) < 0.05] = np.nan
+
+        # Vital signs: active users (completed and > 7000 steps) get the healthier distribution
+        active = completed & (steps > 7000)
+
+        def vital(active_mean, active_std, mean, std):
+            return rng.normal(np.where(active, active_mean, mean), np.where(active, active_std, std))
+
+        heart_rate = vital(72, 12, 78, 15)
+        resting_hr = vital(58, 8, 68, 12)
+        blood_oxygen = vital(97.5, 1.5, 96, 2)
+        bp_systolic = vital(118, 10, 128, 15)
+        bp_diastolic = vital(76, 8, 82, 10)
+        hrv = vital(65, 20, 45, 18)
+
+        # Add noise and outliers (10% chance of unusual reading)
+        outlier = rng.random(shape) < 0.1
+        heart_rate += np.where(outlier, rng.normal(0, 20, shape), 0)
+        blood_oxygen += np.where(outlier, rng.normal(0, 3, shape), 0)
+
+        heart_rate = np.clip(heart_rate, 50, 120)
+        resting_hr = np.clip(resting_hr, 45, 90)
+        blood_oxygen = np.clip(blood_oxygen, 88, 100)
+        bp_systolic = np.clip(bp_systolic, 90, 160)
+        bp_diastolic = np.clip(bp_diastolic, 60, 100)
+        hrv = np.clip(hrv, 15, 120)
+
+        # 3% missing vital signs data
+        vitals_missing = rng.random(shape) < 0.03
+        heart_rate[vitals_missing] = np.nan
+        resting_hr[vitals_missing] = np.nan
+        blood_oxygen[vitals_missing] = np.nan
+
+        heart_rate, resting_hr, blood_oxygen = (np.round(v, 1) for v in (heart_rate, resting_hr, blood_oxygen))
+        sleep_hours = np.round(sleep_hours, 1)
+        streaks = current_streaks(completed)
+        activities_df = long_format(ids, activity_dates(anchor, d), {
+            "steps": steps,
+            "meditation_minutes": meditation_minutes,
+            "water_glasses": water_glasses,
+            "sleep_hours": sleep_hours,
+            "meals_logged": rng.integers(0, 4, shape),
+            "exercise_minutes": exercise_minutes,
+            "current_streak": streaks,
+            "completed_daily_goal": completed,
+            # Vital signs
+            "heart_rate": heart_rate,
+            "resting_heart_rate": resting_hr,
+            "blood_oxygen": blood_oxygen,
+            "blood_pressure_systolic": np.round(bp_systolic, 1),
+            "blood_pressure_diastolic": np.round(bp_diastolic, 1),
+            "heart_rate_variability": np.round(hrv, 1)
+        })
+
+        # Challenges: count and success driven by the observed completion rate
+        actual_completion_rate = completed.mean(axis=1)
+        owner = np.repeat(np.arange(n), np.clip(rng.poisson(5 + actual_completion_rate * 10), 1, 25))
+        challenge_types = [
+            ("10K Steps Challenge", "exercise", 3),
+            ("Morning Meditation", "meditation", 2),
+            ("Hydration Hero", "water", 1),
+            ("Sleep Sanctuary", "sleep", 3),
+            ("7-Day Streak", "exercise", 5),
+            ("Mindful Eating", "meals", 4),
+        ]
+        kind = rng.integers(0, len(challenge_types), len(owner))
+        difficulty = np.array([c[2] for c in challenge_types])[kind]
+        luck = rng.uniform(0.7, 1.3, len(owner))
+        success_prob = np.clip(actual_completion_rate[owner] * (6 - difficulty) / 10 * luck, 0, 1)
+        challenge_completed = rng.random(len(owner)) < success_prob
+        start_offset = rng.integers(1, d + 1, len(owner))
+        completion_date = dates_before(anchor, start_offset - rng.integers(1, 8, len(owner))).astype(object)
+        completion_date[~challenge_completed] = None
+        points = np.where(challenge_completed, difficulty * 50, 0)
+        challenges_df = pd.DataFrame({
+            "user_id": ids[owner],
+            "challenge_name": np.array([c[0] for c in challenge_types])[kind],
+            "category": np.array([c[1] for c in challenge_types])[kind],
+            "difficulty": difficulty,
+            "start_date": dates_before(anchor, start_offset),
+            "completion_date": completion_date,
+            "completed": challenge_completed,
+            "points_earned": points,
+            "attempts": rng.integers(1, 4, len(owner))
+        })
+
+        # Social engagement varies independently
+        social_counts = rng.poisson(rng.beta(2, 3, n) * 100)
+        social_owner = np.repeat(np.arange(n), social_counts)
+        social_dates = dates_before(anchor, rng.integers(1, d + 1, len(social_owner)))
+        social_df = pd.DataFrame({
+            "user_id": ids[social_owner],
+            "interaction_type": rng.choice(["like", "comment", "share", "follow"], len(social_owner)),
+            "date": social_dates,
+            "timestamp": np.char.add(social_dates.astype(str), anchor.strftime(" %H:%M:%S"))
+        })
+
+        # Features from observed behavior, with per-user measurement noise
+        n_challenges = np.bincount(owner, minlength=n)
+        challenge_completion_rate = per_user_sum(owner, challenge_completed, n) / n_challenges
+        total_points = per_user_sum(owner, points, n)
+        social_engagement_score = np.minimum(1.0, social_counts / 100.0)
+        noise_factor = 1 + rng.normal(0, 0.02, n)
+        days_active = completed.sum(axis=1)
+        with np.errstate(invalid="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN last week -> NaN -> 0 below
+            avg_steps_last_7 = np.nan_to_num(np.nanmean(steps[:, -7:], axis=1))
+            recent_vitals = {
+                name: np.nanmean(values[:, -7:], axis=1)
+                for name, values in (("hr", heart_rate), ("resting_hr", resting_hr), ("spo2", blood_oxygen),
+                                     ("bp_sys", bp_systolic), ("bp_dia", bp_diastolic), ("hrv", hrv))
+            }
+
+        def noisy_vital(name):
+            value = recent_vitals[name]
+            return np.where(value > 0, value * noise_factor, 0)
+
+        features_df = pd.DataFrame({
+            "user_id": ids,
+            "days_active": (days_active * noise_factor).astype(int),
+            "total_days": d,
+            "avg_steps_last_7_days": avg_steps_last_7 * noise_factor,
+            "meditation_streak": (streaks.max(axis=1) * noise_factor).astype(int),
+            "avg_meditation_minutes": meditation_minutes.mean(axis=1) * noise_factor,
+            "avg_sleep_hours": sleep_hours.mean(axis=1) * noise_factor,
+            "challenge_completion_rate": np.clip(challenge_completion_rate * noise_factor, 0, 1),
+            "total_points_earned": (total_points * noise_factor).astype(int),
+            "social_engagement_score": np.clip(social_engagement_score * noise_factor, 0, 1),
+            "social_interactions_count": social_counts,
+            "response_rate_to_notifications": rng.uniform(0.2, 0.9, n),
+            "mood_correlation_with_exercise": rng.uniform(0.3, 0.9, n),
+            "avg_heart_rate_7d": noisy_vital("hr"),
+            "avg_resting_heart_rate_7d": noisy_vital("resting_hr"),
+            "avg_blood_oxygen_7d": noisy_vital("spo2"),
+            "avg_bp_systolic_7d": noisy_vital("bp_sys"),
+            "avg_bp_diastolic_7d": noisy_vital("bp_dia"),
+            "avg_hrv_7d": noisy_vital("hrv"),
+            "fitness_level": users_df["fitness_level"].to_numpy(),
+            "primary_goal": users_df["primary_goal"].to_numpy()
+        })
+
+        # Post-hoc user_type as in _assign_user_type_post_hoc; percentiles are per chunk
+        engagement_score = (
+            features_df['challenge_completion_rate'] * 0.3 +
+            (features_df['days_active'] / features_df['total_days']) * 0.3 +
+            features_df['social_engagement_score'] * 0.2 +
+            (features_df['avg_steps_last_7_days'] / 10000) * 0.2
+        ).to_numpy()
+        engagement_score = np.clip(engagement_score + rng.normal(0, 0.08, n), 0, 2)
+        labels = np.array(['dropout', 'struggling', 'moderate', 'highly_engaged'])
+        user_type = labels[np.searchsorted(np.quantile(engagement_score, [0.25, 0.50, 0.75]), engagement_score, side='right')]
+        label_noise = rng.random(n) < 0.03
+        user_type[label_noise] = rng.choice(labels, label_noise.sum())
+        features_df['user_type'] = user_type
+
+        return {
+            "users": users_df,
+            "activities": activities_df,
+            "challenges": challenges_df,
+            "social": social_df,
+            "features": features_df
+        }
+    
     def save_datasets(self, datasets: Dict[str, pd.DataFrame], output_dir: str = "./data"):
         """Save all datasets."""
         import os
@@ -9,7 +9,16 @@ from datetime import datetime, timedelta
 import random
 from typing import List, Dict, Tuple
 
-class SignalRichDataGenerator:
+try:
+    from data.vectorized_generation import (
+        VectorizedGenerationMixin, activity_dates, dates_before, long_format, per_user_sum, user_ids
+    )
+except ImportError:  # run as a script from data/
+    from vectorized_generation import (
+        VectorizedGenerationMixin, activity_dates, dates_before, long_format, per_user_sum, user_ids
+    )
+
+class SignalRichDataGenerator(VectorizedGenerationMixin):
     """
     Generate synthetic data with STRONG temporal patterns and clear signals.
     
@@ -361,6 +370,121 @@ class SignalRichDataGenerator:
         
         return features_df
     
+    def _generate_chunk(self, rng: np.random.Generator, user_start: int, n_users: int,
+                        anchor: datetime) -> Dict[str, pd.DataFrame]:
+        """Vectorized generate_complete_dataset() for one block of users (see vectorized_generation.py)."""
+        n, d = n_users, self.n_days
+        ids = user_ids(user_start, n)
+        shape = (n, d)
+        day = np.arange(d)
+
+        # Trajectory type by global user index, as in _generate_user_trajectories
+        # (stable_high, gradual_decline, sudden_drop, inconsistent)
+        n_per_type = self.n_users // 4
+        if n_per_type:
+            type_index = np.minimum((user_start + np.arange(n)) // n_per_type, 3)
+        else:
+            type_index = np.full(n, 3)
+
+        # Every trajectory family drawn for the whole chunk, then selected per user
+        stable = np.clip(rng.uniform(0.75, 0.95, n)[:, None] + rng.normal(0, 0.05, shape), 0.5, 1.0)
+        start, end = rng.uniform(0.7, 0.9, n)[:, None], rng.uniform(0.1, 0.3, n)[:, None]
+        decline = np.clip(start + (end - start) * (day / max(d - 1, 1)) + rng.normal(0, 0.08, shape), 0, 1)
+        normal_days = d - rng.integers(3, 8, n)[:, None]
+        sudden = np.where(day < normal_days, rng.uniform(0.5, 0.8, shape), rng.uniform(0, 0.2, shape))
+        wave = 0.5 + 0.3 * np.sin(np.linspace(0, 4 * np.pi, d))
+        inconsistent = np.clip(wave + rng.normal(0, 0.15, shape), 0, 1)
+        engagement = np.choose(type_index[:, None], [stable, decline, sudden, inconsistent])
+
+        users_df = pd.DataFrame({
+            "user_id": ids,
+            "join_date": (anchor - timedelta(days=self.n_days + 10)).strftime("%Y-%m-%d")
+        })
+
+        # Engagement score drives all metrics
+        completed = engagement > 0.5
+        steps = np.clip((engagement * rng.gamma(3, 2500, shape)).astype(int), 0, 20000)
+        meditates = rng.random(shape) < engagement * 0.7
+        meditation_minutes = np.where(meditates, np.minimum(rng.exponential(15, shape).astype(int), 60), 0)
+        sleep_hours = np.round(np.clip(7 + (engagement - 0.5) * 2 + rng.normal(0, 0.5, shape), 4, 10), 1)
+        activities_df = long_format(ids, activity_dates(anchor, d), {
+            "day_number": np.broadcast_to(day, shape),
+            "steps": steps,
+            "meditation_minutes": meditation_minutes,
+            "water_glasses": (engagement * 8).astype(int) + rng.integers(0, 4, shape),
+            "sleep_hours": sleep_hours,
+            "meals_logged": (engagement * 3).astype(int),
+            "exercise_minutes": np.where(completed, (engagement * 45).astype(int), 0),
+            "engagement_score": engagement,  # Hidden ground truth
+            "completed_daily_goal": completed
+        })
+
+        # Challenges and social proportional to average engagement
+        avg_engagement = engagement.mean(axis=1)
+        challenge_types = [
+            ("10K Steps Challenge", "exercise", 3),
+            ("Morning Meditation", "meditation", 2),
+            ("7-Day Streak", "exercise", 5),
+        ]
+        owner = np.repeat(np.arange(n), np.maximum(1, (avg_engagement * 15).astype(int)))
+        kind = rng.integers(0, len(challenge_types), len(owner))
+        difficulty = np.array([c[2] for c in challenge_types])[kind]
+        challenge_completed = rng.random(len(owner)) < avg_engagement[owner] * (6 - difficulty) / 5
+        points = np.where(challenge_completed, difficulty * 50, 0)
+        challenges_df = pd.DataFrame({
+            "user_id": ids[owner],
+            "challenge_name": np.array([c[0] for c in challenge_types])[kind],
+            "category": np.array([c[1] for c in challenge_types])[kind],
+            "difficulty": difficulty,
+            "start_date": dates_before(anchor, rng.integers(1, d + 1, len(owner))),
+            "completed": challenge_completed,
+            "points_earned": points
+        })
+
+        social_counts = (avg_engagement * 100).astype(int)
+        social_owner = np.repeat(np.arange(n), social_counts)
+        social_df = pd.DataFrame({
+            "user_id": ids[social_owner],
+            "interaction_type": rng.choice(["like", "comment", "share"], len(social_owner)),
+            "date": dates_before(anchor, rng.integers(1, d + 1, len(social_owner)))
+        })
+
+        # Temporal features, as in _calculate_temporal_features
+        last_7 = engagement[:, -7:].mean(axis=1)
+        n_challenges = np.bincount(owner, minlength=n)
+        features_df = pd.DataFrame({
+            "user_id": ids,
+            "activity_slope": (last_7 - engagement[:, :7].mean(axis=1)) / 7,
+            "three_day_decline": engagement[:, -10:-3].mean(axis=1) - engagement[:, -3:].mean(axis=1),
+            "consistency_score": 1 / (1 + engagement.std(axis=1, ddof=1)),
+            "momentum": last_7 - avg_engagement,
+            "days_active": completed.sum(axis=1),
+            "total_days": d,
+            "avg_steps_last_7_days": last_7 * 10000,
+            "avg_meditation_minutes": meditation_minutes.mean(axis=1),
+            "avg_sleep_hours": sleep_hours.mean(axis=1),
+            "challenge_completion_rate": per_user_sum(owner, challenge_completed, n) / n_challenges,
+            "total_points_earned": per_user_sum(owner, points, n).astype(int),
+            "social_engagement_score": np.minimum(1.0, social_counts / 100.0),
+            "social_interactions_count": social_counts,
+            "response_rate_to_notifications": rng.uniform(0.3, 0.9, n),
+            "mood_correlation_with_exercise": rng.uniform(0.4, 0.9, n)
+        })
+
+        # Labels from trajectory type, with 5% label noise
+        labels = np.array(["highly_engaged", "struggling", "dropout", "moderate"])[type_index]
+        label_noise = rng.random(n) < 0.05
+        labels[label_noise] = rng.choice(["highly_engaged", "moderate", "struggling", "dropout"], label_noise.sum())
+        features_df["user_type"] = labels
+
+        return {
+            "users": users_df,
+            "activities": activities_df,
+            "challenges": challenges_df,
+            "social": social_df,
+            "features": features_df
+        }
+    
     def save_datasets(self, datasets: Dict[str, pd.DataFrame], output_dir: str = "./data"):
         """Save all datasets."""
         import os
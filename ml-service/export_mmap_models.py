@@ -0,0 +1,123 @@
+"""
+Export model pickles for memory-mapped loading and report per-worker memory
+
+    python export_mmap_models.py                  # write models/saved/mmap/*.pkl
+    python export_mmap_models.py --report -w 4    # RSS/PSS per worker, normal vs mmap
+
+Exports are plain uncompressed joblib dumps, so joblib.load(..., mmap_mode='r')
+can map every NumPy array straight from the file. Start the service with
+ML_MMAP_MODELS=1 to load them; the OS page cache then shares those arrays
+between uvicorn workers.
+
+Note: sklearn's Tree.__setstate__ copies node arrays into its own buffer, so for
+tree ensembles mmap only avoids the transient second copy made while
+unpickling; arrays that stay ndarrays (scalers, linear coefficients, encoders)
+are shared for real. Models that app.models.compiled supports are also written
+as <name>.compiled.pkl; those are plain ndarrays end to end and are mapped in
+full when the service runs with compiled models (the default).
+"""
+import argparse
+import glob
+import multiprocessing
+import os
+import time
+
+import joblib
+
+from app.models.compiled import compile_model, verify_compiled
+from app.models.registry import MODEL_DIR, MMAP_SUBDIR, COMPILED_SUFFIX
+
+WARM_MODELS = ["recommender", "dropout", "streak", "motivation_engine"]
+
+
+def export_artifacts(model_dir: str = MODEL_DIR):
+    """Re-dump every pickle uncompressed into <model_dir>/mmap/"""
+    out_dir = os.path.join(model_dir, MMAP_SUBDIR)
+    os.makedirs(out_dir, exist_ok=True)
+
+    paths = sorted(glob.glob(os.path.join(model_dir, "*.pkl")))
+    if not paths:
+        print(f"⚠️  No .pkl files found in {model_dir}")
+        return
+
+    for path in paths:
+        out_path = os.path.join(out_dir, os.path.basename(path))
+        start = time.perf_counter()
+        model = joblib.load(path)
+        joblib.dump(model, out_path, compress=0)
+        print(f"✓ {os.path.basename(path):45s} {os.path.getsize(path) / 1e6:7.2f} MB -> "
+              f"{os.path.getsize(out_path) / 1e6:7.2f} MB ({time.perf_counter() - start:.2f}s)")
+
+        compiled = compile_model(model)
+        if compiled is None:
+            continue
+        if not verify_compiled(model, compiled):
+            print(f"⚠️  {os.path.basename(path)}: compiled model does not match sklearn, not exported")
+            continue
+        compiled_path = os.path.splitext(out_path)[0] + COMPILED_SUFFIX
+        joblib.dump(compiled, compiled_path, compress=0)
+        print(f"  ↳ {os.path.basename(compiled_path):43s} {os.path.getsize(compiled_path) / 1e6:7.2f} MB")
+
+    print(f"\n✅ Exported {len(paths)} artifacts to {out_dir}")
+
+
+def _memory_kb() -> dict:
+    """Rss/Pss/Anonymous from /proc (Linux); falls back to peak RSS elsewhere"""
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            fields = {line.split(":")[0]: int(line.split()[1]) for line in f if line.split()[0].endswith(":")}
+        return {"rss": fields["Rss"], "pss": fields["Pss"], "anon": fields["Anonymous"]}
+    except (OSError, KeyError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return {"rss": peak, "pss": peak, "anon": peak}
+
+
+def _worker(mmap: bool, loaded, measured, results):
+    os.environ["ML_MMAP_MODELS"] = "1" if mmap else "0"
+    from app.models.registry import model_registry
+    # Import the model code first so the delta only counts artifact memory
+    import sklearn.ensemble, sklearn.linear_model, app.models.predictor, app.models.recommender, app.models.ai_engine  # noqa: F401
+    before = _memory_kb()
+    model_registry.warm_up(WARM_MODELS)
+    # Measure only once every worker holds its models, so PSS splits shared pages
+    loaded.wait()
+    after = _memory_kb()
+    results.put({key: after[key] - before[key] for key in after})
+    measured.wait()
+
+
+def memory_report(n_workers: int = 4):
+    """Spawn n_workers processes per mode and print the memory each one adds"""
+    ctx = multiprocessing.get_context("spawn")
+    for mmap in (False, True):
+        loaded, measured = ctx.Barrier(n_workers), ctx.Barrier(n_workers)
+        results = ctx.Queue()
+        workers = [ctx.Process(target=_worker, args=(mmap, loaded, measured, results)) for _ in range(n_workers)]
+        for w in workers:
+            w.start()
+        rows = [results.get() for _ in workers]
+        for w in workers:
+            w.join()
+
+        label = "mmap" if mmap else "normal"
+        avg = {key: sum(r[key] for r in rows) / len(rows) / 1024 for key in rows[0]}
+        print(f"{label:7s} | RSS {avg['rss']:8.1f} MB | PSS {avg['pss']:8.1f} MB | "
+              f"private anon {avg['anon']:8.1f} MB  (per worker, {n_workers} workers)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--report", action="store_true", help="compare per-worker memory, normal vs mmap")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="workers for --report")
+    parser.add_argument("--model-dir", default=MODEL_DIR)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🗺️  MEMORY-MAPPED MODEL ARTIFACTS")
+    print("=" * 70)
+
+    if args.report:
+        memory_report(args.workers)
+    else:
+        export_artifacts(args.model_dir)
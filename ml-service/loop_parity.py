@@ -0,0 +1,218 @@
+"""
+Loop Parity Helpers
+Original per-user loops and synthetic datasets for the vectorized-build parity tests
+
+test_advanced_features.py, test_streak_labels.py and test_recommender_pairs.py
+check data/create_advanced_features.py, training/streak_labels.py and
+training/recommender_pairs.py against the loops below, which are the
+implementations those modules replaced. benchmark_loops.py times both at scale.
+"""
+import numpy as np
+import pandas as pd
+
+
+def user_ids(n_users):
+    return np.array([f"user_{i:07d}" for i in range(n_users)])
+
+
+def daily_history(rng, n_users, n_days=30, min_days=3):
+    """
+    Variable-length daily histories, each user's days contiguous and in date order
+
+    Returns:
+        (user_id per row, date per row, days per user)
+    """
+    lengths = rng.integers(min_days, n_days + 1, n_users)
+    user_index = np.repeat(np.arange(n_users), lengths)
+    day_index = np.arange(len(user_index)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    dates = pd.date_range('2025-11-01', periods=n_days).strftime('%Y-%m-%d').to_numpy()
+    return user_ids(n_users)[user_index], dates[day_index], lengths
+
+
+def create_advanced_features_loop(features_df, activities_df, social_df):
+    """Original per-user implementation of data/create_advanced_features.py"""
+    advanced_features = []
+    for _, user in features_df.iterrows():
+        user_id = user['user_id']
+        user_activities = activities_df[activities_df['user_id'] == user_id].sort_values('date')
+        user_social = social_df[social_df['user_id'] == user_id]
+        if len(user_activities) == 0:
+            continue
+
+        step_variance = user_activities['steps'].std() / (user_activities['steps'].mean() + 1)
+        completion_variance = user_activities['completed_daily_goal'].std()
+        streak_variance = user_activities['current_streak'].std()
+
+        if len(user_activities) >= 14:
+            early_completion = user_activities.head(7)['completed_daily_goal'].mean()
+            recent_completion = user_activities.tail(7)['completed_daily_goal'].mean()
+            completion_trend = recent_completion - early_completion
+            early_steps = user_activities.head(7)['steps'].mean()
+            recent_steps = user_activities.tail(7)['steps'].mean()
+            steps_trend = (recent_steps - early_steps) / (early_steps + 1)
+        else:
+            completion_trend = 0
+            steps_trend = 0
+
+        if len(user_activities) >= 21:
+            week1 = user_activities.iloc[:7]['completed_daily_goal'].mean()
+            week2 = user_activities.iloc[7:14]['completed_daily_goal'].mean()
+            week3 = user_activities.iloc[14:21]['completed_daily_goal'].mean()
+            momentum = (week3 - week2) - (week2 - week1)
+        else:
+            momentum = 0
+
+        consistency = user_activities['completed_daily_goal'].sum() / max(len(user_activities), 1)
+
+        if len(user_social) > 0:
+            social_frequency = len(user_social) / max(user['total_days'], 1)
+            avg_social_score = (user_social.get('likes', pd.Series([0])).mean() +
+                                user_social.get('comments', pd.Series([0])).mean()) / 2
+        else:
+            social_frequency = 0
+            avg_social_score = 0
+
+        peak_ratio = user_activities['current_streak'].max() / (user_activities['current_streak'].mean() + 1)
+
+        advanced_features.append({
+            'user_id': user_id,
+            'step_variance': step_variance,
+            'completion_variance': completion_variance,
+            'streak_variance': streak_variance,
+            'completion_trend': completion_trend,
+            'steps_trend': steps_trend,
+            'engagement_momentum': momentum,
+            'behavioral_consistency': consistency,
+            'social_frequency': social_frequency,
+            'avg_social_score': avg_social_score,
+            'peak_performance_ratio': peak_ratio
+        })
+
+    features_enriched = features_df.merge(pd.DataFrame(advanced_features), on='user_id', how='left')
+    features_enriched.fillna(0, inplace=True)
+    return features_enriched
+
+
+def advanced_features_dataset(n_users, n_days=30, seed=42):
+    """Random frames with the columns the feature script reads"""
+    rng = np.random.default_rng(seed)
+    # Variable history length per user, so the 14/21-day branches are exercised
+    users, dates, lengths = daily_history(rng, n_users, n_days, min_days=5)
+    activities = pd.DataFrame({
+        'user_id': users,
+        'date': dates,
+        'steps': rng.integers(500, 15000, len(users)),
+        'completed_daily_goal': rng.random(len(users)) < 0.6,
+        'current_streak': rng.integers(0, 30, len(users)),
+    })
+    n_social = 2 * len(activities)
+    social = pd.DataFrame({
+        'user_id': user_ids(n_users)[rng.integers(0, n_users, n_social)],
+        'interaction_type': rng.choice(['like', 'comment', 'share'], n_social),
+    })
+    features = pd.DataFrame({'user_id': user_ids(n_users), 'total_days': lengths})
+    return features, activities, social
+
+
+def build_streak_training_data_loop(features_df, activities_df):
+    """Original per-user implementation from train_streak_predictor.py"""
+    training_data = []
+    for _, user in features_df.iterrows():
+        user_id = user['user_id']
+        user_activities = activities_df[activities_df['user_id'] == user_id].sort_values('date')
+        if len(user_activities) < 7:
+            continue
+        current_streak = user_activities['current_streak'].max()
+        recent_completions = user_activities.tail(7)['completed_daily_goal'].values
+        last_3_days = user_activities.tail(3)['completed_daily_goal'].values
+        streak_will_break = 1 if 0 in last_3_days else 0
+        training_data.append({
+            'user_id': user_id,
+            'current_streak': current_streak,
+            'avg_streak': user_activities['current_streak'].mean(),
+            'completion_rate': user_activities['completed_daily_goal'].mean(),
+            'recent_completion_rate': recent_completions.mean(),
+            'days_active': user.get('days_active', 0),
+            'avg_steps': user.get('avg_steps_last_7_days', 0),
+            'meditation_minutes': user.get('avg_meditation_minutes', 0) if 'avg_meditation_minutes' in user else user.get('meditation_streak', 0),
+            'social_score': user.get('social_engagement_score', 0),
+            'challenge_completion': user.get('challenge_completion_rate', 0),
+            'streak_will_break': streak_will_break
+        })
+    return pd.DataFrame(training_data)
+
+
+def streak_dataset(n_users, n_days=30, seed=42):
+    """Feature rows and an activity log with 3-n_days days per user"""
+    rng = np.random.default_rng(seed)
+    users, dates, _ = daily_history(rng, n_users, n_days, min_days=3)
+    activities = pd.DataFrame({
+        'user_id': users,
+        'date': dates,
+        'current_streak': rng.integers(0, 20, len(users)),
+        'completed_daily_goal': rng.random(len(users)) < 0.7,
+    })
+    features = pd.DataFrame({
+        'user_id': user_ids(n_users),
+        'days_active': rng.integers(0, n_days, n_users),
+        'avg_steps_last_7_days': rng.uniform(500, 15000, n_users).round(2),
+        'avg_meditation_minutes': rng.uniform(0, 30, n_users).round(2),
+        'social_engagement_score': rng.uniform(0, 1, n_users).round(3),
+        'challenge_completion_rate': rng.uniform(0, 1, n_users).round(3),
+    })
+    return features, activities
+
+
+def build_recommender_pairs_loop(features_df, challenges_df, challenge_types):
+    """Original per-user, per-challenge implementation from train_recommender.py"""
+    training_data = []
+    for _, user in features_df.iterrows():
+        user_id = user['user_id']
+        user_challenges = challenges_df[challenges_df['user_id'] == user_id]
+        for challenge in challenge_types:
+            category_attempts = user_challenges[user_challenges['category'] == challenge['category']]
+            if len(category_attempts) > 0:
+                completion_rate = category_attempts['completed'].mean()
+                completed = 1 if completion_rate > 0.5 else 0
+            elif challenge['difficulty'] <= 2:
+                completed = 1 if user.get('challenge_completion_rate', 0) > 0.3 else 0
+            elif challenge['difficulty'] <= 3:
+                completed = 1 if user.get('challenge_completion_rate', 0) > 0.5 else 0
+            else:
+                completed = 1 if user.get('challenge_completion_rate', 0) > 0.7 else 0
+            training_data.append({
+                'user_id': user_id,
+                'challenge_id': challenge['id'],
+                'challenge_difficulty': challenge['difficulty'],
+                'days_active': user.get('days_active', 0),
+                'avg_steps': user.get('avg_steps_last_7_days', 0),
+                'meditation_streak': user.get('meditation_streak', 0) if 'meditation_streak' in user else user.get('avg_meditation_minutes', 0),
+                'avg_sleep': user.get('avg_sleep_hours', 7),
+                'challenge_completion_rate': user.get('challenge_completion_rate', 0),
+                'social_score': user.get('social_engagement_score', 0),
+                'will_complete': completed
+            })
+    return pd.DataFrame(training_data)
+
+
+def recommender_dataset(n_users, challenges_per_user=6, seed=42):
+    """Feature rows and a challenge log with 0-2*challenges_per_user attempts per user"""
+    rng = np.random.default_rng(seed)
+    users = user_ids(n_users)
+    features = pd.DataFrame({
+        'user_id': users,
+        'days_active': rng.integers(0, 30, n_users),
+        'avg_steps_last_7_days': rng.uniform(500, 15000, n_users).round(2),
+        'meditation_streak': rng.integers(0, 20, n_users),
+        'avg_sleep_hours': rng.uniform(4, 10, n_users).round(2),
+        'challenge_completion_rate': rng.uniform(0, 1, n_users).round(3),
+        'social_engagement_score': rng.uniform(0, 1, n_users).round(3),
+    })
+    attempts = rng.integers(0, 2 * challenges_per_user + 1, n_users)
+    categories = np.array(['meditation', 'exercise', 'water', 'meals', 'sleep', 'social'])
+    challenges = pd.DataFrame({
+        'user_id': np.repeat(users, attempts),
+        'category': rng.choice(categories, attempts.sum()),
+        'completed': rng.random(attempts.sum()) < 0.6,
+    })
+    return features, challenges
@@ -7,6 +7,8 @@ Run this to get started with quantum predictions
 import os
 import sys
 
+from data.dataset_io import parquet_path
+
 print("""
 ╔══════════════════════════════════════════════════════════════╗
 ║  🔮 QUANTUM ML QUICK START                                   ║
@@ -15,7 +17,7 @@ print("""
 """)
 
 # Check if training data exists
-if not os.path.exists('./data/processed/X_train.csv'):
+if not any(os.path.exists(p) for p in ('./data/processed/X_train.csv', parquet_path('./data/processed/X_train.csv'))):
     print("⚠️  Training data not found. Generating synthetic data...")
     print("   This will take a moment...")
     
@@ -0,0 +1,35 @@
+"""Parity test: vectorized create_advanced_features vs the original per-user loop"""
+import numpy as np
+
+from data.create_advanced_features import (
+    ADVANCED_COLUMNS, create_advanced_features, create_advanced_features_chunked,
+)
+from loop_parity import advanced_features_dataset, create_advanced_features_loop
+
+
+def test_vectorized_matches_loop():
+    features, activities, social = advanced_features_dataset(300, seed=1)
+    # Users without activities or social rows, and shuffled activity order
+    features = features.iloc[::-1].reset_index(drop=True)
+    activities = activities[activities['user_id'] != features['user_id'].iloc[0]].sample(frac=1, random_state=1)
+    social = social[social['user_id'] != features['user_id'].iloc[1]]
+    social = social.assign(likes=np.arange(len(social)) % 5)
+
+    expected = create_advanced_features_loop(features, activities, social)
+    actual = create_advanced_features(features, activities, social)
+    assert list(actual.columns) == list(expected.columns)
+    assert actual['user_id'].tolist() == expected['user_id'].tolist()
+    assert np.allclose(actual[ADVANCED_COLUMNS], expected[ADVANCED_COLUMNS], rtol=1e-9, atol=1e-12)
+
+
+def test_chunked_matches_in_memory(tmp_path):
+    features, activities, social = advanced_features_dataset(200, seed=2)
+    paths = {name: tmp_path / f"{name}.csv" for name in ("features", "activities", "social")}
+    features.to_csv(paths["features"], index=False)
+    activities.to_csv(paths["activities"], index=False)
+    social.to_csv(paths["social"], index=False)
+
+    expected = create_advanced_features(features, activities, social)
+    actual = create_advanced_features_chunked(paths["features"], paths["activities"], paths["social"], chunksize=97)
+    assert actual['user_id'].tolist() == expected['user_id'].tolist()
+    assert np.allclose(actual[ADVANCED_COLUMNS], expected[ADVANCED_COLUMNS], rtol=1e-9, atol=1e-12)
@@ -0,0 +1,81 @@
+"""Parity test: compiled NumPy models vs sklearn predict_proba / transform"""
+import time
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier, VotingClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler, RobustScaler
+
+from app.models.compiled import compile_model
+
+
+def _make_data(n_samples=2000, n_features=12, seed=42):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_samples, n_features))
+    y = (X[:, 0] + X[:, 1] * X[:, 2] + rng.normal(size=n_samples) > 0).astype(int)
+    return X, y
+
+
+def _make_ensemble(X, y):
+    """Same configuration as train_ensemble_model.py"""
+    ensemble = VotingClassifier(
+        estimators=[
+            ('logistic', LogisticRegression(C=0.1, class_weight='balanced', max_iter=2000, random_state=42, solver='liblinear')),
+            ('random_forest', RandomForestClassifier(n_estimators=100, max_depth=10, min_samples_leaf=5,
+                                                     class_weight='balanced', random_state=42)),
+            ('gradient_boosting', GradientBoostingClassifier(n_estimators=100, learning_rate=0.1, max_depth=5, random_state=42))
+        ],
+        voting='soft',
+        weights=[2, 1, 1]
+    )
+    return ensemble.fit(X, y)
+
+
+def test_ensemble_matches_sklearn():
+    X, y = _make_data()
+    ensemble = _make_ensemble(X, y)
+    compiled = compile_model(ensemble)
+    assert compiled is not None
+
+    X_probe = np.random.default_rng(0).normal(size=(500, X.shape[1])) * 2
+    assert np.allclose(compiled.predict_proba(X_probe), ensemble.predict_proba(X_probe), rtol=0, atol=1e-12)
+    assert np.array_equal(compiled.predict(X_probe), ensemble.predict(X_probe))
+    # Single-row path, list input as the predictors pass it
+    assert np.allclose(compiled.predict_proba([X_probe[0].tolist()]), ensemble.predict_proba(X_probe[:1]), rtol=0, atol=1e-12)
+
+
+def test_multiclass_models_match_sklearn():
+    X, _ = _make_data()
+    y = np.digitize(X[:, 0], [-0.5, 0.5])
+    for model in [RandomForestClassifier(n_estimators=30, random_state=0).fit(X, y),
+                  GradientBoostingClassifier(n_estimators=30, random_state=0).fit(X, y),
+                  LogisticRegression(max_iter=1000).fit(X, y)]:
+        compiled = compile_model(model)
+        assert np.allclose(compiled.predict_proba(X), model.predict_proba(X), rtol=0, atol=1e-12), type(model).__name__
+
+
+def test_scalers_match_sklearn():
+    X, _ = _make_data()
+    for scaler in [StandardScaler().fit(X), RobustScaler().fit(X)]:
+        assert np.allclose(compile_model(scaler).transform(X), scaler.transform(X), rtol=0, atol=1e-12)
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("🌲 COMPILED MODEL PARITY")
+    print("=" * 70)
+
+    test_ensemble_matches_sklearn()
+    test_multiclass_models_match_sklearn()
+    test_scalers_match_sklearn()
+    print("\n✅ Compiled models match sklearn to 1e-12")
+
+    X, y = _make_data()
+    ensemble = _make_ensemble(X, y)
+    compiled = compile_model(ensemble)
+    row = X[:1]
+    for label, predict in [("sklearn", ensemble.predict_proba), ("compiled", compiled.predict_proba)]:
+        predict(row)
+        start = time.perf_counter()
+        for _ in range(500):
+            predict(row)
+        print(f"⚡ {label:8s} single row: {(time.perf_counter() - start) / 500 * 1e6:8.1f} µs")
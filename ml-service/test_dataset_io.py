@@ -0,0 +1,73 @@
+"""Dataset I/O: Parquet and CSV paths return the same frames, with projection and filters"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from data.dataset_io import convert_csv, iter_user_chunks, parquet_path, read_dataset, write_dataset
+
+
+def _frame(n=500):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "user_id": [f"user_{i % 50:04d}" for i in range(n)],
+        "date": pd.date_range("2025-11-01", periods=n, freq="h").strftime("%Y-%m-%d"),
+        "steps": rng.integers(0, 20000, n),
+        "sleep_hours": rng.normal(7, 1, n).round(1),
+        "completed_daily_goal": rng.random(n) < 0.5,
+    })
+
+
+def test_parquet_matches_csv(tmp_path):
+    path = str(tmp_path / "activities.csv")
+    df = _frame()
+    df.to_csv(path, index=False)
+    from_csv = read_dataset(path)
+    convert_csv(path)
+    from_parquet = read_dataset(path)
+    pd.testing.assert_frame_equal(from_parquet, from_csv)
+
+
+def test_projection_and_filters(tmp_path):
+    path = str(tmp_path / "activities.csv")
+    df = _frame()
+    df.to_csv(path, index=False)
+    query = dict(columns=["user_id", "steps", "not_a_column"],
+                 filters=[("user_id", "in", ["user_0001", "user_0002"]), ("steps", ">=", 5000)])
+    from_csv = read_dataset(path, **query)
+    convert_csv(path)
+    from_parquet = read_dataset(path, **query)
+
+    assert list(from_parquet.columns) == ["user_id", "steps"]
+    expected = df[df["user_id"].isin(["user_0001", "user_0002"]) & (df["steps"] >= 5000)][["user_id", "steps"]]
+    pd.testing.assert_frame_equal(from_parquet, expected.reset_index(drop=True))
+    pd.testing.assert_frame_equal(from_csv, from_parquet)
+
+
+def test_write_series_and_float_roundtrip(tmp_path):
+    X = pd.DataFrame(np.random.default_rng(1).normal(size=(100, 4)), columns=list("abcd"))
+    y = pd.Series(np.arange(100) % 2, name="dropout_label")
+    assert write_dataset(X, str(tmp_path / "X_train.csv")) == parquet_path(str(tmp_path / "X_train.csv"))
+    write_dataset(y, str(tmp_path / "y_dropout_train.csv"))
+
+    # Floats come back bit-identical, unlike a CSV text round trip
+    assert np.array_equal(read_dataset(str(tmp_path / "X_train.csv")).values, X.values)
+    assert np.array_equal(read_dataset(str(tmp_path / "y_dropout_train.csv")).values.ravel(), y.values)
+
+
+def test_regenerated_csv_wins_over_stale_parquet(tmp_path):
+    path = str(tmp_path / "features.csv")
+    _frame().to_csv(path, index=False)
+    convert_csv(path)
+
+    # A generator rewrites the CSV after the one-time conversion
+    fresh = _frame(200).sort_values("user_id", kind="stable")
+    fresh.to_csv(path, index=False)
+    stamp = os.path.getmtime(parquet_path(path)) + 10
+    os.utime(path, (stamp, stamp))
+
+    assert len(read_dataset(path)) == 200
+    assert sum(len(chunk) for chunk in iter_user_chunks(path, 64)) == 200
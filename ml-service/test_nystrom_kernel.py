@@ -0,0 +1,62 @@
+"""Nystrom mode of the quantum kernel: approximation quality and the landmark-only QSVM"""
+import numpy as np
+
+from app.quantum.hybrid_model import QuantumSupportVectorMachine
+from app.quantum.kernel import NystromFeatureMap, QuantumKernelEngine, nystrom_report
+
+
+def _data(n=600, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.random((n, 6))
+    y = (X[:, 0] + 0.5 * X[:, 1] + 0.1 * rng.normal(size=n) > 0.8).astype(int)
+    return X[:500], y[:500], X[500:], y[500:]
+
+
+def test_feature_map_approximates_kernel():
+    X = np.random.default_rng(0).random((300, 4))
+    engine = QuantumKernelEngine(n_qubits=4)
+    exact = engine.gram(X, X)
+    errors = []
+    for m in (8, 32, 128):
+        features = NystromFeatureMap(engine, n_landmarks=m).fit(X).transform(X)
+        assert features.shape == (300, m)
+        errors.append(np.linalg.norm(exact - features @ features.T) / np.linalg.norm(exact))
+    assert errors[0] > errors[1] > errors[2]
+    # The 4-qubit kernel has rank <= 3^4, so enough landmarks reproduce it
+    assert errors[2] < 1e-6
+
+
+def test_nystrom_qsvm_evaluates_only_landmarks(tmp_path):
+    X_train, y_train, X_test, y_test = _data()
+    exact = QuantumSupportVectorMachine(n_qubits=4).fit(X_train, y_train)
+    nystrom = QuantumSupportVectorMachine(n_qubits=4, n_landmarks=64).fit(X_train, y_train)
+
+    assert nystrom.landmarks.shape == (64, 6)
+    agreement = (nystrom.predict(X_test) == exact.predict(X_test)).mean()
+    assert agreement > 0.9
+    assert (nystrom.predict(X_test) == y_test).mean() > 0.7
+
+    path = str(tmp_path / "qsvm_nystrom.npz")
+    nystrom.save(path)
+    loaded = QuantumSupportVectorMachine.load(path)
+    assert loaded.n_landmarks == 64
+    assert np.allclose(loaded.decision_function(X_test), nystrom.decision_function(X_test))
+
+
+def test_report_fields():
+    report = nystrom_report(np.random.default_rng(1).random((200, 4)), landmark_counts=(4, 16), sample_size=100)
+    assert [row["n_landmarks"] for row in report] == [4, 16]
+    assert report[0]["relative_error"] > report[1]["relative_error"]
+    assert report[1]["kernel_evaluations"] < report[1]["exact_kernel_evaluations"]
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("🔗 NYSTROM QUANTUM KERNEL: ERROR VS SPEED")
+    print("=" * 70)
+
+    X = np.random.default_rng(2).random((20000, 15))
+    print(f"\n{'m':>6} {'rel. error':>11} {'exact s':>9} {'nystrom s':>10} {'kernel evals':>14}")
+    for row in nystrom_report(X, landmark_counts=(8, 16, 32, 64, 128, 256), sample_size=4000):
+        print(f"{row['n_landmarks']:>6} {row['relative_error']:>11.2e} {row['exact_seconds']:>9.3f} "
+              f"{row['nystrom_seconds']:>10.3f} {row['kernel_evaluations']:>8} / {row['exact_kernel_evaluations']}")
@@ -0,0 +1,60 @@
+"""Parallel model search: parity with sklearn's serial scoring, and resuming from the results file"""
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import f1_score
+from sklearn.model_selection import cross_val_score
+
+from training import parallel_search
+from training.parallel_search import fit_candidate, run_search
+
+
+def _data():
+    X, y = make_classification(n_samples=300, n_features=8, random_state=0)
+    return X[:240], y[:240], X[240:], y[240:]
+
+
+def _candidates():
+    return {
+        'RandomForest-1': RandomForestClassifier(n_estimators=20, max_depth=4, random_state=42, n_jobs=-1),
+        'GradientBoosting-1': GradientBoostingClassifier(n_estimators=20, random_state=42),
+        'LogisticRegression': LogisticRegression(max_iter=500),
+    }
+
+
+def test_parallel_search_matches_serial_scoring(tmp_path):
+    X_train, y_train, X_test, y_test = _data()
+    candidates = _candidates()
+    search = run_search(candidates, X_train, y_train, X_test, y_test, scoring='f1', cv=4, workers=3,
+                        results_path=str(tmp_path / "search.jsonl"))
+
+    assert list(search.index) == list(candidates)
+    for name, estimator in candidates.items():
+        cv_scores = cross_val_score(estimator, X_train, y_train, cv=4, scoring='f1')
+        assert np.isclose(search.loc[name, 'cv_mean'], cv_scores.mean())
+        assert np.isclose(search.loc[name, 'cv_std'], cv_scores.std())
+        model = fit_candidate(estimator, X_train, y_train)
+        assert np.isclose(search.loc[name, 'holdout_score'], f1_score(y_test, model.predict(X_test)))
+
+
+def test_rerun_resumes_from_results_file(tmp_path, monkeypatch):
+    X_train, y_train, X_test, y_test = _data()
+    path = str(tmp_path / "search.jsonl")
+    first = run_search(_candidates(), X_train, y_train, X_test, y_test, cv=3, workers=1, results_path=path)
+
+    def fail(*args):
+        raise AssertionError("recorded fit was rerun")
+
+    monkeypatch.setattr(parallel_search, "_run_task", fail)
+    second = run_search(_candidates(), X_train, y_train, X_test, y_test, cv=3, workers=1, results_path=path)
+    assert first[['holdout_score', 'cv_mean', 'cv_std']].equals(second[['holdout_score', 'cv_mean', 'cv_std']])
+
+    # Changed params or data are new fits
+    changed = _candidates()
+    changed['LogisticRegression'].set_params(C=0.5)
+    with pytest.raises(AssertionError):
+        run_search(changed, X_train, y_train, X_test, y_test, cv=3, workers=1, results_path=path)
+    with pytest.raises(AssertionError):
+        run_search(_candidates(), X_train[1:], y_train[1:], X_test, y_test, cv=3, workers=1, results_path=path)
@@ -0,0 +1,39 @@
+"""QSVM: dual solution on the precomputed quantum kernel, sparse support set, persistence"""
+import numpy as np
+from sklearn.svm import SVC
+
+from app.quantum.hybrid_model import QuantumSupportVectorMachine
+from app.quantum.kernel import QuantumKernelEngine
+
+
+def _data(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.random((n, 6))
+    y = (X[:, 0] + 0.5 * X[:, 1] + 0.1 * rng.normal(size=n) > 0.8).astype(int)
+    return X[:240], y[:240], X[240:], y[240:]
+
+
+def test_matches_svc_on_full_gram_with_sparse_support():
+    X_train, y_train, X_test, y_test = _data()
+    qsvm = QuantumSupportVectorMachine(n_qubits=4, C=1.0).fit(X_train, y_train)
+
+    engine = QuantumKernelEngine(n_qubits=4)
+    svc = SVC(C=1.0, kernel='precomputed').fit(engine.gram(X_train, X_train), y_train)
+    assert np.allclose(qsvm.decision_function(X_test), svc.decision_function(engine.gram(X_test, X_train)))
+    assert np.array_equal(qsvm.predict(X_test), svc.predict(engine.gram(X_test, X_train)))
+
+    assert len(qsvm.support_vectors) < len(X_train)
+    assert np.all(qsvm.alphas > 0) and np.all(qsvm.alphas <= 1.0 + 1e-9)
+    assert (qsvm.predict(X_test) == y_test).mean() > 0.7
+
+
+def test_save_load_keeps_only_support_set(tmp_path):
+    X_train, y_train, X_test, _ = _data(seed=1)
+    qsvm = QuantumSupportVectorMachine(n_qubits=4).fit(X_train, y_train)
+    path = str(tmp_path / "qsvm.npz")
+    qsvm.save(path)
+
+    loaded = QuantumSupportVectorMachine.load(path)
+    assert loaded.support_vectors.shape == qsvm.support_vectors.shape
+    assert loaded.n_training_samples == len(X_train)
+    assert np.allclose(loaded.decision_function(X_test), qsvm.decision_function(X_test))
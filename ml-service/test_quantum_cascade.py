@@ -0,0 +1,103 @@
+"""Cascade mode of the hybrid predictor: skipping the circuit never changes the risk bucket"""
+import numpy as np
+
+from app.quantum.hybrid_model import QuantumEnhancedDropoutPredictor, RISK_THRESHOLDS, quantum_range_margin, risk_level
+from app.quantum.statevector import StatevectorQuantumCircuit
+
+
+class _FixedClassical:
+    """Classical ensemble stand-in returning a preset probability"""
+
+    def __init__(self):
+        self.probability = 0.5
+
+    def predict_proba(self, X):
+        return np.array([[1 - self.probability, self.probability]])
+
+
+def _predictors(thresholds=None, quantum_weight=None):
+    full = QuantumEnhancedDropoutPredictor(n_qubits=4, backend="numpy", cascade=False)
+    cascade = QuantumEnhancedDropoutPredictor(n_qubits=4, backend="numpy", cascade=True,
+                                              cascade_thresholds=thresholds)
+    cascade.quantum_circuit.weights = full.quantum_circuit.weights
+    cascade.calibrate_quantum_range()
+    full.classical_model = cascade.classical_model = _FixedClassical()
+    if quantum_weight is not None:
+        for model in (full, cascade):
+            model.alpha, model.beta = 1 - quantum_weight, quantum_weight
+    return full, cascade
+
+
+def _users(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [{
+        'days_active': int(rng.integers(0, 60)),
+        'avg_steps': float(rng.uniform(500, 15000)),
+        'meditation_streak': int(rng.integers(0, 30)),
+        'completion_rate': float(rng.random()),
+        'social_score': float(rng.random()),
+    } for _ in range(n)]
+
+
+def test_quantum_range_bounds_circuit_output():
+    _, cascade = _predictors()
+    low, high = cascade.quantum_range
+    X = np.random.default_rng(1).normal(size=(2000, 15)) * 5
+    probs = cascade.quantum_circuit.predict_batch(X)
+    assert low <= probs.min() and probs.max() <= high
+
+
+def test_quantum_range_covers_points_between_grid_nodes():
+    rng = np.random.default_rng(2)
+    X = rng.random((20000, 4))
+    for seed in range(5):
+        circuit = StatevectorQuantumCircuit(n_qubits=4, n_layers=3)
+        circuit.weights = np.random.default_rng(seed).normal(size=(3, 4, 3)) * 2
+        _, cascade = _predictors()
+        cascade.quantum_circuit = circuit
+        low, high = cascade.calibrate_quantum_range()
+        probs = (circuit.expectations(X) + 1) / 2
+        assert low <= probs.min() and probs.max() <= high
+
+
+def test_quantum_range_margin_from_curvature_bound():
+    # (4 qubits * (pi / 16) / 2)^2 / 4
+    assert np.isclose(quantum_range_margin(4), (np.pi / 8) ** 2 / 4)
+    assert quantum_range_margin(4, grid=33) < quantum_range_margin(4)
+
+
+def test_skipped_requests_keep_the_risk_bucket():
+    for thresholds in (None, (0.6,)):
+        full, cascade = _predictors(thresholds, quantum_weight=0.1)
+        assert set(RISK_THRESHOLDS) <= set(cascade.cascade_thresholds)
+        paths = []
+        for i, user in enumerate(_users(300)):
+            full.classical_model.probability = (i % 100) / 99
+            expected, actual = full.predict(user), cascade.predict(user)
+            paths.append(actual["inference_path"])
+            assert actual["classical_component"] == expected["classical_component"]
+            assert actual["prediction"] == expected["prediction"]
+            assert actual["risk_level"] == expected["risk_level"] == risk_level(expected["dropout_probability"])
+            if actual["inference_path"] == "classical_only":
+                # No point value was computed, only the interval the blend lies in
+                assert "quantum_component" not in actual and "dropout_probability" not in actual
+                low, high = actual["dropout_probability_range"]
+                assert low <= expected["dropout_probability"] <= high
+                assert not any(low <= threshold < high for threshold in cascade.cascade_thresholds)
+            else:
+                assert actual["dropout_probability"] == expected["dropout_probability"]
+        # Classical probabilities far from every threshold skip the circuit
+        assert 0 < paths.count("classical_only") < len(paths)
+
+
+def test_trained_weights_cascade_with_default_weighting():
+    full, cascade = _predictors()
+    for i, user in enumerate(_users(100)):
+        full.classical_model.probability = (i % 100) / 99
+        expected, actual = full.predict(user), cascade.predict(user)
+        assert actual["risk_level"] == expected["risk_level"]
+
+
+def test_risk_thresholds_cover_risk_levels():
+    assert RISK_THRESHOLDS == (0.4, 0.5, 0.7)
+    assert [risk_level(p) for p in (0.1, 0.4, 0.45, 0.7, 0.9)] == ["low", "low", "medium", "medium", "high"]
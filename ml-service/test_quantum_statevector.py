@@ -0,0 +1,49 @@
+"""Parity test: NumPy statevector backend vs PennyLane default.qubit"""
+import time
+import numpy as np
+
+from app.quantum.statevector import StatevectorQuantumCircuit
+from app.quantum.quantum_circuit import QuantumPatternRecognition
+
+WEIGHTS_PATH = './models/saved/quantum_weights.npy'
+
+
+def _load_weights():
+    try:
+        return np.load(WEIGHTS_PATH)
+    except FileNotFoundError:
+        return np.random.default_rng(7).normal(size=(3, 4, 3))
+
+
+def test_statevector_matches_pennylane():
+    weights = _load_weights()
+    pennylane_circuit = QuantumPatternRecognition(n_qubits=4, n_layers=3)
+    pennylane_circuit.weights = weights
+    numpy_circuit = StatevectorQuantumCircuit(n_qubits=4, n_layers=3)
+    numpy_circuit.weights = weights
+
+    X = np.random.default_rng(0).normal(size=(64, 15)) * 3
+    expected = pennylane_circuit.predict_batch(X)
+    actual = numpy_circuit.predict_batch(X)
+    assert np.allclose(actual, expected, atol=1e-10), np.abs(actual - expected).max()
+
+    # Single-sample path and short vectors (fewer features than qubits)
+    for x in [X[0], X[1, :4], np.array([0.2, 0.9, 0.4])]:
+        assert abs(numpy_circuit.predict(x) - pennylane_circuit.predict(x)) < 1e-10
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("🔮 STATEVECTOR BACKEND PARITY")
+    print("=" * 70)
+
+    test_statevector_matches_pennylane()
+    print("\n✅ NumPy backend matches PennyLane to 1e-10")
+
+    numpy_circuit = StatevectorQuantumCircuit()
+    numpy_circuit.weights = _load_weights()
+    X = np.random.default_rng(1).normal(size=(10000, 15))
+    start = time.perf_counter()
+    numpy_circuit.predict_batch(X)
+    elapsed = time.perf_counter() - start
+    print(f"⚡ {len(X)} samples in {elapsed * 1000:.1f} ms ({elapsed / len(X) * 1e6:.2f} µs/sample)")
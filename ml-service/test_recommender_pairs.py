@@ -0,0 +1,21 @@
+"""Parity test: cross-joined recommender pairs vs the original nested loop"""
+import pandas as pd
+
+from loop_parity import build_recommender_pairs_loop, recommender_dataset
+from training.recommender_pairs import CHALLENGE_TYPES, build_recommender_pairs
+
+
+def test_cross_join_matches_loop_exactly():
+    features, challenges = recommender_dataset(300, seed=5)
+    challenges = challenges.sample(frac=1, random_state=5)
+    expected = build_recommender_pairs_loop(features, challenges, CHALLENGE_TYPES)
+    actual = build_recommender_pairs(features, challenges, CHALLENGE_TYPES)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False, check_exact=True)
+
+
+def test_missing_feature_columns_use_loop_defaults():
+    features, challenges = recommender_dataset(50, seed=6)
+    features = features.drop(columns=['meditation_streak', 'avg_sleep_hours'])
+    expected = build_recommender_pairs_loop(features, challenges, CHALLENGE_TYPES)
+    actual = build_recommender_pairs(features, challenges, CHALLENGE_TYPES)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False, check_exact=True)
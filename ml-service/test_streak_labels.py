@@ -0,0 +1,23 @@
+"""Parity test: grouped streak training set vs the original per-user loop"""
+import pandas as pd
+
+from loop_parity import build_streak_training_data_loop, streak_dataset
+from training.streak_labels import activity_stats, activity_stats_chunked, build_streak_training_data
+
+
+def test_grouped_matches_loop_exactly():
+    features, activities = streak_dataset(400, seed=3)
+    # Shuffled log, and a feature row without any activity
+    activities = activities[activities['user_id'] != features['user_id'].iloc[5]].sample(frac=1, random_state=3)
+    expected = build_streak_training_data_loop(features, activities)
+    actual = build_streak_training_data(features, activity_stats(activities))
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+
+
+def test_chunked_matches_in_memory(tmp_path):
+    features, activities = streak_dataset(300, seed=4)
+    path = tmp_path / "activities.csv"
+    activities.to_csv(path, index=False)
+    expected = build_streak_training_data(features, activity_stats(activities))
+    actual = build_streak_training_data(features, activity_stats_chunked(str(path), chunksize=101))
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
@@ -0,0 +1,97 @@
+"""Parity test: streaming temporal features vs the batch computations in data/"""
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from app.feature_store import FeatureStore
+from app.temporal_features import TEMPORAL_FEATURES, temporal_features_frame
+
+
+def _make_activities(n_users=20, seed=3):
+    rng = np.random.default_rng(seed)
+    start = date(2025, 11, 5)
+    rows = []
+    for u in range(n_users):
+        n_days = int(rng.integers(2, 45))
+        for d in range(n_days):
+            rows.append({
+                "user_id": f"user_{u:04d}",
+                "date": (start + timedelta(days=d)).isoformat(),
+                "day_number": d,
+                "steps": int(rng.integers(500, 12000)),
+                "engagement_score": float(rng.uniform(0, 1)),
+                "completed_daily_goal": bool(rng.random() < 0.6),
+            })
+    # Events arrive interleaved across users
+    return pd.DataFrame(rows).sample(frac=1, random_state=seed)
+
+
+def _batch_features(user_activities):
+    """signal_rich_generator._calculate_temporal_features + create_advanced_features.py, verbatim"""
+    engagement = user_activities["engagement_score"]
+    activity_slope = (engagement.tail(7).values.mean() - engagement.head(7).values.mean()) / 7
+    three_day_decline = user_activities.iloc[-10:-3]["engagement_score"].mean() - engagement.tail(3).mean()
+    consistency_score = 1 / (1 + engagement.std())
+    momentum = engagement.tail(7).mean() - engagement.mean()
+
+    if len(user_activities) >= 14:
+        completion_trend = (user_activities.tail(7)["completed_daily_goal"].mean()
+                            - user_activities.head(7)["completed_daily_goal"].mean())
+        early_steps = user_activities.head(7)["steps"].mean()
+        steps_trend = (user_activities.tail(7)["steps"].mean() - early_steps) / (early_steps + 1)
+    else:
+        completion_trend = steps_trend = 0
+    if len(user_activities) >= 21:
+        week1 = user_activities.iloc[:7]["completed_daily_goal"].mean()
+        week2 = user_activities.iloc[7:14]["completed_daily_goal"].mean()
+        week3 = user_activities.iloc[14:21]["completed_daily_goal"].mean()
+        engagement_momentum = (week3 - week2) - (week2 - week1)
+    else:
+        engagement_momentum = 0
+    behavioral_consistency = user_activities["completed_daily_goal"].sum() / max(len(user_activities), 1)
+
+    values = [activity_slope, three_day_decline, consistency_score, momentum,
+              completion_trend, steps_trend, engagement_momentum, behavioral_consistency]
+    return {name: 0.0 if pd.isna(value) else value for name, value in zip(TEMPORAL_FEATURES, values)}
+
+
+def test_streaming_matches_batch():
+    activities = _make_activities()
+    streamed = temporal_features_frame(activities).set_index("user_id")
+    for user_id, user_activities in activities.sort_values("day_number").groupby("user_id"):
+        expected = _batch_features(user_activities)
+        for name in TEMPORAL_FEATURES:
+            assert np.isclose(streamed.loc[user_id, name], expected[name], rtol=1e-9, atol=1e-12), (user_id, name)
+        assert streamed.loc[user_id, "temporal_days"] == len(user_activities)
+
+
+def test_feature_store_serves_fresh_temporal_features():
+    activities = _make_activities(n_users=5).sort_values("date", kind="stable")
+    store = FeatureStore()
+    rows = activities.to_dict("records")
+    user_id = rows[-1]["user_id"]
+    store.ingest(activities=rows[:-1])
+    before = store.get_features(user_id)
+
+    store.ingest(activities=rows[-1:])
+    after = store.get_features(user_id)
+    assert after["temporal_days"] == before["temporal_days"] + 1
+    expected = _batch_features(activities[activities["user_id"] == user_id].sort_values("day_number"))
+    for name in TEMPORAL_FEATURES:
+        assert np.isclose(after[name], expected[name], rtol=1e-9, atol=1e-12), name
+
+    # A replayed day is ignored by every aggregate, not just the temporal features
+    store.ingest(activities=rows[-1:])
+    replayed = store.get_features(user_id)
+    for name in ("days_active", "total_days", "current_streak", "meditation_streak",
+                 "active_days_7d", "active_days_30d", "steps_mean_7d", "goal_rate_30d"):
+        assert replayed[name] == after[name], name
+    assert replayed == after
+    assert store.stats()["late_activities"] == 1
+
+    # So is a late day that arrives after a newer one
+    late = dict(rows[-1], date=(date.fromisoformat(rows[-1]["date"]) - timedelta(days=60)).isoformat())
+    store.ingest(activities=[late])
+    assert store.get_features(user_id) == after
+    assert store.stats()["late_activities"] == 2
@@ -11,18 +11,20 @@ from sklearn.model_selection import cross_val_score
 from sklearn.metrics import accuracy_score, classification_report, f1_score
 from sklearn.preprocessing import StandardScaler
 
+from data.dataset_io import read_dataset
+
 print("="*70)
 print("🚀 TRAINING ENSEMBLE MODEL - COMPETITION EDGE")
 print("="*70)
 
 # Load data
 print("\n1️⃣ Loading combined dataset...")
-df_perfect = pd.read_csv('data/features_perfect.csv')
-df_noisy = pd.read_csv('data/features_noisy.csv')
-
 with open('models/saved/feature_names.txt', 'r') as f:
     feature_names = [line.strip() for line in f.readlines()]
 
+df_perfect = read_dataset('data/features_perfect.csv', columns=feature_names + ['user_type'])
+df_noisy = read_dataset('data/features_noisy.csv', columns=feature_names + ['user_type'])
+
 X_perfect = df_perfect[feature_names].values
 y_perfect = (df_perfect['user_type'] == 'dropout').astype(int).values
 
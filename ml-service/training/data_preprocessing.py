@@ -9,6 +9,10 @@ from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.model_selection import train_test_split
 import logging
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from data.dataset_io import read_dataset, write_dataset
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -26,11 +30,12 @@ class DataCleaner:
         """Load all datasets."""
         logger.info("Loading datasets...")
         
-        self.users = pd.read_csv(f"{self.data_dir}/users.csv")
-        self.activities = pd.read_csv(f"{self.data_dir}/activities.csv")
-        self.challenges = pd.read_csv(f"{self.data_dir}/challenges.csv")
-        self.social = pd.read_csv(f"{self.data_dir}/social.csv")
-        self.features = pd.read_csv(f"{self.data_dir}/features.csv")
+        # Only the feature matrix is cleaned; the event logs are loaded for their counts
+        self.users = read_dataset(f"{self.data_dir}/users.csv", columns=["user_id"])
+        self.activities = read_dataset(f"{self.data_dir}/activities.csv", columns=["user_id"])
+        self.challenges = read_dataset(f"{self.data_dir}/challenges.csv", columns=["user_id"])
+        self.social = read_dataset(f"{self.data_dir}/social.csv", columns=["user_id"])
+        self.features = read_dataset(f"{self.data_dir}/features.csv")
         
         logger.info(f"✓ Loaded {len(self.users)} users")
         logger.info(f"✓ Loaded {len(self.activities)} activity records")
@@ -293,17 +298,17 @@ class DataCleaner:
         logger.info(f"\n💾 Saving processed data to {output_dir}...")
         
         # Save splits
-        splits['X_train_scaled'].to_csv(f"{output_dir}/X_train.csv", index=False)
-        splits['X_val_scaled'].to_csv(f"{output_dir}/X_val.csv", index=False)
-        splits['X_test_scaled'].to_csv(f"{output_dir}/X_test.csv", index=False)
+        write_dataset(splits['X_train_scaled'], f"{output_dir}/X_train.csv")
+        write_dataset(splits['X_val_scaled'], f"{output_dir}/X_val.csv")
+        write_dataset(splits['X_test_scaled'], f"{output_dir}/X_test.csv")
         
-        splits['y_dropout_train'].to_csv(f"{output_dir}/y_dropout_train.csv", index=False)
-        splits['y_dropout_val'].to_csv(f"{output_dir}/y_dropout_val.csv", index=False)
-        splits['y_dropout_test'].to_csv(f"{output_dir}/y_dropout_test.csv", index=False)
+        write_dataset(splits['y_dropout_train'], f"{output_dir}/y_dropout_train.csv")
+        write_dataset(splits['y_dropout_val'], f"{output_dir}/y_dropout_val.csv")
+        write_dataset(splits['y_dropout_test'], f"{output_dir}/y_dropout_test.csv")
         
-        splits['y_engagement_train'].to_csv(f"{output_dir}/y_engagement_train.csv", index=False)
-        splits['y_engagement_val'].to_csv(f"{output_dir}/y_engagement_val.csv", index=False)
-        splits['y_engagement_test'].to_csv(f"{output_dir}/y_engagement_test.csv", index=False)
+        write_dataset(splits['y_engagement_train'], f"{output_dir}/y_engagement_train.csv")
+        write_dataset(splits['y_engagement_val'], f"{output_dir}/y_engagement_val.csv")
+        write_dataset(splits['y_engagement_test'], f"{output_dir}/y_engagement_test.csv")
         
         # Save scaler
         import joblib
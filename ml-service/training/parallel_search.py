@@ -0,0 +1,226 @@
+"""
+Parallel Model Search
+Candidate configs x CV folds in a process pool, over memory-mapped training matrices
+
+The training scripts compare a handful of configs (rf_configs, gb_configs,
+a GridSearchCV grid) and cross-validate the winner. run_search() turns every
+(candidate, fold) fit, plus one fit scored on the holdout set, into a task
+for a pool of worker processes sized to the machine:
+
+- X/y are saved once as .npy files and opened with mmap_mode='r' in each
+  worker, so the matrices are shared through the page cache instead of
+  pickled to every task
+- Each finished task is appended to a JSON-lines results file; rerunning the
+  same search skips tasks already recorded for the same candidate params,
+  data and scoring, so an interrupted retrain resumes where it stopped
+
+Scores follow sklearn's scorer convention (greater is better, e.g.
+neg_mean_absolute_error). Fitted models are not shipped back from the
+workers; fit_candidate() refits the chosen one in the parent.
+
+The pool forks: the training scripts are top-level code, which spawn-style
+start methods would re-run in every worker. Where fork is unavailable
+(Windows) the search runs inline. Scripts that search take --workers N
+(workers_arg_parser) to size the pool; finished fits live under models/search/.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone, is_classifier
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import check_cv
+
+logger = logging.getLogger(__name__)
+
+HOLDOUT = "holdout"
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def workers_arg_parser(description: str) -> argparse.ArgumentParser:
+    """Command-line parser with the --workers option of the searching training scripts"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--workers', type=int, default=None, help='Search processes (default: one per CPU)')
+    return parser
+
+
+def _fork_context():
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    logger.warning("fork start method not available; running the model search in one process")
+    return None
+
+
+def share_arrays(arrays: Dict[str, np.ndarray], directory: str) -> Dict[str, str]:
+    """Save arrays as .npy files for workers to memory-map; returns name -> path"""
+    paths = {}
+    for name, values in arrays.items():
+        if values is None:
+            continue
+        path = os.path.join(directory, f"{name}.npy")
+        np.save(path, np.ascontiguousarray(np.asarray(values)))
+        paths[name] = path
+    return paths
+
+
+def _fingerprint(arrays: Dict[str, np.ndarray]) -> str:
+    digest = hashlib.sha1()
+    for name in sorted(arrays):
+        values = arrays[name]
+        if values is None:
+            continue
+        values = np.ascontiguousarray(np.asarray(values))
+        digest.update(f"{name}:{values.dtype}:{values.shape}".encode())
+        digest.update(values.data if values.dtype != object else repr(values.tolist()).encode())
+    return digest.hexdigest()
+
+
+def _task_key(name, estimator, fold, scoring, cv, data_fingerprint) -> str:
+    params = repr(sorted(estimator.get_params(deep=True).items()))
+    payload = f"{name}|{type(estimator).__name__}|{params}|{fold}|{scoring}|{cv}|{data_fingerprint}"
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def _load_results(path: Optional[str]) -> Dict[str, dict]:
+    if not path or not os.path.exists(path):
+        return {}
+    done = {}
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Partial line from an interrupted run
+                continue
+            done[record["key"]] = record
+    return done
+
+
+def _single_threaded(estimator):
+    """Leave the cores to the pool instead of each fit spawning its own threads"""
+    if "n_jobs" in estimator.get_params(deep=False):
+        estimator = clone(estimator).set_params(n_jobs=1)
+    return estimator
+
+
+def _run_task(estimator, fold, paths, scoring, cv):
+    """Fit one candidate on one fold (or the full training set for HOLDOUT) and score it"""
+    X_train = np.load(paths["X_train"], mmap_mode="r")
+    y_train = np.load(paths["y_train"], mmap_mode="r")
+    model = clone(estimator)
+    start = time.perf_counter()
+    if fold == HOLDOUT:
+        model.fit(X_train, y_train)
+        X_score = np.load(paths["X_eval"], mmap_mode="r")
+        y_score = np.load(paths["y_eval"], mmap_mode="r")
+    else:
+        splitter = check_cv(cv, y_train, classifier=is_classifier(model))
+        train_index, test_index = list(splitter.split(X_train, y_train))[fold]
+        model.fit(X_train[train_index], y_train[train_index])
+        X_score, y_score = X_train[test_index], y_train[test_index]
+    score = get_scorer(scoring)(model, X_score, y_score)
+    return float(score), time.perf_counter() - start
+
+
+def run_search(candidates: Dict[str, object], X_train, y_train, X_eval=None, y_eval=None,
+               scoring: str = "accuracy", cv: Optional[int] = 5, workers: Optional[int] = None,
+               results_path: Optional[str] = None) -> pd.DataFrame:
+    """
+    Score every candidate with cross-validation and on the holdout set, in parallel
+
+    Args:
+        candidates: Name -> unfitted estimator, in the order results are reported
+        X_train, y_train: Training matrices; CV folds are cut from these
+        X_eval, y_eval: Holdout set; each candidate is fit on all of X_train and scored here
+        scoring: sklearn scorer name
+        cv: Number of folds (stratified for classifiers, as cross_val_score), or None to skip CV
+        workers: Processes in the pool (defaults to the CPU count; 1 runs inline)
+        results_path: JSON-lines file recording finished tasks, for resuming
+
+    Returns:
+        DataFrame indexed by candidate with holdout_score, cv_mean, cv_std and fit_seconds
+    """
+    workers = workers or default_workers()
+    X_train, y_train = np.asarray(X_train), np.asarray(y_train)
+    has_holdout = X_eval is not None and y_eval is not None
+    arrays = {"X_train": X_train, "y_train": y_train}
+    if has_holdout:
+        arrays.update(X_eval=np.asarray(X_eval), y_eval=np.asarray(y_eval))
+    data_fingerprint = _fingerprint(arrays)
+
+    folds = list(range(cv)) if cv else []
+    if has_holdout:
+        folds.append(HOLDOUT)
+    tasks = [
+        (name, fold, _task_key(name, estimator, fold, scoring, cv, data_fingerprint))
+        for name, estimator in candidates.items() for fold in folds
+    ]
+    done = _load_results(results_path)
+    pending = [task for task in tasks if task[2] not in done]
+    if len(pending) < len(tasks):
+        logger.info(f"  Resuming: {len(tasks) - len(pending)}/{len(tasks)} fits already recorded")
+
+    if results_path:
+        os.makedirs(os.path.dirname(os.path.abspath(results_path)), exist_ok=True)
+
+    def record(name, fold, key, score, seconds):
+        entry = {"key": key, "candidate": name, "fold": fold, "score": score, "seconds": round(seconds, 3)}
+        done[key] = entry
+        if results_path:
+            with open(results_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+
+    if pending:
+        share_dir = tempfile.mkdtemp(prefix="search_")
+        try:
+            paths = share_arrays(arrays, share_dir)
+            context = _fork_context() if workers > 1 else None
+            if context is not None:
+                with ProcessPoolExecutor(max_workers=min(workers, len(pending)), mp_context=context) as pool:
+                    futures = {
+                        pool.submit(_run_task, _single_threaded(candidates[name]), fold, paths, scoring, cv):
+                            (name, fold, key)
+                        for name, fold, key in pending
+                    }
+                    for future in as_completed(futures):
+                        record(*futures[future], *future.result())
+            else:
+                for name, fold, key in pending:
+                    record(name, fold, key, *_run_task(candidates[name], fold, paths, scoring, cv))
+        finally:
+            shutil.rmtree(share_dir, ignore_errors=True)
+
+    rows = []
+    for name in candidates:
+        entries = [done[key] for task_name, _, key in tasks if task_name == name]
+        cv_scores = [e["score"] for e in entries if e["fold"] != HOLDOUT]
+        holdout = [e["score"] for e in entries if e["fold"] == HOLDOUT]
+        rows.append({
+            "candidate": name,
+            "holdout_score": holdout[0] if holdout else np.nan,
+            "cv_mean": np.mean(cv_scores) if cv_scores else np.nan,
+            "cv_std": np.std(cv_scores) if cv_scores else np.nan,
+            "fit_seconds": sum(e["seconds"] for e in entries),
+        })
+    return pd.DataFrame(rows).set_index("candidate")
+
+
+def fit_candidate(estimator, X_train, y_train):
+    """Refit the selected candidate on the full training set (same params and seed as in the search)"""
+    return clone(estimator).fit(X_train, y_train)
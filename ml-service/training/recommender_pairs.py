@@ -0,0 +1,103 @@
+"""
+Challenge Recommender Training Set
+User x challenge pairs for train_recommender.py, built as a cross join
+
+The pair table is features x catalog in one merge (users outer, catalog
+inner, the loop's order). Labels come from a single
+groupby(['user_id', 'category']) over the challenge log; pairs in categories
+the user never attempted get the difficulty-tier synthetic label via
+np.select. test_recommender_pairs.py checks the result against the original
+nested loop.
+"""
+import numpy as np
+import pandas as pd
+
+FEATURE_COLUMNS = [
+    'user_id', 'days_active', 'avg_steps_last_7_days', 'meditation_streak', 'avg_meditation_minutes',
+    'avg_sleep_hours', 'challenge_completion_rate', 'social_engagement_score',
+]
+CHALLENGE_COLUMNS = ['user_id', 'category', 'completed']
+
+# Challenge catalog the recommender is trained on; saved as challenge_metadata.csv
+CHALLENGE_TYPES = [
+    {"id": "C001", "name": "Morning Meditation", "category": "meditation", "difficulty": 2},
+    {"id": "C002", "name": "10K Steps Challenge", "category": "exercise", "difficulty": 3},
+    {"id": "C003", "name": "Hydration Hero", "category": "water", "difficulty": 1},
+    {"id": "C004", "name": "Evening Yoga", "category": "exercise", "difficulty": 2},
+    {"id": "C005", "name": "Mindful Eating", "category": "meals", "difficulty": 4},
+    {"id": "C006", "name": "Sleep Sanctuary", "category": "sleep", "difficulty": 3},
+    {"id": "C007", "name": "7-Day Streak", "category": "exercise", "difficulty": 5},
+    {"id": "C008", "name": "Breathwork", "category": "meditation", "difficulty": 1},
+]
+
+# (difficulty upper bound, completion rate threshold) for unattempted categories
+SYNTHETIC_LABEL_TIERS = [(2, 0.3), (3, 0.5)]
+HARD_CHALLENGE_THRESHOLD = 0.7
+
+
+def _feature_column(features_df, column, default):
+    if column in features_df.columns:
+        return features_df[column]
+    return pd.Series(default, index=features_df.index)
+
+
+def build_recommender_pairs(features_df, challenges_df, challenge_types):
+    """
+    One row per (user, catalog challenge) with the user's features and the will_complete label
+
+    Args:
+        features_df: User feature rows (FEATURE_COLUMNS; missing ones use the loop's defaults)
+        challenges_df: Challenge attempts (user_id, category, completed)
+        challenge_types: Catalog entries with id, category and difficulty (CHALLENGE_TYPES)
+    """
+    if 'meditation_streak' in features_df.columns:
+        meditation = features_df['meditation_streak']
+    else:
+        meditation = _feature_column(features_df, 'avg_meditation_minutes', 0)
+    users = pd.DataFrame({
+        'user_id': features_df['user_id'],
+        'days_active': _feature_column(features_df, 'days_active', 0),
+        'avg_steps': _feature_column(features_df, 'avg_steps_last_7_days', 0),
+        'meditation_streak': meditation,
+        'avg_sleep': _feature_column(features_df, 'avg_sleep_hours', 7),
+        'challenge_completion_rate': _feature_column(features_df, 'challenge_completion_rate', 0),
+        'social_score': _feature_column(features_df, 'social_engagement_score', 0),
+    })
+    catalog = pd.DataFrame({
+        'challenge_id': [c['id'] for c in challenge_types],
+        'challenge_difficulty': [c['difficulty'] for c in challenge_types],
+        'category': [c['category'] for c in challenge_types],
+    })
+    pairs = users.merge(catalog, how='cross')
+
+    # Completion rate per attempted (user, category)
+    category_rate = (
+        challenges_df.groupby(['user_id', 'category'])['completed'].mean().rename('category_completion_rate')
+    )
+    pairs = pairs.join(category_rate, on=['user_id', 'category'])
+
+    difficulty = pairs['challenge_difficulty'].to_numpy()
+    user_rate = pairs['challenge_completion_rate'].to_numpy(dtype=float)
+    synthetic = np.select(
+        [difficulty <= bound for bound, _ in SYNTHETIC_LABEL_TIERS],
+        [user_rate > threshold for _, threshold in SYNTHETIC_LABEL_TIERS],
+        user_rate > HARD_CHALLENGE_THRESHOLD,
+    )
+    attempted = pairs['category_completion_rate'].notna().to_numpy()
+    observed = pairs['category_completion_rate'].to_numpy(dtype=float) > 0.5
+    will_complete = np.where(attempted, observed, synthetic).astype(int)
+
+    return pd.DataFrame({
+        'user_id': pairs['user_id'].to_numpy(),
+        'challenge_id': pairs['challenge_id'].to_numpy(),
+        'challenge_difficulty': difficulty,
+        # User features
+        'days_active': pairs['days_active'].to_numpy(),
+        'avg_steps': pairs['avg_steps'].to_numpy(),
+        'meditation_streak': pairs['meditation_streak'].to_numpy(),
+        'avg_sleep': pairs['avg_sleep'].to_numpy(),
+        'challenge_completion_rate': pairs['challenge_completion_rate'].to_numpy(),
+        'social_score': pairs['social_score'].to_numpy(),
+        # Target
+        'will_complete': will_complete,
+    })
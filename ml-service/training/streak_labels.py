@@ -0,0 +1,86 @@
+"""
+Streak Predictor Training Set
+Labels and activity features for train_streak_predictor.py, built with grouped windows
+
+One stable sort by (user_id, date) over the whole activity table; the last-7
+and last-3 day slices are row masks on the position counted from the end of
+each user's history. Means are integer sums over counts, so the output is
+bit-identical to the original per-user loop (loop_parity.py keeps it as the
+reference for test_streak_labels.py).
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from data.dataset_io import iter_user_chunks
+
+ACTIVITY_COLUMNS = ['user_id', 'date', 'current_streak', 'completed_daily_goal']
+FEATURE_COLUMNS = [
+    'user_id', 'days_active', 'avg_steps_last_7_days', 'avg_meditation_minutes', 'meditation_streak',
+    'social_engagement_score', 'challenge_completion_rate',
+]
+MIN_HISTORY_DAYS = 7
+
+
+def activity_stats(activities_df):
+    """Per-user streak and completion aggregates, indexed by user_id"""
+    df = activities_df[ACTIVITY_COLUMNS].sort_values(['user_id', 'date'], kind='stable')
+    users = df['user_id']
+    completed = df['completed_daily_goal'].astype(bool)
+    completion = completed.astype(float)
+    streak = df['current_streak']
+
+    position = users.groupby(users, sort=False).cumcount()
+    n_rows = position.groupby(users, sort=False).transform('size')
+    from_end = n_rows - 1 - position
+
+    return pd.DataFrame({
+        'n_rows': users.groupby(users, sort=False).size(),
+        'current_streak': streak.groupby(users, sort=False).max(),
+        'avg_streak': streak.groupby(users, sort=False).mean(),
+        'completion_rate': completion.groupby(users, sort=False).mean(),
+        'recent_completion_rate': completion.where(from_end < 7).groupby(users, sort=False).mean(),
+        # Look at last 3 days - if any failures, streak broke
+        'streak_will_break': (~completed & (from_end < 3)).groupby(users, sort=False).any().astype(int),
+    })
+
+
+def activity_stats_chunked(activities_path, chunksize):
+    """activity_stats() over an activity log streamed in user-aligned chunks"""
+    return pd.concat(
+        activity_stats(chunk) for chunk in iter_user_chunks(activities_path, chunksize, columns=ACTIVITY_COLUMNS)
+    )
+
+
+def _feature_column(features_df, column, default):
+    if column in features_df.columns:
+        return features_df[column].to_numpy()
+    return np.full(len(features_df), default)
+
+
+def build_streak_training_data(features_df, stats):
+    """One training row per features_df user with at least 7 activity days"""
+    columns = [c for c in FEATURE_COLUMNS if c in features_df.columns]
+    users = features_df[columns].join(stats, on='user_id', how='inner')
+    users = users[users['n_rows'] >= MIN_HISTORY_DAYS]
+    if 'avg_meditation_minutes' in users.columns:
+        meditation = users['avg_meditation_minutes'].to_numpy()
+    else:
+        meditation = _feature_column(users, 'meditation_streak', 0)
+    return pd.DataFrame({
+        'user_id': users['user_id'].to_numpy(),
+        'current_streak': users['current_streak'].to_numpy(),
+        'avg_streak': users['avg_streak'].to_numpy(),
+        'completion_rate': users['completion_rate'].to_numpy(),
+        'recent_completion_rate': users['recent_completion_rate'].to_numpy(),
+        'days_active': _feature_column(users, 'days_active', 0),
+        'avg_steps': _feature_column(users, 'avg_steps_last_7_days', 0),
+        'meditation_minutes': meditation,
+        'social_score': _feature_column(users, 'social_engagement_score', 0),
+        'challenge_completion': _feature_column(users, 'challenge_completion_rate', 0),
+        # Target
+        'streak_will_break': users['streak_will_break'].to_numpy(),
+    })
@@ -6,10 +6,16 @@ import pandas as pd
 import numpy as np
 import joblib
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.model_selection import train_test_split, cross_val_score
+from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from training.parallel_search import fit_candidate, run_search, workers_arg_parser
+
+args = workers_arg_parser("Train the difficulty predictor").parse_args()
 
 print("="*70)
 print("🎯 TRAINING DIFFICULTY PREDICTOR")
@@ -94,47 +100,41 @@ best_model = None
 best_score = float('inf')  # MAE (lower is better)
 best_name = ""
 
-# Random Forest Regressor
-print("\n   Random Forest Regressor:")
 rf_configs = [
     {'n_estimators': 150, 'max_depth': 10, 'min_samples_leaf': 3},
     {'n_estimators': 200, 'max_depth': 12, 'min_samples_leaf': 2},
 ]
 
+gb_configs = [
+    {'n_estimators': 150, 'learning_rate': 0.1, 'max_depth': 5},
+    {'n_estimators': 200, 'learning_rate': 0.08, 'max_depth': 6},
+]
+
+candidates = {}
 for i, config in enumerate(rf_configs, 1):
-    model = RandomForestRegressor(
+    candidates[f"RandomForest-{i}"] = RandomForestRegressor(
         random_state=42,
         n_jobs=-1,
         **config
     )
-    model.fit(X_train_scaled, y_train)
-    y_pred = model.predict(X_test_scaled)
-    mae = mean_absolute_error(y_test, y_pred)
-    print(f"     Config {i}: MAE={mae:.3f}")
-    
-    if mae < best_score:
-        best_score = mae
-        best_model = model
-        best_name = f"RandomForest-{i}"
+for i, config in enumerate(gb_configs, 1):
+    candidates[f"GradientBoosting-{i}"] = GradientBoostingRegressor(random_state=42, **config)
 
-# Gradient Boosting Regressor
-print("\n   Gradient Boosting Regressor:")
-gb_configs = [
-    {'n_estimators': 150, 'learning_rate': 0.1, 'max_depth': 5},
-    {'n_estimators': 200, 'learning_rate': 0.08, 'max_depth': 6},
-]
+search = run_search(candidates, X_train_scaled, y_train, X_test_scaled, y_test,
+                    scoring='neg_mean_absolute_error', cv=None, workers=args.workers,
+                    results_path='models/search/difficulty_predictor.jsonl')
 
-for i, config in enumerate(gb_configs, 1):
-    model = GradientBoostingRegressor(random_state=42, **config)
-    model.fit(X_train_scaled, y_train)
-    y_pred = model.predict(X_test_scaled)
-    mae = mean_absolute_error(y_test, y_pred)
-    print(f"     Config {i}: MAE={mae:.3f}")
-    
-    if mae < best_score:
-        best_score = mae
-        best_model = model
-        best_name = f"GradientBoosting-{i}"
+for family, label in [("RandomForest", "Random Forest Regressor"), ("GradientBoosting", "Gradient Boosting Regressor")]:
+    print(f"\n   {label}:")
+    for name, row in search[search.index.str.startswith(f"{family}-")].iterrows():
+        mae = -row['holdout_score']
+        print(f"     Config {name.rsplit('-', 1)[1]}: MAE={mae:.3f}")
+        
+        if mae < best_score:
+            best_score = mae
+            best_name = name
+
+best_model = fit_candidate(candidates[best_name], X_train_scaled, y_train)
 
 print(f"\n   ✓ Best model: {best_name} with MAE={best_score:.3f}")
 
@@ -158,8 +158,10 @@ within_1 = np.mean(np.abs(y_test - y_pred_clipped) <= 1.0)
 print(f"   Accuracy within ±1 level:  {within_1:.1%}")
 
 # Cross-validation
-cv_scores = -cross_val_score(best_model, X_train_scaled, y_train, cv=5, scoring='neg_mean_absolute_error')
-print(f"\n   CV MAE: {cv_scores.mean():.3f} (+/- {cv_scores.std():.3f})")
+cv = run_search({best_name: candidates[best_name]}, X_train_scaled, y_train,
+                scoring='neg_mean_absolute_error', cv=5, workers=args.workers,
+                results_path='models/search/difficulty_predictor_cv.jsonl').loc[best_name]
+print(f"\n   CV MAE: {-cv['cv_mean']:.3f} (+/- {cv['cv_std']:.3f})")
 
 # Feature importance
 print("\n6️⃣ Top features:")
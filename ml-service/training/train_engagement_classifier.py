@@ -6,10 +6,16 @@ import pandas as pd
 import numpy as np
 import joblib
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.model_selection import train_test_split, cross_val_score
+from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.metrics import accuracy_score, classification_report, f1_score
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from training.parallel_search import fit_candidate, run_search, workers_arg_parser
+
+args = workers_arg_parser("Train the engagement classifier").parse_args()
 
 print("="*70)
 print("📈 TRAINING ENGAGEMENT CLASSIFIER MODEL")
@@ -114,31 +120,11 @@ best_model = None
 best_score = 0
 best_name = ""
 
-# Random Forest
-print("\n   Random Forest:")
 rf_configs = [
     {'n_estimators': 150, 'max_depth': 12, 'min_samples_leaf': 3},
     {'n_estimators': 200, 'max_depth': 15, 'min_samples_leaf': 2},
 ]
 
-for i, config in enumerate(rf_configs, 1):
-    model = RandomForestClassifier(
-        class_weight='balanced',
-        random_state=42,
-        n_jobs=-1,
-        **config
-    )
-    model.fit(X_train_scaled, y_train)
-    score = accuracy_score(y_test, model.predict(X_test_scaled))
-    print(f"     Config {i}: {score:.2%}")
-    
-    if score > best_score:
-        best_score = score
-        best_model = model
-        best_name = f"RandomForest-{i}"
-
-# Gradient Boosting
-print("\n   Gradient Boosting:")
 gb_configs = [
     {'n_estimators': 200, 'learning_rate': 0.15, 'max_depth': 7, 'subsample': 0.8},
     {'n_estimators': 300, 'learning_rate': 0.1, 'max_depth': 8, 'subsample': 0.85},
@@ -146,17 +132,32 @@ gb_configs = [
     {'n_estimators': 350, 'learning_rate': 0.08, 'max_depth': 10, 'subsample': 0.75},
 ]
 
+candidates = {}
+for i, config in enumerate(rf_configs, 1):
+    candidates[f"RandomForest-{i}"] = RandomForestClassifier(
+        class_weight='balanced',
+        random_state=42,
+        n_jobs=-1,
+        **config
+    )
 for i, config in enumerate(gb_configs, 1):
-    model = GradientBoostingClassifier(random_state=42, **config)
-    model.fit(X_train_scaled, y_train)
-    score = accuracy_score(y_test, model.predict(X_test_scaled))
-    print(f"     Config {i}: {score:.2%}")
-    
-    if score > best_score:
-        best_score = score
-        best_model = model
-        best_name = f"GradientBoosting-{i}"
-
+    candidates[f"GradientBoosting-{i}"] = GradientBoostingClassifier(random_state=42, **config)
+
+search = run_search(candidates, X_train_scaled, y_train, X_test_scaled, y_test,
+                    scoring='accuracy', cv=None, workers=args.workers,
+                    results_path='models/search/engagement_classifier.jsonl')
+
+for family, label in [("RandomForest", "Random Forest"), ("GradientBoosting", "Gradient Boosting")]:
+    print(f"\n   {label}:")
+    for name, row in search[search.index.str.startswith(f"{family}-")].iterrows():
+        score = row['holdout_score']
+        print(f"     Config {name.rsplit('-', 1)[1]}: {score:.2%}")
+        
+        if score > best_score:
+            best_score = score
+            best_name = name
+
+best_model = fit_candidate(candidates[best_name], X_train_scaled, y_train)
 model = best_model
 print(f"\n   ✓ Best model: {best_name} with {best_score:.2%} accuracy")
 
@@ -175,8 +176,10 @@ for class_name in label_encoder.classes_:
     print(f"     {class_name:15s}: Precision={metrics['precision']:.2%}, Recall={metrics['recall']:.2%}, F1={metrics['f1-score']:.2%}")
 
 # Cross-validation
-cv_scores = cross_val_score(model, X_train_scaled, y_train, cv=5, scoring='f1_macro')
-print(f"\n   CV F1 (macro):    {cv_scores.mean():.2%} (+/- {cv_scores.std():.2%})")
+cv = run_search({best_name: candidates[best_name]}, X_train_scaled, y_train,
+                scoring='f1_macro', cv=5, workers=args.workers,
+                results_path='models/search/engagement_classifier_cv.jsonl').loc[best_name]
+print(f"\n   CV F1 (macro):    {cv['cv_mean']:.2%} (+/- {cv['cv_std']:.2%})")
 
 # Feature importance
 print("\n5️⃣ Top 5 features:")
@@ -11,8 +11,13 @@ from sklearn.model_selection import cross_val_score, GridSearchCV
 from sklearn.metrics import classification_report, accuracy_score, f1_score, roc_auc_score, confusion_matrix
 import pickle
 import logging
+import os
+import sys
 from pathlib import Path
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from data.dataset_io import read_dataset
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -200,12 +205,12 @@ def main():
     # Load processed data
     data_dir = Path("./data/processed")
     
-    X_train = pd.read_csv(data_dir / "X_train.csv")
-    X_val = pd.read_csv(data_dir / "X_val.csv")
-    X_test = pd.read_csv(data_dir / "X_test.csv")
-    y_dropout_train = pd.read_csv(data_dir / "y_dropout_train.csv").values.ravel()
-    y_dropout_val = pd.read_csv(data_dir / "y_dropout_val.csv").values.ravel()
-    y_dropout_test = pd.read_csv(data_dir / "y_dropout_test.csv").values.ravel()
+    X_train = read_dataset(str(data_dir / "X_train.csv"))
+    X_val = read_dataset(str(data_dir / "X_val.csv"))
+    X_test = read_dataset(str(data_dir / "X_test.csv"))
+    y_dropout_train = read_dataset(str(data_dir / "y_dropout_train.csv")).values.ravel()
+    y_dropout_val = read_dataset(str(data_dir / "y_dropout_val.csv")).values.ravel()
+    y_dropout_test = read_dataset(str(data_dir / "y_dropout_test.csv")).values.ravel()
     
     # Use dropout as streak predictor for now (same binary classification)
     y_streak_train = y_dropout_train.copy()
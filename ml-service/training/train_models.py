@@ -8,6 +8,7 @@ import pandas as pd
 import numpy as np
 import joblib
 import os
+import sys
 import logging
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.linear_model import LogisticRegression
@@ -16,10 +17,14 @@ from sklearn.metrics import (
     accuracy_score, precision_score, recall_score, f1_score,
     classification_report, confusion_matrix, roc_auc_score, roc_curve
 )
-from sklearn.model_selection import cross_val_score, GridSearchCV
+from sklearn.model_selection import cross_val_score, ParameterGrid
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from data.dataset_io import read_dataset
+from training.parallel_search import fit_candidate, run_search, workers_arg_parser
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -27,8 +32,11 @@ logger = logging.getLogger(__name__)
 class ModelTrainer:
     """Train and evaluate ML models."""
     
-    def __init__(self, data_dir: str = "./data/processed"):
+    def __init__(self, data_dir: str = "./data/processed", workers: int = None,
+                 search_dir: str = "./models/search"):
         self.data_dir = data_dir
+        self.workers = workers  # Search processes; None = one per CPU
+        self.search_dir = search_dir  # Finished search fits, so an interrupted run resumes
         self.models = {}
         self.results = {}
         
@@ -36,17 +44,17 @@ class ModelTrainer:
         """Load pre-processed training data."""
         logger.info("📂 Loading processed data...")
         
-        self.X_train = pd.read_csv(f"{self.data_dir}/X_train.csv")
-        self.X_val = pd.read_csv(f"{self.data_dir}/X_val.csv")
-        self.X_test = pd.read_csv(f"{self.data_dir}/X_test.csv")
+        self.X_train = read_dataset(f"{self.data_dir}/X_train.csv")
+        self.X_val = read_dataset(f"{self.data_dir}/X_val.csv")
+        self.X_test = read_dataset(f"{self.data_dir}/X_test.csv")
         
-        self.y_dropout_train = pd.read_csv(f"{self.data_dir}/y_dropout_train.csv").values.ravel()
-        self.y_dropout_val = pd.read_csv(f"{self.data_dir}/y_dropout_val.csv").values.ravel()
-        self.y_dropout_test = pd.read_csv(f"{self.data_dir}/y_dropout_test.csv").values.ravel()
+        self.y_dropout_train = read_dataset(f"{self.data_dir}/y_dropout_train.csv").values.ravel()
+        self.y_dropout_val = read_dataset(f"{self.data_dir}/y_dropout_val.csv").values.ravel()
+        self.y_dropout_test = read_dataset(f"{self.data_dir}/y_dropout_test.csv").values.ravel()
         
-        self.y_engagement_train = pd.read_csv(f"{self.data_dir}/y_engagement_train.csv").values.ravel()
-        self.y_engagement_val = pd.read_csv(f"{self.data_dir}/y_engagement_val.csv").values.ravel()
-        self.y_engagement_test = pd.read_csv(f"{self.data_dir}/y_engagement_test.csv").values.ravel()
+        self.y_engagement_train = read_dataset(f"{self.data_dir}/y_engagement_train.csv").values.ravel()
+        self.y_engagement_val = read_dataset(f"{self.data_dir}/y_engagement_val.csv").values.ravel()
+        self.y_engagement_test = read_dataset(f"{self.data_dir}/y_engagement_test.csv").values.ravel()
         
         self.scaler = joblib.load(f"{self.data_dir}/scaler.pkl")
         
@@ -89,26 +97,24 @@ class ModelTrainer:
         best_score = 0
         best_name = ""
         
-        for name, model in models.items():
-            logger.info(f"\n📊 Training {name}...")
-            
-            # Cross-validation on training data
-            cv_scores = cross_val_score(model, self.X_train, self.y_dropout_train, cv=5, scoring='f1')
-            logger.info(f"  Cross-validation F1: {cv_scores.mean():.4f} (+/- {cv_scores.std():.4f})")
-            
-            # Train on full training set
-            model.fit(self.X_train, self.y_dropout_train)
-            
-            # Evaluate on validation set
-            val_pred = model.predict(self.X_val)
-            val_f1 = f1_score(self.y_dropout_val, val_pred)
-            logger.info(f"  Validation F1: {val_f1:.4f}")
+        # 5-fold CV on training data + a full fit scored on validation, all models in parallel
+        search = run_search(
+            models, self.X_train, self.y_dropout_train, self.X_val, self.y_dropout_val,
+            scoring='f1', cv=5, workers=self.workers,
+            results_path=f"{self.search_dir}/dropout_models.jsonl"
+        )
+        for name, row in search.iterrows():
+            logger.info(f"\n📊 {name}:")
+            logger.info(f"  Cross-validation F1: {row['cv_mean']:.4f} (+/- {row['cv_std']:.4f})")
+            logger.info(f"  Validation F1: {row['holdout_score']:.4f}")
             
-            if val_f1 > best_score:
-                best_score = val_f1
-                best_model = model
+            if row['holdout_score'] > best_score:
+                best_score = row['holdout_score']
                 best_name = name
         
+        # Train on full training set
+        best_model = fit_candidate(models[best_name], self.X_train, self.y_dropout_train)
+        
         logger.info(f"\n✅ Best model: {best_name} (F1: {best_score:.4f})")
         
         # Hyperparameter tuning for best model
@@ -122,20 +128,22 @@ class ModelTrainer:
                 'max_features': ['sqrt', 'log2']  # Limit features
             }
             
-            grid_search = GridSearchCV(
-                RandomForestClassifier(random_state=42, class_weight='balanced'),
-                param_grid,
+            grid = {
+                repr(params): RandomForestClassifier(random_state=42, class_weight='balanced', **params)
+                for params in ParameterGrid(param_grid)
+            }
+            grid_search = run_search(
+                grid, self.X_train, self.y_dropout_train,
                 cv=3,
                 scoring='recall',  # OPTIMIZE FOR RECALL!
-                n_jobs=-1,
-                verbose=1
+                workers=self.workers,
+                results_path=f"{self.search_dir}/dropout_rf_grid.jsonl"
             )
+            best_params = grid_search['cv_mean'].idxmax()
+            best_model = fit_candidate(grid[best_params], self.X_train, self.y_dropout_train)
             
-            grid_search.fit(self.X_train, self.y_dropout_train)
-            best_model = grid_search.best_estimator_
-            
-            logger.info(f"  Best parameters: {grid_search.best_params_}")
-            logger.info(f"  Best CV F1: {grid_search.best_score_:.4f}")
+            logger.info(f"  Best parameters: {best_params}")
+            logger.info(f"  Best CV recall: {grid_search.loc[best_params, 'cv_mean']:.4f}")
         
         # Final evaluation on test set
         logger.info("\n📈 Final Evaluation on Test Set:")
@@ -374,14 +382,14 @@ class ModelTrainer:
         logger.info("\n" + "="*60)
 
 
-def run_training_pipeline():
-    """Run complete training pipeline."""
+def run_training_pipeline(workers: int = None):
+    """Run complete training pipeline; workers = search processes (None = one per CPU)."""
     logger.info("="*60)
     logger.info("🚀 STARTING ML TRAINING PIPELINE")
     logger.info("="*60)
     
     # Initialize trainer
-    trainer = ModelTrainer()
+    trainer = ModelTrainer(workers=workers)
     
     # Load data
     trainer.load_processed_data()
@@ -405,4 +413,6 @@ def run_training_pipeline():
 
 
 if __name__ == "__main__":
-    run_training_pipeline()
+    args = workers_arg_parser("Train the dropout, streak and engagement models").parse_args()
+
+    run_training_pipeline(workers=args.workers)
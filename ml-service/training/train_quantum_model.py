@@ -1,8 +1,19 @@
 """
 Train Quantum Neural Network for Dropout Prediction
 Uses real training data to optimize quantum circuit weights
+
+Two backends train the same circuit and write the same artifacts:
+
+- numpy (default): app/quantum/statevector_training.py simulates the
+  16-amplitude statevector in batched NumPy and gets exact gradients from a
+  vectorized parameter shift (all 2 x 36 shifted circuits in one tensor op);
+  no PennyLane in the loop
+- pennylane: every mini-batch is one broadcast circuit execution (the RY
+  encoding angles carry a batch dimension) on default.qubit with backprop
+  differentiation, instead of one QNode call per sample
 """
 
+import argparse
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -11,12 +22,20 @@ import numpy as np
 import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, roc_auc_score, f1_score
-import pennylane as qml
-from pennylane import numpy as pnp
 import joblib
 import json
 from datetime import datetime
 
+from data.dataset_io import read_dataset
+
+parser = argparse.ArgumentParser(description="Train the quantum dropout classifier")
+parser.add_argument('--backend', choices=['numpy', 'pennylane'], default='numpy',
+                    help='Statevector simulation in NumPy, or PennyLane default.qubit')
+parser.add_argument('--batch-size', type=int, default=256, help='Samples per broadcast training step')
+parser.add_argument('--iterations', type=int, default=100, help='Adam steps')
+parser.add_argument('--eval-batch-size', type=int, default=4096, help='Samples per broadcast evaluation call')
+args = parser.parse_args()
+
 print("="*80)
 print("🔮 QUANTUM NEURAL NETWORK TRAINING")
 print("="*80)
@@ -24,10 +43,10 @@ print("="*80)
 # Load processed training data
 print("\n📊 Loading training data...")
 try:
-    X_train = pd.read_csv('./data/processed/X_train.csv')
-    y_train = pd.read_csv('./data/processed/y_dropout_train.csv')
-    X_test = pd.read_csv('./data/processed/X_test.csv')
-    y_test = pd.read_csv('./data/processed/y_dropout_test.csv')
+    X_train = read_dataset('./data/processed/X_train.csv')
+    y_train = read_dataset('./data/processed/y_dropout_train.csv')
+    X_test = read_dataset('./data/processed/X_test.csv')
+    y_test = read_dataset('./data/processed/y_dropout_test.csv')
     
     # Convert to numpy
     X_train = X_train.values
@@ -38,7 +57,8 @@ try:
     print(f"✓ Loaded {len(X_train)} training samples, {len(X_test)} test samples")
     print(f"  Features: {X_train.shape[1]}")
     print(f"  Dropout rate: {y_train.mean():.1%}")
-except Exception as e:
+except FileNotFoundError as e:
+    # Only a missing pipeline run falls back; unreadable splits should fail loudly
     print(f"⚠️  Could not load processed data: {e}")
     print("  Generating synthetic data for demonstration...")
     from data.realistic_data_generator import RealisticHealthDataGenerator
@@ -64,84 +84,109 @@ print(f"  Qubits: {n_qubits}")
 print(f"  Layers: {n_layers}")
 print(f"  Parameters: {n_qubits * n_layers * 3}")
 
-# Create quantum device
-dev = qml.device('default.qubit', wires=n_qubits)
+if args.backend == 'pennylane':
+    import pennylane as qml
+    from pennylane import numpy as pnp
 
-# Define quantum circuit
-def quantum_circuit(features, weights):
-    """Variational Quantum Classifier"""
-    # Feature encoding (amplitude encoding)
-    for i, feature in enumerate(features[:n_qubits]):
-        qml.RY(feature * np.pi, wires=i)
+    # Create quantum device (default.qubit supports parameter broadcasting and backprop)
+    dev = qml.device('default.qubit', wires=n_qubits)
+
+    # Define quantum circuit
+    def quantum_circuit(features, weights):
+        """Variational Quantum Classifier; features is one sample or a [batch, n_features] matrix"""
+        # Feature encoding (angle encoding); a column of angles broadcasts over the batch
+        for i, feature in enumerate(features.T[:n_qubits]):
+            qml.RY(feature * np.pi, wires=i)
     
-    # Variational layers
-    for layer_weights in weights:
-        # Rotations
-        for i in range(n_qubits):
-            qml.RX(layer_weights[i, 0], wires=i)
-            qml.RY(layer_weights[i, 1], wires=i)
-            qml.RZ(layer_weights[i, 2], wires=i)
+        # Variational layers
+        for layer_weights in weights:
+            # Rotations
+            for i in range(n_qubits):
+                qml.RX(layer_weights[i, 0], wires=i)
+                qml.RY(layer_weights[i, 1], wires=i)
+                qml.RZ(layer_weights[i, 2], wires=i)
         
-        # Entanglement (ring topology)
-        for i in range(n_qubits):
-            qml.CNOT(wires=[i, (i + 1) % n_qubits])
+            # Entanglement (ring topology)
+            for i in range(n_qubits):
+                qml.CNOT(wires=[i, (i + 1) % n_qubits])
     
-    return qml.expval(qml.PauliZ(0))
-
-@qml.qnode(dev)
-def quantum_prediction(features, weights):
-    """QNode for prediction"""
-    return quantum_circuit(features, weights)
-
-def predict_quantum(X, weights):
-    """Batch prediction"""
-    predictions = []
-    for x in X:
-        # Get expectation value (-1 to 1)
-        expectation = quantum_prediction(x, weights)
-        # Convert to probability (0 to 1)
-        prob = (expectation + 1) / 2
-        predictions.append(prob)
-    return pnp.array(predictions)
+        return qml.expval(qml.PauliZ(0))
+
+    @qml.qnode(dev, diff_method='backprop')
+    def quantum_prediction(features, weights):
+        """QNode for prediction, broadcast over the rows of features"""
+        return quantum_circuit(features, weights)
+
+    def predict_quantum(X, weights):
+        """Probabilities for a mini-batch in one broadcast execution (differentiable)"""
+        # Expectation values (-1 to 1) -> probabilities (0 to 1)
+        return (quantum_prediction(X, weights) + 1) / 2
+
+    def predict_quantum_chunked(X, weights, chunk_size=args.eval_batch_size):
+        """Probabilities for a whole split, one broadcast execution per chunk (evaluation only)"""
+        weights = pnp.array(weights, requires_grad=False)
+        return np.concatenate([
+            np.asarray(predict_quantum(X[start:start + chunk_size], weights), dtype=float).reshape(-1)
+            for start in range(0, len(X), chunk_size)
+        ])
+
+    def binary_cross_entropy(labels, predictions):
+        """Loss function for binary classification"""
+        # Use PennyLane numpy for autograd compatibility
+        predictions = pnp.clip(predictions, 1e-10, 1 - 1e-10)
+        return -pnp.mean(labels * pnp.log(predictions) + (1 - labels) * pnp.log(1 - predictions))
+
+    def cost_function(weights, X, y):
+        """Cost function for optimization"""
+        predictions = predict_quantum(X, weights)
+        return binary_cross_entropy(y, predictions)
+
+    def train_step(weights, X_batch, y_batch):
+        """One Adam step; returns (new weights, cost before the step)"""
+        return opt.step_and_cost(lambda w: cost_function(w, X_batch, y_batch), weights)
+
+    opt = qml.AdamOptimizer(stepsize=0.01)
+
+    def random_weights():
+        return pnp.random.randn(n_layers, n_qubits, 3, requires_grad=True)
+else:
+    from app.quantum.statevector_training import AdamOptimizer, predict_proba
+
+    def predict_quantum_chunked(X, weights, chunk_size=args.eval_batch_size):
+        """Probabilities for a whole split, one einsum per chunk"""
+        return np.concatenate([
+            predict_proba(weights, X[start:start + chunk_size]) for start in range(0, len(X), chunk_size)
+        ])
+
+    def train_step(weights, X_batch, y_batch):
+        """One Adam step with parameter-shift gradients; returns (new weights, cost before the step)"""
+        return opt.step_and_cost(X_batch, y_batch, weights)
+
+    opt = AdamOptimizer(stepsize=0.01)
+
+    def random_weights():
+        return np.random.randn(n_layers, n_qubits, 3)
 
 def accuracy(labels, predictions):
     """Calculate accuracy"""
     return np.mean((predictions > 0.5) == labels)
 
-def binary_cross_entropy(labels, predictions):
-    """Loss function for binary classification"""
-    # Use PennyLane numpy for autograd compatibility
-    predictions = pnp.clip(predictions, 1e-10, 1 - 1e-10)
-    return -pnp.mean(labels * pnp.log(predictions) + (1 - labels) * pnp.log(1 - predictions))
-
-def cost_function(weights, X, y):
-    """Cost function for optimization"""
-    predictions = predict_quantum(X, weights)
-    return binary_cross_entropy(y, predictions)
-
 # Initialize weights
 print("\n🎲 Initializing quantum weights...")
-initial_weights = pnp.random.randn(n_layers, n_qubits, 3, requires_grad=True)
+initial_weights = random_weights()
 
 # Training configuration
 print("\n🏋️  Training quantum neural network...")
+print(f"  Backend: {args.backend}")
 print(f"  Optimizer: Adam")
 print(f"  Learning rate: 0.01")
-print(f"  Batch size: 32")
-print(f"  Max iterations: 100")
-
-# Use smaller batch for training speed
-batch_size = 32
-n_iterations = 100
+print(f"  Batch size: {args.batch_size} (one broadcast execution per step)")
+print(f"  Max iterations: {args.iterations}")
+print(f"  Training samples: {len(X_train_norm)} (full training split)")
 
-# Take a subset for faster training
-train_subset_size = min(500, len(X_train_norm))
-indices = np.random.choice(len(X_train_norm), train_subset_size, replace=False)
-X_train_subset = X_train_norm[indices]
-y_train_subset = y_train[indices]
+batch_size = min(args.batch_size, len(X_train_norm))
+n_iterations = args.iterations
 
-# Optimizer
-opt = qml.AdamOptimizer(stepsize=0.01)
 weights = initial_weights
 
 # Training loop
@@ -158,23 +203,20 @@ start_time = time.time()
 
 for iteration in range(n_iterations):
     # Mini-batch training
-    batch_indices = np.random.choice(len(X_train_subset), batch_size, replace=False)
-    X_batch = X_train_subset[batch_indices]
-    y_batch = y_train_subset[batch_indices]
+    batch_indices = np.random.choice(len(X_train_norm), batch_size, replace=False)
+    X_batch = X_train_norm[batch_indices]
+    y_batch = y_train[batch_indices]
     
     # Update weights
-    weights, loss = opt.step_and_cost(
-        lambda w: cost_function(w, X_batch, y_batch),
-        weights
-    )
+    weights, loss = train_step(weights, X_batch, y_batch)
     
     # Evaluate every 10 iterations
     if (iteration + 1) % 10 == 0:
-        train_preds = predict_quantum(X_train_subset[:100], weights)
-        train_acc = accuracy(y_train_subset[:100], train_preds)
+        train_preds = predict_quantum_chunked(X_train_norm, weights)
+        train_acc = accuracy(y_train, train_preds)
         
-        test_preds = predict_quantum(X_test_norm[:100], weights)
-        test_acc = accuracy(y_test[:100], test_preds)
+        test_preds = predict_quantum_chunked(X_test_norm, weights)
+        test_acc = accuracy(y_test, test_preds)
         
         elapsed = time.time() - start_time
         
@@ -198,11 +240,10 @@ print("\n✓ Training complete!")
 print("\n📊 Final Evaluation:")
 print("-" * 55)
 
-test_sample_size = min(200, len(X_test_norm))
-test_sample_indices = np.random.choice(len(X_test_norm), test_sample_size, replace=False)
+test_sample_size = len(X_test_norm)
 
-test_preds = predict_quantum(X_test_norm[test_sample_indices], best_weights)
-test_labels = y_test[test_sample_indices]
+test_preds = predict_quantum_chunked(X_test_norm, best_weights)
+test_labels = y_test
 
 final_acc = accuracy(test_labels, test_preds)
 final_auc = roc_auc_score(test_labels, test_preds)
@@ -248,11 +289,12 @@ with open(history_path, 'w') as f:
             'n_qubits': n_qubits,
             'n_layers': n_layers,
             'n_parameters': n_qubits * n_layers * 3,
+            'backend': args.backend,
             'optimizer': 'Adam',
             'learning_rate': 0.01,
             'batch_size': batch_size,
             'iterations': n_iterations,
-            'train_samples': len(X_train_subset),
+            'train_samples': len(X_train_norm),
             'test_samples': test_sample_size
         },
         'timestamp': datetime.now().isoformat()
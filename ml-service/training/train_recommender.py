@@ -11,6 +11,13 @@ from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_sc
 from sklearn.preprocessing import LabelEncoder
 from sklearn.ensemble import GradientBoostingClassifier
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from data.dataset_io import read_dataset
+from training.recommender_pairs import (
+    CHALLENGE_COLUMNS, CHALLENGE_TYPES, FEATURE_COLUMNS, build_recommender_pairs,
+)
 
 print("="*70)
 print("🎯 TRAINING CHALLENGE RECOMMENDER MODEL")
@@ -18,8 +25,8 @@ print("="*70)
 
 # Load data
 print("\n1️⃣ Loading user and challenge data...")
-features_df = pd.read_csv('data/features.csv')
-challenges_df = pd.read_csv('data/challenges.csv')
+features_df = read_dataset('data/features.csv', columns=FEATURE_COLUMNS)
+challenges_df = read_dataset('data/challenges.csv', columns=CHALLENGE_COLUMNS)
 
 print(f"   Users: {len(features_df)}")
 print(f"   Challenge records: {len(challenges_df)}")
@@ -27,67 +34,9 @@ print(f"   Challenge records: {len(challenges_df)}")
 # Create user-challenge interaction dataset
 print("\n2️⃣ Creating user-challenge interaction matrix...")
 
-# Define challenge types with difficulties
-challenge_types = [
-    {"id": "C001", "name": "Morning Meditation", "category": "meditation", "difficulty": 2},
-    {"id": "C002", "name": "10K Steps Challenge", "category": "exercise", "difficulty": 3},
-    {"id": "C003", "name": "Hydration Hero", "category": "water", "difficulty": 1},
-    {"id": "C004", "name": "Evening Yoga", "category": "exercise", "difficulty": 2},
-    {"id": "C005", "name": "Mindful Eating", "category": "meals", "difficulty": 4},
-    {"id": "C006", "name": "Sleep Sanctuary", "category": "sleep", "difficulty": 3},
-    {"id": "C007", "name": "7-Day Streak", "category": "exercise", "difficulty": 5},
-    {"id": "C008", "name": "Breathwork", "category": "meditation", "difficulty": 1},
-]
-
-# Create training data from actual challenge completion
-training_data = []
-
-for _, user in features_df.iterrows():
-    user_id = user['user_id']
-    user_challenges = challenges_df[challenges_df['user_id'] == user_id]
-    
-    # For each challenge type, create a training sample
-    for challenge in challenge_types:
-        # Check if user attempted this challenge category
-        category_attempts = user_challenges[user_challenges['category'] == challenge['category']]
-        
-        if len(category_attempts) > 0:
-            # User attempted this category
-            completion_rate = category_attempts['completed'].mean()
-            completed = 1 if completion_rate > 0.5 else 0  # Label
-        else:
-            # User didn't attempt - predict based on features
-            # Create synthetic label based on user profile
-            completion_rate = 0
-            
-            # Predict if user would like this challenge
-            if challenge['difficulty'] <= 2:
-                # Easy challenges - base on engagement
-                completed = 1 if user.get('challenge_completion_rate', 0) > 0.3 else 0
-            elif challenge['difficulty'] <= 3:
-                # Medium challenges
-                completed = 1 if user.get('challenge_completion_rate', 0) > 0.5 else 0
-            else:
-                # Hard challenges - only for high performers
-                completed = 1 if user.get('challenge_completion_rate', 0) > 0.7 else 0
-        
-        # Create feature vector
-        training_data.append({
-            'user_id': user_id,
-            'challenge_id': challenge['id'],
-            'challenge_difficulty': challenge['difficulty'],
-            # User features
-            'days_active': user.get('days_active', 0),
-            'avg_steps': user.get('avg_steps_last_7_days', 0),
-            'meditation_streak': user.get('meditation_streak', 0) if 'meditation_streak' in user else user.get('avg_meditation_minutes', 0),
-            'avg_sleep': user.get('avg_sleep_hours', 7),
-            'challenge_completion_rate': user.get('challenge_completion_rate', 0),
-            'social_score': user.get('social_engagement_score', 0),
-            # Target
-            'will_complete': completed
-        })
-
-training_df = pd.DataFrame(training_data)
+# One row per (user, challenge): cross join of user features and the catalog,
+# labels from a single groupby over the challenge log
+training_df = build_recommender_pairs(features_df, challenges_df, CHALLENGE_TYPES)
 print(f"   Created {len(training_df)} user-challenge pairs")
 print(f"   Positive samples: {training_df['will_complete'].sum()} ({training_df['will_complete'].mean():.1%})")
 
@@ -238,7 +187,7 @@ print("   ✓ Saved models/saved/challenge_recommender.pkl")
 print("   ✓ Saved models/saved/recommender_features.txt")
 
 # Save challenge metadata
-challenge_meta_df = pd.DataFrame(challenge_types)
+challenge_meta_df = pd.DataFrame(CHALLENGE_TYPES)
 challenge_meta_df.to_csv('models/saved/challenge_metadata.csv', index=False)
 print("   ✓ Saved models/saved/challenge_metadata.csv")
 
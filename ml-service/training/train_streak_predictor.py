@@ -9,7 +9,20 @@ from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+import argparse
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from data.dataset_io import read_dataset
+from training.streak_labels import (
+    ACTIVITY_COLUMNS, FEATURE_COLUMNS, activity_stats, activity_stats_chunked, build_streak_training_data
+)
+
+# --chunksize N streams the activity log (grouped by user) instead of loading it whole
+parser = argparse.ArgumentParser(description="Train the streak predictor")
+parser.add_argument('--chunksize', type=int, default=None, help='Activity rows per chunk for out-of-core label building')
+args = parser.parse_args()
 
 print("="*70)
 print("🔥 TRAINING STREAK PREDICTOR MODEL")
@@ -17,54 +30,20 @@ print("="*70)
 
 # Load data
 print("\n1️⃣ Loading user activity data...")
-features_df = pd.read_csv('data/features.csv')
-activities_df = pd.read_csv('data/activities.csv')
+features_df = read_dataset('data/features.csv', columns=FEATURE_COLUMNS)
+if args.chunksize:
+    activity_summary = activity_stats_chunked('data/activities.csv', args.chunksize)
+else:
+    activity_summary = activity_stats(read_dataset('data/activities.csv', columns=ACTIVITY_COLUMNS))
 
 print(f"   Users: {len(features_df)}")
-print(f"   Activity records: {len(activities_df)}")
+print(f"   Activity records: {int(activity_summary['n_rows'].sum())}")
 
-# Create streak-breaking labels
+# Create streak-breaking labels: current/avg streak, completion rates and the
+# last-3-days break label from one grouped pass over the activity table
 print("\n2️⃣ Creating streak-breaking labels...")
 
-training_data = []
-
-for _, user in features_df.iterrows():
-    user_id = user['user_id']
-    user_activities = activities_df[activities_df['user_id'] == user_id].sort_values('date')
-    
-    if len(user_activities) < 7:
-        continue
-    
-    # Get streak information
-    current_streak = user_activities['current_streak'].max()
-    recent_completions = user_activities.tail(7)['completed_daily_goal'].values
-    
-    # Determine if streak will break (label)
-    # Look at last 3 days - if any failures, streak broke
-    last_3_days = user_activities.tail(3)['completed_daily_goal'].values
-    streak_will_break = 1 if 0 in last_3_days else 0
-    
-    # Features
-    completion_rate = user_activities['completed_daily_goal'].mean()
-    recent_completion_rate = recent_completions.mean()
-    avg_streak = user_activities['current_streak'].mean()
-    
-    training_data.append({
-        'user_id': user_id,
-        'current_streak': current_streak,
-        'avg_streak': avg_streak,
-        'completion_rate': completion_rate,
-        'recent_completion_rate': recent_completion_rate,
-        'days_active': user.get('days_active', 0),
-        'avg_steps': user.get('avg_steps_last_7_days', 0),
-        'meditation_minutes': user.get('avg_meditation_minutes', 0) if 'avg_meditation_minutes' in user else user.get('meditation_streak', 0),
-        'social_score': user.get('social_engagement_score', 0),
-        'challenge_completion': user.get('challenge_completion_rate', 0),
-        # Target
-        'streak_will_break': streak_will_break
-    })
-
-training_df = pd.DataFrame(training_data)
+training_df = build_streak_training_data(features_df, activity_summary)
 print(f"   Created {len(training_df)} training samples")
 print(f"   Streak breaks: {training_df['streak_will_break'].sum()} ({training_df['streak_will_break'].mean():.1%})")
 
@@ -4,15 +4,17 @@ Comprehensive Verification of Noisy Data Usage
 import pandas as pd
 import numpy as np
 
+from data.dataset_io import read_dataset
+
 print("="*70)
 print("🔍 COMPREHENSIVE NOISY DATA VERIFICATION")
 print("="*70)
 
 # 1. Load all three versions
 print("\n1️⃣ Loading all three feature files...")
-features_current = pd.read_csv('data/features.csv')
-features_perfect = pd.read_csv('data/features_perfect.csv')
-features_noisy = pd.read_csv('data/features_noisy.csv')
+features_current = read_dataset('data/features.csv')
+features_perfect = read_dataset('data/features_perfect.csv')
+features_noisy = read_dataset('data/features_noisy.csv')
 
 print(f"   Current features.csv:  {features_current.shape}")
 print(f"   Perfect features:      {features_perfect.shape}")
@@ -53,8 +55,8 @@ for feat in temporal_features:
 # 5. Check the processed training data
 print("\n5️⃣ Checking processed training data...")
 try:
-    X_train = pd.read_csv('data/processed/X_train.csv')
-    y_train_dropout = pd.read_csv('data/processed/y_dropout_train.csv')
+    X_train = read_dataset('data/processed/X_train.csv')
+    y_train_dropout = read_dataset('data/processed/y_dropout_train.csv')
     print(f"   Processed training data: {X_train.shape}")
     print(f"   Dropout labels: {y_train_dropout.shape}")
     print(f"   Dropout rate in training: {y_train_dropout.iloc[:, 0].mean():.2%}")